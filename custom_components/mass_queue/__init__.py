@@ -38,12 +38,18 @@ from .actions import (
     setup_controller_and_actions,
 )
 from .const import CONF_TOKEN, DOMAIN, LOGGER
+from .controller import get_queue_store
+from .image_cache import async_get_image_cache
+from .router import get_entity_router
 from .services import register_actions
+from .views import MassQueueImageView
 from .websocket_commands import (
     api_download_and_encode_image,
     api_download_images,
+    api_get_cache_info,
     api_get_entity_info,
     api_get_user_info,
+    api_subscribe_queue,
 )
 
 if TYPE_CHECKING:
@@ -54,6 +60,8 @@ PLATFORMS = []
 
 CONNECT_TIMEOUT = 10
 LISTEN_READY_TIMEOUT = 30
+RECONNECT_MIN_DELAY = 1
+RECONNECT_MAX_DELAY = 60
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
@@ -71,6 +79,7 @@ class MusicAssistantQueueEntryData:
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa: ARG001
     """Set up the Music Assistant component."""
+    hass.http.register_view(MassQueueImageView())
     return True
 
 
@@ -121,7 +130,12 @@ async def async_setup_entry(  # noqa: PLR0915
 
     async def on_hass_stop(event: Event) -> None:  # noqa: ARG001
         """Handle incoming stop event from Home Assistant."""
-        await mass.disconnect()
+        if (entry_data := getattr(entry, "runtime_data", None)) is None:
+            await mass.disconnect()
+            return
+        await entry_data.actions.async_save_cache()
+        # The client is replaced when reconnecting
+        await entry_data.mass.disconnect()
 
     entry.async_on_unload(
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, on_hass_stop),
@@ -140,14 +154,19 @@ async def async_setup_entry(  # noqa: PLR0915
         exc = "Music Assistant client not ready"
         raise ConfigEntryNotReady(exc) from err
 
+    # load the index of cached images before the queues are fetched
+    await async_get_image_cache(hass)
+
     # store the listen task and mass client in the entry data
     actions = await setup_controller_and_actions(hass, mass, entry)
     register_actions(hass)
     entry.runtime_data = MusicAssistantQueueEntryData(mass, actions, listen_task)
     websocket_api.async_register_command(hass, api_download_images)
     websocket_api.async_register_command(hass, api_download_and_encode_image)
+    websocket_api.async_register_command(hass, api_get_cache_info)
     websocket_api.async_register_command(hass, api_get_entity_info)
     websocket_api.async_register_command(hass, api_get_user_info)
+    websocket_api.async_register_command(hass, api_subscribe_queue)
 
     # If the listen task is already failed, we need to raise ConfigEntryNotReady
     if listen_task.done() and (listen_error := listen_task.exception()) is not None:
@@ -182,9 +201,65 @@ async def _client_listen(
             raise
         LOGGER.exception("Unexpected exception: %s", err)
 
-    if not hass.is_stopping:
+    if hass.is_stopping:
+        return
+    entry_data = getattr(entry, "runtime_data", None)
+    if entry.state != ConfigEntryState.LOADED or entry_data is None:
         LOGGER.debug("Disconnected from server. Reloading integration")
         hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
+    elif entry_data.mass is mass:
+        # Only the active client reconnects, failed reconnect attempts are retried
+        LOGGER.debug("Disconnected from server. Reconnecting")
+        entry.async_create_background_task(
+            hass,
+            _async_reconnect(hass, entry),
+            f"{DOMAIN}_reconnect_{entry.entry_id}",
+        )
+
+
+async def _async_reconnect(hass: HomeAssistant, entry: MusicAssistantConfigEntry):
+    """Reconnect with a new client, backing off between attempts."""
+    http_session = async_get_clientsession(hass, verify_ssl=False)
+    mass_url = entry.data[CONF_URL]
+    delay = RECONNECT_MIN_DELAY
+    while not hass.is_stopping and entry.state == ConfigEntryState.LOADED:
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, RECONNECT_MAX_DELAY)
+        token = entry.data.get(CONF_TOKEN)
+        mass = MusicAssistantClient(mass_url, http_session, token=token)
+        try:
+            async with asyncio.timeout(CONNECT_TIMEOUT):
+                await mass.connect()
+        except (AuthenticationRequired, AuthenticationFailed, InvalidToken) as err:
+            LOGGER.error("Authentication failed for %s: %s", mass_url, err)
+            entry.async_start_reauth(hass)
+            return
+        except (
+            TimeoutError,
+            CannotConnect,
+            MusicAssistantClientException,
+            MusicAssistantError,
+        ) as err:
+            LOGGER.debug("Unable to reconnect, retrying in %ss: %s", delay, err)
+            continue
+        init_ready = asyncio.Event()
+        listen_task = asyncio.create_task(_client_listen(hass, entry, mass, init_ready))
+        try:
+            async with asyncio.timeout(LISTEN_READY_TIMEOUT):
+                await init_ready.wait()
+        except TimeoutError:
+            LOGGER.debug("Music Assistant client not ready, retrying in %ss", delay)
+            listen_task.cancel()
+            await mass.disconnect()
+            continue
+        if listen_task.done() or entry.state != ConfigEntryState.LOADED:
+            await mass.disconnect()
+            continue
+        entry.runtime_data.mass = mass
+        entry.runtime_data.listen_task = listen_task
+        entry.runtime_data.actions.reconnect(mass)
+        LOGGER.info("Reconnected to Music Assistant server %s", mass_url)
+        return
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -193,12 +268,20 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     if unload_ok:
         mass_entry_data: MusicAssistantQueueEntryData = entry.runtime_data
+        mass_entry_data.actions.unload_controller()
+        get_entity_router(hass).remove_actions(mass_entry_data.actions)
+        await mass_entry_data.actions.async_save_cache()
         mass_entry_data.listen_task.cancel()
         await mass_entry_data.mass.disconnect()
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored queue caches of a config entry."""
+    await get_queue_store(hass, entry.entry_id).async_remove()
+
+
 async def async_remove_config_entry_device(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
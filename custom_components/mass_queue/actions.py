@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
 from homeassistant.config_entries import ConfigEntry, ConfigEntryState
@@ -35,6 +36,7 @@ from .const import (
     ATTR_MEDIA_IMAGE,
     ATTR_MEDIA_TITLE,
     ATTR_OFFSET,
+    ATTR_OPERATIONS,
     ATTR_PLAYER_ENTITY,
     ATTR_POSITION,
     ATTR_PROVIDERS,
@@ -59,6 +61,7 @@ from .const import (
     SERVICE_SET_GROUP_VOLUME,
 )
 from .controller import MassQueueController
+from .router import get_entity_route
 from .schemas import (
     GET_GROUP_VOLUME_SERVICE_SCHEMA,
     GET_RECOMMENDATIONS_SERVICE_SCHEMA,
@@ -66,7 +69,6 @@ from .schemas import (
     MOVE_QUEUE_ITEM_NEXT_SERVICE_SCHEMA,
     MOVE_QUEUE_ITEM_UP_SERVICE_SCHEMA,
     PLAY_QUEUE_ITEM_SERVICE_SCHEMA,
-    QUEUE_ITEM_SCHEMA,
     QUEUE_ITEMS_SERVICE_SCHEMA,
     REMOVE_QUEUE_ITEM_SERVICE_SCHEMA,
     SEND_COMMAND_SERVICE_SCHEMA,
@@ -74,8 +76,11 @@ from .schemas import (
     TRACK_ITEM_SCHEMA,
 )
 from .utils import (
+    fetch_paged_items,
     find_image,
     parse_uri,
+    supports_paging,
+    validate_response,
 )
 
 if TYPE_CHECKING:
@@ -100,12 +105,34 @@ class MassQueueActions:
         self._config_entry = config_entry
         self._download_local = config_entry.options.get(CONF_DOWNLOAD_LOCAL)
 
+    @property
+    def controller(self) -> MassQueueController:
+        """Returns the controller holding the queue caches."""
+        return self._controller
+
     def setup_controller(self):
         """Setup Music Assistant controller."""
         self._controller.update_players()
         self._controller.subscribe_events()
         self._hass.loop.create_task(self._controller.update_queues())
 
+    async def async_restore_cache(self):
+        """Restore the queue caches stored on the last unload."""
+        await self._controller.async_restore_snapshot()
+
+    async def async_save_cache(self):
+        """Store the queue caches for the next setup."""
+        await self._controller.async_save_snapshot()
+
+    def reconnect(self, mass_client: MusicAssistantClient):
+        """Switch to a new client, keeping the controller caches."""
+        self._client = mass_client
+        self._controller.reconnect(mass_client)
+
+    def unload_controller(self):
+        """Stop Music Assistant controller."""
+        self._controller.shutdown()
+
     @callback
     def register_actions(self) -> None:
         """Register actions with Home Assistant."""
@@ -183,52 +210,29 @@ class MassQueueActions:
 
     def get_queue_id(self, entity_id: str):
         """Get the queue ID for a player."""
-        return self._hass.states.get(entity_id).attributes[ATTR_QUEUE_ID]
+        return get_entity_route(self._hass, entity_id).queue_id
+
+    def get_player_queue_id(self, player_id: str, entity_id: str):
+        """Get the queue ID for a player from the players cache."""
+        if (queue_id := self._controller.players.get(player_id)) is not None:
+            return queue_id
+        # Players which are not playing anything have no queue in the cache
+        return self._hass.states.get(entity_id).attributes.get(ATTR_QUEUE_ID)
 
     async def get_queue_index(self, entity_id: str):
         """Get the current index of the queue."""
-        active_queue = await self.get_active_queue(entity_id)
-        try:
-            return active_queue.current_index or 0
-        except AttributeError:
-            return 0
+        queue_id = self.get_queue_id(entity_id)
+        return await self._controller.get_queue_index(queue_id)
+
+    def get_cache_info(self):
+        """Get the size of the integration caches."""
+        return self._controller.get_cache_info()
 
     async def get_active_queue(self, entity_id: str):
         """Get active queue details."""
         queue_id = self.get_queue_id(entity_id)
         return await self._client.player_queues.get_active_queue(queue_id)
 
-    async def _format_queue_item(self, queue_item: dict) -> dict:
-        """Format list of queue items for response."""
-        media = queue_item["media_item"]
-
-        queue_item_id = queue_item["queue_item_id"]
-        media_title = media["name"]
-        media_album = media.get("album")
-        media_album_name = "" if media_album is None else media_album.get("name", "")
-        media_content_id = media["uri"]
-        media_image = find_image(queue_item) or ""
-        local_image_encoded = queue_item.get(ATTR_LOCAL_IMAGE_ENCODED)
-        favorite = media["favorite"]
-
-        artists = media["artists"]
-        artist_names = [artist["name"] for artist in artists]
-        media_artist = ", ".join(artist_names)
-        response: ServiceResponse = QUEUE_ITEM_SCHEMA(
-            {
-                ATTR_QUEUE_ITEM_ID: queue_item_id,
-                ATTR_MEDIA_TITLE: media_title,
-                ATTR_MEDIA_ALBUM_NAME: media_album_name,
-                ATTR_MEDIA_ARTIST: media_artist,
-                ATTR_MEDIA_CONTENT_ID: media_content_id,
-                ATTR_MEDIA_IMAGE: media_image,
-                ATTR_FAVORITE: favorite,
-            },
-        )
-        if local_image_encoded:
-            response[ATTR_LOCAL_IMAGE_ENCODED] = local_image_encoded
-        return response
-
     async def send_command(self, call: ServiceCall) -> ServiceResponse:
         """Sends command to Music Assistant and returns response."""
         command = call.data[ATTR_COMMAND]
@@ -280,7 +284,7 @@ class MassQueueActions:
         offset = max(offset, 0)
         queue_items = await self._controller.player_queue(queue_id, limit, offset)
         response: ServiceResponse = {
-            entity_id: [await self._format_queue_item(item) for item in queue_items],
+            entity_id: self._controller.format_queue_items(queue_items),
         }
         return response
 
@@ -300,34 +304,36 @@ class MassQueueActions:
         entity_id = call.data[ATTR_PLAYER_ENTITY]
         queue_item_id = call.data[ATTR_QUEUE_ITEM_ID]
         queue_id = self.get_queue_id(entity_id)
-        await self._client.player_queues.queue_command_delete(queue_id, queue_item_id)
+        await self._controller.edit_queue_item(queue_id, "remove", queue_item_id)
+
+    async def batch_edit_queue(self, call: ServiceCall) -> ServiceResponse:
+        """Remove and move multiple items in queue."""
+        entity_id = call.data[ATTR_PLAYER_ENTITY]
+        operations = call.data[ATTR_OPERATIONS]
+        queue_id = self.get_queue_id(entity_id)
+        results = await self._controller.edit_queue(queue_id, operations)
+        return {"results": results}
 
     async def move_queue_item_up(self, call: ServiceCall) -> ServiceResponse:
         """Move selected item up in queue."""
         entity_id = call.data[ATTR_PLAYER_ENTITY]
         queue_item_id = call.data[ATTR_QUEUE_ITEM_ID]
         queue_id = self.get_queue_id(entity_id)
-        await self._client.player_queues.queue_command_move_up(queue_id, queue_item_id)
+        await self._controller.edit_queue_item(queue_id, "move_up", queue_item_id)
 
     async def move_queue_item_down(self, call: ServiceCall) -> ServiceResponse:
         """Move selected item down in queue."""
         entity_id = call.data[ATTR_PLAYER_ENTITY]
         queue_item_id = call.data[ATTR_QUEUE_ITEM_ID]
         queue_id = self.get_queue_id(entity_id)
-        await self._client.player_queues.queue_command_move_down(
-            queue_id,
-            queue_item_id,
-        )
+        await self._controller.edit_queue_item(queue_id, "move_down", queue_item_id)
 
     async def move_queue_item_next(self, call: ServiceCall) -> ServiceResponse:
         """Move selected item next in queue."""
         entity_id = call.data[ATTR_PLAYER_ENTITY]
         queue_item_id = call.data[ATTR_QUEUE_ITEM_ID]
         queue_id = self.get_queue_id(entity_id)
-        await self._client.player_queues.queue_command_move_next(
-            queue_id,
-            queue_item_id,
-        )
+        await self._controller.edit_queue_item(queue_id, "move_next", queue_item_id)
 
     async def unfavorite_item(self, call: ServiceCall) -> ServiceResponse:
         """Unfavorites currently playing item in queue."""
@@ -350,36 +356,71 @@ class MassQueueActions:
 
     async def get_artist_details(self, artist_uri):
         """Retrieves the details for an artist."""
+        return await self._controller.metadata.get(
+            artist_uri,
+            self._fetch_artist_details,
+        )
+
+    async def _fetch_artist_details(self, artist_uri):
+        """Fetches the details for an artist from the server."""
         provider, item_id = parse_uri(artist_uri)
         LOGGER.debug(f"Getting artist details for provider {provider}")
         return await self._client.music.get_artist(item_id, provider)
 
     async def get_album_details(self, album_uri):
         """Retrieves the details for an album."""
+        return await self._controller.metadata.get(
+            album_uri,
+            self._fetch_album_details,
+        )
+
+    async def _fetch_album_details(self, album_uri):
+        """Fetches the details for an album from the server."""
         provider, item_id = parse_uri(album_uri)
         LOGGER.debug(f"Getting album details for provider {provider}")
         return await self._client.music.get_album(item_id, provider)
 
     async def get_playlist_details(self, playlist_uri):
         """Retrieves the details for a playlist."""
+        return await self._controller.metadata.get(
+            playlist_uri,
+            self._fetch_playlist_details,
+        )
+
+    async def _fetch_playlist_details(self, playlist_uri):
+        """Fetches the details for a playlist from the server."""
         provider, item_id = parse_uri(playlist_uri)
         LOGGER.debug(f"Getting album details for provider {provider}")
         return await self._client.music.get_playlist(item_id, provider)
 
     async def get_podcast_details(self, podcast_uri):
         """Retrieves the details for a podcast."""
+        return await self._controller.metadata.get(
+            podcast_uri,
+            self._fetch_podcast_details,
+        )
+
+    async def _fetch_podcast_details(self, podcast_uri):
+        """Fetches the details for a podcast from the server."""
         provider, item_id = parse_uri(podcast_uri)
         LOGGER.debug(f"Getting podcast details for provider {provider}")
         return await self._client.music.get_podcast(item_id, provider)
 
-    async def get_artist_tracks(self, artist_uri: str, page: int | None = None):
+    async def get_artist_tracks(
+        self,
+        artist_uri: str,
+        page: int | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ):
         """Retrieves a limited number of tracks from an artist."""
-        details = await self.get_artist_details(artist_uri)
-        mappings = list(details.provider_mappings)
-        if not len(mappings) > 0:
+        mapping = await self._controller.metadata.get_provider_mapping(
+            artist_uri,
+            self._fetch_artist_details,
+        )
+        if mapping is None:
             msg = f"URI {artist_uri} returned no results!"
             raise ProviderUnavailableError(msg)
-        mapping = mappings[0]
         item_id = mapping.item_id
         provider = mapping.provider_domain
         resp = (
@@ -387,16 +428,24 @@ class MassQueueActions:
             if not page
             else await self._client.music.get_artist_tracks(item_id, provider, page)
         )
-        return [self.format_track_item(item.to_dict()) for item in resp]
+        end = None if limit is None else offset + limit
+        return [self.format_track_item(item.to_dict()) for item in resp[offset:end]]
 
-    async def get_album_tracks(self, album_uri: str, page: int | None = None):
+    async def get_album_tracks(
+        self,
+        album_uri: str,
+        page: int | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ):
         """Retrieves all tracks from an album."""
-        details = await self.get_album_details(album_uri)
-        mappings = list(details.provider_mappings)
-        if not len(mappings) > 0:
+        mapping = await self._controller.metadata.get_provider_mapping(
+            album_uri,
+            self._fetch_album_details,
+        )
+        if mapping is None:
             msg = f"URI {album_uri} returned no results!"
             raise ProviderUnavailableError(msg)
-        mapping = mappings[0]
         item_id = mapping.item_id
         provider = mapping.provider_domain
         resp = (
@@ -404,7 +453,8 @@ class MassQueueActions:
             if not page
             else await self._client.music.get_album_tracks(item_id, provider, page)
         )
-        return [self.format_track_item(item.to_dict()) for item in resp]
+        end = None if limit is None else offset + limit
+        return [self.format_track_item(item.to_dict()) for item in resp[offset:end]]
 
     async def get_podcast_episodes(self, podcast_uri):
         """Retrieves all episodes for a podcast."""
@@ -417,19 +467,47 @@ class MassQueueActions:
         formatted.sort(key=lambda x: x[ATTR_RELEASE_DATE], reverse=True)
         return formatted
 
-    async def get_playlist_tracks(self, playlist_uri: str, page: int | None = None):
+    async def get_playlist_tracks(
+        self,
+        playlist_uri: str,
+        page: int | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        all_pages: bool = False,
+    ):
         """Retrieves all playlist items."""
         provider, item_id = parse_uri(playlist_uri)
         LOGGER.debug(
             f"Getting playlist items for provider {provider}, item_id {item_id}",
         )
-        resp = (
-            await self._client.music.get_playlist_tracks(item_id, provider)
-            if not page
-            else await self._client.music.get_playlist_tracks(item_id, provider, page)
-        )
+        if all_pages and supports_paging(self._client.music.get_playlist_tracks):
+            resp = await fetch_paged_items(
+                partial(self._fetch_playlist_page, item_id, provider),
+                offset,
+                limit,
+            )
+        else:
+            # Clients without paging return the whole playlist in one call
+            resp = (
+                await self._client.music.get_playlist_tracks(item_id, provider)
+                if not page or all_pages
+                else await self._client.music.get_playlist_tracks(
+                    item_id,
+                    provider,
+                    page,
+                )
+            )
+            resp = resp[offset : None if limit is None else offset + limit]
         return [self.format_playlist_track(item.to_dict()) for item in resp]
 
+    async def _fetch_playlist_page(self, item_id: str, provider: str, page: int):
+        """Fetches a page of playlist items from the server."""
+        return await self._client.music.get_playlist_tracks(
+            item_id,
+            provider,
+            page=page,
+        )
+
     def format_playlist_track(self, playlist_track: dict) -> TRACK_ITEM_SCHEMA:
         """Processes individual playlist tracks using format_track_item and adds position."""
         result = self.format_track_item(playlist_track)
@@ -464,18 +542,16 @@ class MassQueueActions:
         local_image_encoded = media_item.get(ATTR_LOCAL_IMAGE_ENCODED)
         favorite = media_item["favorite"]
         duration = media_item["duration"] or 0
-        response: ServiceResponse = TRACK_ITEM_SCHEMA(
-            {
-                ATTR_MEDIA_TITLE: media_title,
-                ATTR_MEDIA_CONTENT_ID: media_content_id,
-                ATTR_DURATION: duration,
-                ATTR_MEDIA_IMAGE: media_image,
-                ATTR_FAVORITE: favorite,
-            },
-        )
+        response: ServiceResponse = {
+            ATTR_MEDIA_TITLE: media_title,
+            ATTR_MEDIA_CONTENT_ID: media_content_id,
+            ATTR_DURATION: duration,
+            ATTR_MEDIA_IMAGE: media_image,
+            ATTR_FAVORITE: favorite,
+        }
         if local_image_encoded:
             response[ATTR_LOCAL_IMAGE_ENCODED] = local_image_encoded
-        return response
+        return validate_response(TRACK_ITEM_SCHEMA, response)
 
     async def remove_playlist_tracks(
         self,
@@ -525,5 +601,6 @@ async def setup_controller_and_actions(
 ) -> MassQueueActions:
     """Initialize client and actions class, add actions to Home Assistant."""
     actions = MassQueueActions(hass, mass_client, entry)
+    await actions.async_restore_cache()
     actions.setup_controller()
     return actions
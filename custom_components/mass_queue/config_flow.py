@@ -17,6 +17,7 @@ from homeassistant.config_entries import (
 from homeassistant.const import CONF_URL
 from homeassistant.core import callback
 from homeassistant.helpers import aiohttp_client
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.config_entry_oauth2_flow import (
     _encode_jwt,
     async_get_redirect_uri,
@@ -33,11 +34,27 @@ from music_assistant_models.errors import AuthenticationFailed, InvalidToken
 
 from .const import (
     AUTH_SCHEMA_VERSION,
+    CONF_CACHE_SIZE_LIMIT,
     CONF_DOWNLOAD_LOCAL,
+    CONF_LOCAL_IMAGE_FORMAT,
+    CONF_LOCAL_IMAGE_SIZE,
+    CONF_PLAYER_EVENT_FIELDS,
+    CONF_PLAYER_EVENT_INTERVAL,
+    CONF_QUEUE_REFRESH_DELAY,
     CONF_TOKEN,
+    DEFAULT_CACHE_SIZE_LIMIT,
+    DEFAULT_IMAGE_FORMAT,
+    DEFAULT_PLAYER_EVENT_FIELDS,
+    DEFAULT_PLAYER_EVENT_INTERVAL,
+    DEFAULT_QUEUE_REFRESH_DELAY,
     DOMAIN,
     HASSIO_DISCOVERY_SCHEMA_VERSION,
+    IMAGE_FORMATS,
+    IMAGE_PROXY_SIZE,
+    IMAGE_SIZE_MAX,
+    IMAGE_SIZE_MIN,
     LOGGER,
+    PLAYER_EVENT_FIELDS,
 )
 
 if TYPE_CHECKING:
@@ -471,6 +488,30 @@ class OptionsFlowHandler(OptionsFlowWithReload):
             CONF_DOWNLOAD_LOCAL,
             DEFAULT_DOWNLOAD_LOCAL,
         )
+        self._queue_refresh_delay = config_entry.options.get(
+            CONF_QUEUE_REFRESH_DELAY,
+            DEFAULT_QUEUE_REFRESH_DELAY,
+        )
+        self._cache_size_limit = config_entry.options.get(
+            CONF_CACHE_SIZE_LIMIT,
+            DEFAULT_CACHE_SIZE_LIMIT,
+        )
+        self._local_image_size = config_entry.options.get(
+            CONF_LOCAL_IMAGE_SIZE,
+            IMAGE_PROXY_SIZE,
+        )
+        self._local_image_format = config_entry.options.get(
+            CONF_LOCAL_IMAGE_FORMAT,
+            DEFAULT_IMAGE_FORMAT,
+        )
+        self._player_event_fields = config_entry.options.get(
+            CONF_PLAYER_EVENT_FIELDS,
+            DEFAULT_PLAYER_EVENT_FIELDS,
+        )
+        self._player_event_interval = config_entry.options.get(
+            CONF_PLAYER_EVENT_INTERVAL,
+            DEFAULT_PLAYER_EVENT_INTERVAL,
+        )
 
     async def async_step_init(self, user_input=None) -> ConfigFlowResult:
         """Manage options."""
@@ -484,6 +525,33 @@ class OptionsFlowHandler(OptionsFlowWithReload):
         data_schema = vol.Schema(
             {
                 vol.Required(CONF_DOWNLOAD_LOCAL, default=default_download): bool,
+                vol.Required(
+                    CONF_QUEUE_REFRESH_DELAY,
+                    default=self._queue_refresh_delay,
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+                vol.Required(
+                    CONF_CACHE_SIZE_LIMIT,
+                    default=self._cache_size_limit,
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1024)),
+                vol.Required(
+                    CONF_LOCAL_IMAGE_SIZE,
+                    default=self._local_image_size,
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=IMAGE_SIZE_MIN, max=IMAGE_SIZE_MAX),
+                ),
+                vol.Required(
+                    CONF_LOCAL_IMAGE_FORMAT,
+                    default=self._local_image_format,
+                ): vol.In(IMAGE_FORMATS),
+                vol.Required(
+                    CONF_PLAYER_EVENT_FIELDS,
+                    default=self._player_event_fields,
+                ): cv.multi_select(PLAYER_EVENT_FIELDS),
+                vol.Required(
+                    CONF_PLAYER_EVENT_INTERVAL,
+                    default=self._player_event_interval,
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=60)),
             },
         )
         return self.async_show_form(
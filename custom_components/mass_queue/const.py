@@ -9,6 +9,7 @@ CONF_TOKEN = "token"  # noqa: S105
 
 DOMAIN = "mass_queue"
 DEFAULT_NAME = "Music Assistant Queue Items"
+SERVICE_BATCH_EDIT_QUEUE = "batch_edit_queue"
 SERVICE_CLEAR_QUEUE_FROM_HERE = "clear_queue_from_here"
 SERVICE_GET_GROUP_VOLUME = "get_group_volume"
 SERVICE_GET_ALBUM = "get_album"
@@ -31,6 +32,8 @@ SERVICE_SEND_COMMAND = "send_command"
 SERVICE_SET_GROUP_VOLUME = "set_group_volume"
 SERVICE_UNFAVORITE_CURRENT_ITEM = "unfavorite_current_item"
 
+ATTR_ACTION = "action"
+ATTR_ALL_PAGES = "all_pages"
 ATTR_COMMAND = "command"
 ATTR_CONFIG_ENTRY_ID = "config_entry_id"
 ATTR_DATA = "data"
@@ -46,6 +49,7 @@ ATTR_MEDIA_CONTENT_ID = "media_content_id"
 ATTR_MEDIA_IMAGE = "media_image"
 ATTR_MEDIA_TITLE = "media_title"
 ATTR_OFFSET = "offset"
+ATTR_OPERATIONS = "operations"
 ATTR_PAGE = "page"
 ATTR_PLAYER_ENTITY = "entity"
 ATTR_PLAYLIST_ID = "playlist_id"
@@ -59,12 +63,86 @@ ATTR_QUEUE_ITEMS = "queue_items"
 ATTR_RELEASE_DATE = "release_date"
 ATTR_VOLUME_LEVEL = "volume_level"
 
+CONF_CACHE_SIZE_LIMIT = "cache_size_limit"
 CONF_DOWNLOAD_LOCAL = "download_local"
+CONF_LOCAL_IMAGE_FORMAT = "local_image_format"
+CONF_LOCAL_IMAGE_SIZE = "local_image_size"
+CONF_PLAYER_EVENT_FIELDS = "player_event_fields"
+CONF_PLAYER_EVENT_INTERVAL = "player_event_interval"
+CONF_QUEUE_REFRESH_DELAY = "queue_refresh_delay"
 
 LOGGER = logging.getLogger(__package__)
+# Validates internally built response rows against their schemas, for development
+VALIDATE_RESPONSES = False
 
+DEFAULT_CACHE_SIZE_LIMIT = 50
+DEFAULT_IMAGE_FORMAT = "png"
+DEFAULT_PLAYER_EVENT_FIELDS = [
+    "active_group",
+    "active_source",
+    "available",
+    "current_media",
+    "group_childs",
+    "group_members",
+    "group_volume",
+    "name",
+    "playback_state",
+    "powered",
+    "state",
+    "synced_to",
+    "volume_level",
+    "volume_muted",
+]
+DEFAULT_PLAYER_EVENT_INTERVAL = 0
 DEFAULT_QUEUE_ITEMS_LIMIT = 500
 DEFAULT_QUEUE_ITEMS_OFFSET = -5
+DEFAULT_QUEUE_LIMIT_BEFORE = 5
+DEFAULT_QUEUE_LIMIT_AFTER = 50
+DEFAULT_QUEUE_REFRESH_DELAY = 0.5
+
+QUEUE_PAGE_SIZE = 100
+QUEUE_WARM_PAGES_BEFORE = 1
+QUEUE_WARM_PAGES_AFTER = 2
+QUEUE_MAX_CACHED_PAGES = 10
+# Items on either side of the current item a subscription may follow, so that the
+# whole window fits within the cached pages
+QUEUE_SUBSCRIPTION_LIMIT = (QUEUE_MAX_CACHED_PAGES // 2 - 1) * QUEUE_PAGE_SIZE
+QUEUE_IDLE_TIME = 600
+QUEUE_WARM_UP_CONCURRENCY = 4
+QUEUE_EDIT_ACTIONS = ["remove", "move_up", "move_down", "move_next"]
+QUEUE_EDIT_CONCURRENCY = 4
+QUEUE_CLEAR_CONCURRENCY = 8
+QUEUE_CLEAR_PROGRESS_INTERVAL = 25
+QUEUE_STATE_MAX_AGE = 300
+QUEUE_STORAGE_KEY = f"{DOMAIN}.queues"
+QUEUE_STORAGE_VERSION = 1
+
+TRACK_PAGE_CONCURRENCY = 4
+TRACK_PAGE_MAX = 200
+
+METADATA_CACHE_SIZE = 500
+METADATA_CACHE_TTL = 3600
+RECOMMENDATIONS_TTL = 300
+
+IMAGE_CACHE_SIZE_LIMIT = 100
+IMAGE_DOWNLOAD_CONCURRENCY = 6
+IMAGE_DOWNLOAD_TIMEOUT = 10
+IMAGE_FORMATS = ["png", "jpeg", "webp"]
+IMAGE_PROXY_SIZE = 256
+IMAGE_SAVE_OPTIONS = {"jpeg": {"quality": 85}, "webp": {"quality": 80}}
+IMAGE_SIZE_MIN = 16
+IMAGE_SIZE_MAX = 1024
+IMAGE_URL_MAX_AGE = 86400
+IMAGE_URL_LIFETIME = 43200
+IMAGE_URL_MAX_SOURCES = 10000
+
+PLAYER_EVENT_FIELDS = [
+    *DEFAULT_PLAYER_EVENT_FIELDS,
+    "display_name",
+    "elapsed_time",
+    "enabled",
+    "hidden",
+]
 
 MUSIC_ASSISTANT_EVENT_DOMAIN = "mass_music_assistant"
 MASS_QUEUE_EVENT_DOMAIN = "mass_queue"
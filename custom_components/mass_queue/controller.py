@@ -3,34 +3,74 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from typing import TYPE_CHECKING
 
 from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from music_assistant_client import MusicAssistantClient
 
-from music_assistant_models.enums import EventType
+from music_assistant_models.enums import EventType, PlayerState
 
 from .const import (
+    ATTR_ACTION,
+    ATTR_QUEUE_ITEM_ID,
+    CONF_CACHE_SIZE_LIMIT,
     CONF_DOWNLOAD_LOCAL,
+    CONF_LOCAL_IMAGE_FORMAT,
+    CONF_LOCAL_IMAGE_SIZE,
+    CONF_PLAYER_EVENT_FIELDS,
+    CONF_PLAYER_EVENT_INTERVAL,
+    CONF_QUEUE_REFRESH_DELAY,
+    DEFAULT_CACHE_SIZE_LIMIT,
+    DEFAULT_IMAGE_FORMAT,
+    DEFAULT_PLAYER_EVENT_FIELDS,
+    DEFAULT_PLAYER_EVENT_INTERVAL,
     DEFAULT_QUEUE_ITEMS_LIMIT,
     DEFAULT_QUEUE_ITEMS_OFFSET,
+    DEFAULT_QUEUE_REFRESH_DELAY,
+    IMAGE_PROXY_SIZE,
     LOGGER,
     MASS_QUEUE_EVENT_DOMAIN,
     MUSIC_ASSISTANT_EVENT_DOMAIN,
+    QUEUE_CLEAR_CONCURRENCY,
+    QUEUE_CLEAR_PROGRESS_INTERVAL,
+    QUEUE_EDIT_CONCURRENCY,
+    QUEUE_IDLE_TIME,
+    QUEUE_MAX_CACHED_PAGES,
+    QUEUE_PAGE_SIZE,
+    QUEUE_STATE_MAX_AGE,
+    QUEUE_STORAGE_KEY,
+    QUEUE_STORAGE_VERSION,
+    QUEUE_WARM_PAGES_AFTER,
+    QUEUE_WARM_PAGES_BEFORE,
+    QUEUE_WARM_UP_CONCURRENCY,
 )
+from .image_cache import DATA_IMAGE_CACHE, ImageDiskCache
+from .metadata_cache import MetadataCache
+from .models import QueueItemRecord, QueueState
+from .recommendations_cache import RecommendationsCache
 from .utils import (
-    download_and_encode_image,
-    find_image,
+    IMAGE_REQUESTS,
+    SingleFlight,
+    download_single_image_from_image_data,
     format_queue_updated_event_data,
-    generate_image_url_from_image_data,
+    get_player_event_fields,
     get_queue_id_from_player_data,
 )
 
 
+def get_queue_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Returns the storage for the queue cache snapshot of a config entry."""
+    return Store(hass, QUEUE_STORAGE_VERSION, f"{QUEUE_STORAGE_KEY}.{entry_id}")
+
+
 class MassQueueController:
     """Controller to hold methods, handle events, and control caches of players and queues."""
 
@@ -45,8 +85,100 @@ class MassQueueController:
         self._hass = hass
         self.players = Players(hass)
         self.queues = Queues(hass, mass_client, config_entry)
+        self._store = get_queue_store(hass, config_entry.entry_id)
+        self.metadata = MetadataCache()
+        self.recommendations = RecommendationsCache(hass, self.fetch_recommendations)
+        self._formatted_items: dict[str, tuple[QueueItemRecord, dict]] = {}
+        self._queue_listeners: dict[str, list[Callable[[], None]]] = {}
+        self._queue_states: dict[str, QueueState] = {}
+        self._player_event_fields = config_entry.options.get(
+            CONF_PLAYER_EVENT_FIELDS,
+            DEFAULT_PLAYER_EVENT_FIELDS,
+        )
+        self._player_event_interval = config_entry.options.get(
+            CONF_PLAYER_EVENT_INTERVAL,
+            DEFAULT_PLAYER_EVENT_INTERVAL,
+        )
+        # Last forwarded values of the watched fields of each player
+        self._player_states: dict[str, tuple] = {}
+        self._player_event_sent: dict[str, float] = {}
+        self._player_event_timers: dict[str, asyncio.TimerHandle] = {}
+        self._pending_player_events: dict[str, dict] = {}
         self._config_entry = config_entry
         self._download_local = config_entry.options.get(CONF_DOWNLOAD_LOCAL)
+        self.refresh_scheduler = QueueRefreshScheduler(
+            hass,
+            self.update_queue_items,
+            config_entry.options.get(
+                CONF_QUEUE_REFRESH_DELAY,
+                DEFAULT_QUEUE_REFRESH_DELAY,
+            ),
+        )
+
+    def shutdown(self):
+        """Cancel any pending work for this controller."""
+        self.refresh_scheduler.cancel_all()
+        self.recommendations.cancel()
+        for timer in self._player_event_timers.values():
+            timer.cancel()
+        self._player_event_timers.clear()
+
+    async def async_restore_snapshot(self):
+        """Restores the queue caches stored on the last unload, marked as stale."""
+        try:
+            snapshot = await self._store.async_load()
+            restored = self.queues.restore(snapshot) if snapshot else 0
+        except Exception as e:  # noqa: BLE001
+            # Malformed or from an older layout, the queues are fetched as usual
+            LOGGER.error(f"Unable to restore queue cache snapshot, discarding it: {e}")
+            await self._store.async_remove()
+            return
+        LOGGER.debug(f"Restored {restored} queues from snapshot.")
+
+    async def async_save_snapshot(self):
+        """Stores the queue caches so they can be restored on the next setup."""
+        await self._store.async_save(self.queues.to_snapshot())
+
+    def reconnect(self, mass_client: MusicAssistantClient):
+        """Switches to a new client, refreshing only the queues which changed meanwhile."""
+        previous = {
+            queue_id: self.get_queue_signature(self._client.player_queues.get(queue_id))
+            for queue_id in self.queues.queues
+        }
+        self.refresh_scheduler.cancel_all()
+        self._client = mass_client
+        self.queues.set_client(mass_client)
+        self.subscribe_events()
+        self.update_players()
+        for queue_id in list(self._queue_states):
+            if (state := mass_client.player_queues.get(queue_id)) is None:
+                self._queue_states.pop(queue_id)
+            else:
+                self.update_queue_state(queue_id, state.to_dict())
+        changed = []
+        for queue_id, signature in previous.items():
+            state = mass_client.player_queues.get(queue_id)
+            if state is None:
+                self.queues.remove(queue_id)
+            elif self.get_queue_signature(state) != signature:
+                changed.append(queue_id)
+                self.refresh_scheduler.schedule(queue_id, state.to_dict())
+        LOGGER.debug(f"Reconnected, refreshing changed queues {changed}.")
+
+    @staticmethod
+    def get_queue_signature(queue) -> tuple | None:
+        """Returns the parts of a queue's state which change along with its items."""
+        if queue is None:
+            return None
+        current_item = getattr(queue.current_item, "queue_item_id", None)
+        next_item = getattr(queue.next_item, "queue_item_id", None)
+        return (
+            queue.items,
+            queue.current_index,
+            queue.shuffle_enabled,
+            current_item,
+            next_item,
+        )
 
     # Events
     def subscribe_events(self):
@@ -56,7 +188,19 @@ class MassQueueController:
             self.on_queue_items_update_event,
             EventType.QUEUE_ITEMS_UPDATED,
         )
+        self._client.subscribe(
+            self.on_queue_time_update_event,
+            EventType.QUEUE_TIME_UPDATED,
+        )
         self._client.subscribe(self.on_player_event, EventType.PLAYER_UPDATED)
+        self._client.subscribe(
+            self.metadata.on_media_item_event,
+            EventType.MEDIA_ITEM_UPDATED,
+        )
+        self._client.subscribe(
+            self.metadata.on_media_item_event,
+            EventType.MEDIA_ITEM_DELETED,
+        )
 
     def send_ha_event(self, event_data):
         """Send event to Home Assistant."""
@@ -71,11 +215,25 @@ class MassQueueController:
         event_type = event.event
         event_object_id = event.object_id
         event_data = event.data
-        event_queue_id = event_data.get("queue_id")
-        self._hass.loop.create_task(self.update_queue_items(event_queue_id))
         if event_data is None:
             LOGGER.error(f"Event data is empty! Event: {event}")
             return
+        event_queue_id = event_data.get("queue_id")
+        self.update_queue_state(event_queue_id, event_data)
+        # Most queue updates only carry playback state (elapsed time, index, etc).
+        # Only refresh the items when the item count no longer matches the cache.
+        if self.queues.items_changed(event_queue_id, event_data.get("items")):
+            self.refresh_scheduler.schedule(event_queue_id, event_data)
+        else:
+            queue = self.queues.get(event_queue_id)
+            current_index = queue.current_index
+            queue.set_state(current_index=event_data.get("current_index"))
+            if queue.current_index != current_index:
+                self.notify_queue_listeners(event_queue_id)
+            if pages := queue.missing_warm_pages():
+                self._hass.loop.create_task(
+                    self.fetch_queue_pages(event_queue_id, pages),
+                )
         data = format_queue_updated_event_data(event_data)
         ha_event_data = {"type": event_type, "object_id": event_object_id, "data": data}
         self.send_ha_event(ha_event_data)
@@ -86,31 +244,108 @@ class MassQueueController:
         event_type = event.event
         event_object_id = event.object_id
         event_data = event.data
-        event_queue_id = event_data.get("queue_id")
-        self._hass.loop.create_task(self.update_queue_items(event_queue_id))
         if event_data is None:
             LOGGER.error(f"Event data is empty! Event: {event}")
             return
+        event_queue_id = event_data.get("queue_id")
+        self.refresh_scheduler.schedule(event_queue_id, event_data)
         data = format_queue_updated_event_data(event_data)
         ha_event_data = {"type": event_type, "object_id": event_object_id, "data": data}
         self.send_ha_event(ha_event_data)
 
+    def on_queue_time_update_event(self, event):
+        """Callback when the elapsed time of a queue is updated."""
+        if (state := self._queue_states.get(event.object_id)) is not None:
+            state.update_elapsed_time(event.data)
+
     def on_player_event(self, event):
         """Callback when player event is received."""
         event_type = event.event
         event_object_id = event.object_id
         event_data = event.data
-        event_player = event_data["player_id"]
-        self.update_player_queue(event_player)
         if event_data is None:
             LOGGER.error(f"Event data is empty! Event: {event}")
             return
+        event_player = event_data["player_id"]
+        self.update_player_queue(event_player)
         ha_event_data = {
             "type": event_type,
             "object_id": event_object_id,
-            "data": event.data,
+            "data": event_data,
         }
-        self.send_ha_event(ha_event_data)
+        state = get_player_event_fields(event_data, self._player_event_fields)
+        if self._player_states.get(event_player) != state:
+            self._player_states[event_player] = state
+            self.forward_player_event(event_player, ha_event_data)
+        elif self._player_event_interval:
+            # Unchanged updates still carry the elapsed time, forward them sparingly
+            self.forward_player_event_throttled(event_player, ha_event_data)
+
+    @callback
+    def forward_player_event(self, player_id: str, event_data: dict):
+        """Forwards a player event, replacing any throttled event still pending."""
+        if (timer := self._player_event_timers.pop(player_id, None)) is not None:
+            timer.cancel()
+        self._pending_player_events.pop(player_id, None)
+        self._player_event_sent[player_id] = time.monotonic()
+        self.send_ha_event(event_data)
+
+    @callback
+    def forward_player_event_throttled(self, player_id: str, event_data: dict):
+        """Forwards a player event at most once per interval, sending the latest one."""
+        if player_id in self._player_event_timers:
+            self._pending_player_events[player_id] = event_data
+            return
+        elapsed = time.monotonic() - self._player_event_sent.get(player_id, 0)
+        if elapsed >= self._player_event_interval:
+            self.forward_player_event(player_id, event_data)
+            return
+        self._pending_player_events[player_id] = event_data
+        self._player_event_timers[player_id] = self._hass.loop.call_later(
+            self._player_event_interval - elapsed,
+            self._send_pending_player_event,
+            player_id,
+        )
+
+    @callback
+    def _send_pending_player_event(self, player_id: str):
+        """Sends the latest throttled event of a player."""
+        self._player_event_timers.pop(player_id, None)
+        if (event_data := self._pending_player_events.pop(player_id, None)) is not None:
+            self.forward_player_event(player_id, event_data)
+
+    # Queue listeners
+    @callback
+    def async_add_queue_listener(
+        self,
+        queue_id: str,
+        listener: Callable[[], None],
+    ) -> Callable[[], None]:
+        """Calls `listener` when the cached items or current index of a queue change."""
+        self._queue_listeners.setdefault(queue_id, []).append(listener)
+
+        @callback
+        def remove_listener():
+            listeners = self._queue_listeners.get(queue_id, [])
+            if listener in listeners:
+                listeners.remove(listener)
+            if not listeners:
+                self._queue_listeners.pop(queue_id, None)
+
+        return remove_listener
+
+    @callback
+    def notify_queue_listeners(self, queue_id: str):
+        """Notifies the listeners of a queue that it changed."""
+        for listener in list(self._queue_listeners.get(queue_id, ())):
+            listener()
+
+    @callback
+    def notify_queue_changed(self, queue_id: str):
+        """Notifies the listeners and Home Assistant that the items of a queue changed."""
+        self.notify_queue_listeners(queue_id)
+        event_data = {"type": "queue_updated", "data": {"queue_id": queue_id}}
+        self.queues.send_ha_event(event_data)
 
     # All players
     def get_all_players(self):
@@ -136,6 +371,9 @@ class MassQueueController:
         player = self._client.players.get(player_id)
         if player is None:
             self.players.remove(player_id)
+            self._player_states.pop(player_id, None)
+            self._player_event_sent.pop(player_id, None)
+            return
         queue_id = get_queue_id_from_player_data(player)
         self.players.update(player_id, queue_id)
 
@@ -144,23 +382,13 @@ class MassQueueController:
         data = data if data else {}
         return await self._client.send_command(command, require_schema=None, **data)
 
+    async def fetch_recommendations(self) -> list:
+        """Fetches the recommendations of all providers."""
+        return await self._client.music.recommendations()
+
     async def get_recommendations(self, providers: list | None = None):
-        """Pulls all recommendations."""
-        recs = await self._client.music.recommendations()
-        if not providers:
-            return recs
-        rec_providers = []
-        for rec in recs:
-            if rec.provider not in rec_providers:
-                rec_providers.append(rec.provider)
-
-        used_rec_providers = [
-            rec_provider
-            for rec_provider in rec_providers
-            for provider in providers
-            if rec_provider.startswith(provider)
-        ]
-        return [rec for rec in recs if rec.provider in used_rec_providers]
+        """Returns the formatted recommendations, optionally limited to some providers."""
+        return await self.recommendations.get(providers)
 
     async def get_grouped_volume(self, player_id: str):
         """Get the grouped volume for a given player."""
@@ -177,39 +405,193 @@ class MassQueueController:
         return await self.get_queue(queue_id)
 
     # All queues
-    async def get_all_queues(self):
-        """Gets queue items for all Music Assistant queues."""
-        queue_ids = [q.queue_id for q in self._client.player_queues.player_queues]
-        return {queue_id: await self.get_queue(queue_id) for queue_id in queue_ids}
-
     async def update_queues(self):
-        """Update queue items for all Music Assistant queues."""
+        """Update queue items for active queues, leaving idle queues to be fetched on use."""
         LOGGER.debug("Updating all queues.")
-        queues = await self.get_all_queues()
-        self.queues.batch_add(queues)
+        player_queues = self._client.player_queues.player_queues
+        queue_ids = [q.queue_id for q in player_queues]
+        priorities = {q.queue_id: self.get_warm_up_priority(q) for q in player_queues}
+        warm = sorted(
+            (queue_id for queue_id in queue_ids if priorities[queue_id] is not None),
+            key=priorities.get,
+        )
+        LOGGER.debug(f"Warming queues {warm}, deferring {len(queue_ids) - len(warm)}.")
+        semaphore = asyncio.Semaphore(QUEUE_WARM_UP_CONCURRENCY)
+
+        async def update(queue_id: str):
+            async with semaphore:
+                try:
+                    await self.update_queue_items(queue_id)
+                except Exception as e:  # noqa: BLE001
+                    LOGGER.error(f"Unable to update queue {queue_id}: {e}")
+
+        # Semaphore waiters are served in order, so the most relevant queues go first
+        await asyncio.gather(*[update(queue_id) for queue_id in warm])
+        event_data = {"type": "queues_added", "data": {"queue_id": queue_ids}}
+        self.queues.send_ha_event(event_data)
+
+    @staticmethod
+    def get_warm_up_priority(queue) -> tuple | None:
+        """Returns the order in which to warm a queue, or `None` to fetch it on use."""
+        if not queue.items:
+            return None
+        if queue.state == PlayerState.PLAYING:
+            return (0, 0)
+        if queue.state == PlayerState.PAUSED:
+            return (1, 0)
+        last_updated = queue.elapsed_time_last_updated or 0
+        if time.time() - last_updated < QUEUE_IDLE_TIME:
+            return (2, -last_updated)
+        return None
 
     # Individual queues
     async def player_queue(
         self,
         queue_id: str,
-        limit: int = DEFAULT_QUEUE_ITEMS_LIMIT,
+        limit: int | None = DEFAULT_QUEUE_ITEMS_LIMIT,
         offset: int = DEFAULT_QUEUE_ITEMS_OFFSET,
     ):
-        """Get the cached queue items for a single queue."""
-        queue = self.queues.get(queue_id)
+        """Get the cached queue items for a single queue, fetching missing pages."""
+        queue = self.queues.get_or_add(queue_id)
+        if queue.stale:
+            # Serve the restored items now, the refresh replaces them when done
+            self.refresh_scheduler.schedule(queue_id)
         if offset == -1:
             try:
                 offset = await self.get_queue_index(queue_id) - 5
             except IndexError:
                 offset = 0
         offset = max(offset, 0)
-        return queue[offset : offset + limit] if queue else []
+        if limit is None:
+            limit = max(len(queue) - offset, 0)
+        if pages := queue.missing_pages(offset, limit):
+            # Fetched pages are not cached if the queue changed meanwhile, but still
+            # answer this read. Listeners are not notified, as they may be the reader
+            fetched = await self.fetch_queue_pages(queue_id, pages, notify=False)
+            return queue.get_items(offset, limit, fetched)
+        return queue.get_items(offset, limit)
+
+    def format_queue_items(self, queue_items: list[QueueItemRecord]) -> list[dict]:
+        """Returns the response rows for the items, formatting only changed items."""
+        result = []
+        for item in queue_items:
+            cached = self._formatted_items.get(item.queue_item_id)
+            # Unchanged items keep their record, so a new record means new data
+            if cached is None or cached[0] is not item:
+                cached = (item, item.to_response())
+                self._formatted_items[item.queue_item_id] = cached
+            result.append(cached[1])
+        return result
+
+    def prune_formatted_items(self):
+        """Drops the response rows of items which are no longer cached."""
+        cached = {
+            id(item)
+            for queue in self.queues.queues.values()
+            for item in queue.items
+            if item is not None
+        }
+        self._formatted_items = {
+            queue_item_id: formatted
+            for queue_item_id, formatted in self._formatted_items.items()
+            if id(formatted[0]) in cached
+        }
+
+    async def fetch_queue_pages(
+        self,
+        queue_id: str,
+        pages: list[int],
+        notify: bool = True,
+    ) -> dict[int, list[QueueItemRecord]]:
+        """Fetch and cache the given pages of a single queue, returning their items."""
+        LOGGER.debug(f"Fetching pages {pages} for queue {queue_id}.")
+        queue = self.queues.get_or_add(queue_id)
+        generation = queue.generation
+        page_size = queue.page_size
+        # Pages already being fetched for this version of the queue are joined
+        processed = await asyncio.gather(
+            *[
+                queue.page_requests.run(
+                    (generation, page),
+                    self.fetch_queue_page,
+                    queue_id,
+                    page,
+                    page_size,
+                )
+                for page in pages
+            ],
+        )
+        fetched = dict(zip(pages, processed, strict=True))
+        if queue.generation != generation or queue.pending_edits:
+            # The queue changed while fetching, these pages may be out of date
+            LOGGER.debug(f"Not caching stale pages {pages} for queue {queue_id}.")
+            return fetched
+        for page, items in fetched.items():
+            queue.store(page * page_size, items)
+            if len(items) < page_size:
+                queue.set_state(items_count=page * page_size + len(items))
+        queue.evict_distant_pages(QUEUE_MAX_CACHED_PAGES)
+        self.queues.enforce_size_limit()
+        self.prune_formatted_items()
+        if notify:
+            self.notify_queue_listeners(queue_id)
+        return fetched
+
+    async def fetch_queue_page(
+        self,
+        queue_id: str,
+        page: int,
+        page_size: int,
+    ) -> list[QueueItemRecord]:
+        """Fetch the records of a single page of a queue."""
+        items = await self.get_queue(queue_id, limit=page_size, offset=page * page_size)
+        return await self.queues.process_items(queue_id, items)
 
-    async def update_queue_items(self, queue_id: str):
-        """Update the queue items for a single queue."""
+    async def update_queue_items(self, queue_id: str, queue_data: dict | None = None):
+        """Update the warm pages of a single queue."""
         LOGGER.debug(f"Updating queue {queue_id}.")
-        queue = await self.get_queue(queue_id)
-        self.queues.update(queue_id, queue)
+        queue = self.queues.get_or_add(queue_id)
+        if queue_data:
+            queue.set_state(queue_data.get("items"), queue_data.get("current_index"))
+            index_in_buffer = queue_data.get("index_in_buffer")
+        else:
+            index_in_buffer = None
+        # Items up to the buffered index cannot be moved or removed on the server, so
+        # only the warm items after it are refetched. The last stable item is fetched
+        # along with them as an anchor; a mismatch means the queue was replaced.
+        # Restored items are not trusted as anchors, the whole warm range is refetched
+        start = 0 if queue.stale else queue.stable_length(index_in_buffer)
+        warm_start, warm_end = queue.warm_range()
+        fetch_start = start - 1 if start else warm_start
+        if fetch_start > warm_start and queue.missing_pages(
+            warm_start,
+            fetch_start - warm_start,
+        ):
+            fetch_start = warm_start
+        if fetch_start >= warm_end:
+            queue.invalidate(start)
+            queue.stale = False
+            return
+        limit = warm_end - fetch_start
+        generation = queue.generation
+        items = await self.get_queue(queue_id, limit=limit, offset=fetch_start)
+        if start and not queue.is_anchor(start - 1, items, fetch_start):
+            LOGGER.debug(f"Anchor mismatch for queue {queue_id}, resetting cache.")
+            start = 0
+        processed = await self.queues.process_items(queue_id, items)
+        if queue.generation != generation or queue.pending_edits:
+            # Edited locally while fetching; the edit's own update refreshes again
+            LOGGER.debug(f"Discarding refresh of queue {queue_id} overtaken by edits.")
+            return
+        queue.invalidate(start)
+        queue.stale = False
+        queue.store(fetch_start, processed)
+        if len(processed) < limit:
+            queue.set_state(items_count=fetch_start + len(processed))
+        queue.evict_distant_pages(QUEUE_MAX_CACHED_PAGES)
+        self.queues.enforce_size_limit()
+        self.prune_formatted_items()
+        self.notify_queue_changed(queue_id)
 
     async def get_queue(
         self,
@@ -238,14 +620,315 @@ class MassQueueController:
                 offset=offset,
             )
 
+    async def edit_queue(self, queue_id: str, operations: list[dict]) -> list[dict]:
+        """Runs a batch of queue edits, returning the result of each operation."""
+        results = [
+            {
+                ATTR_ACTION: operation[ATTR_ACTION],
+                ATTR_QUEUE_ITEM_ID: operation[ATTR_QUEUE_ITEM_ID],
+                "success": False,
+                "error": None,
+            }
+            for operation in operations
+        ]
+        valid = self.validate_queue_edits(queue_id, operations, results)
+        semaphore = asyncio.Semaphore(QUEUE_EDIT_CONCURRENCY)
+
+        async def run(index: int):
+            async with semaphore:
+                await self.run_queue_edit(queue_id, operations[index], results[index])
+
+        # Removes do not depend on each other, so consecutive removes run concurrently.
+        # Moves depend on the positions left by earlier edits, so they run in order.
+        removes = []
+        for index in valid:
+            if operations[index][ATTR_ACTION] == "remove":
+                removes.append(index)
+                continue
+            await asyncio.gather(*[run(remove) for remove in removes])
+            removes = []
+            await run(index)
+        await asyncio.gather(*[run(remove) for remove in removes])
+        return results
+
+    def validate_queue_edits(
+        self,
+        queue_id: str,
+        operations: list[dict],
+        results: list[dict],
+    ) -> list[int]:
+        """Checks edits against the cached queue, returning the indexes of valid edits."""
+        queue = self.queues.get(queue_id)
+        positions = queue.positions() if queue is not None else {}
+        complete = queue is not None and queue.is_complete()
+        locked = self.get_locked_index(queue_id)
+        removed = set()
+        valid = []
+        for index, operation in enumerate(operations):
+            queue_item_id = operation[ATTR_QUEUE_ITEM_ID]
+            position = positions.get(queue_item_id)
+            if queue_item_id in removed:
+                results[index]["error"] = "Item was removed earlier in this batch"
+            elif position is None and complete:
+                results[index]["error"] = "Item is not in the queue"
+            elif position is not None and position <= locked:
+                results[index]["error"] = "Item is already playing or buffered"
+            else:
+                valid.append(index)
+                if operation[ATTR_ACTION] == "remove":
+                    removed.add(queue_item_id)
+        return valid
+
+    async def run_queue_edit(self, queue_id: str, operation: dict, result: dict):
+        """Sends a single queue edit to Music Assistant, recording the result."""
+        try:
+            await self.edit_queue_item(
+                queue_id,
+                operation[ATTR_ACTION],
+                operation[ATTR_QUEUE_ITEM_ID],
+            )
+        except Exception as e:  # noqa: BLE001
+            LOGGER.debug(f"Queue edit {operation} failed: {e}")
+            result["error"] = str(e)
+        else:
+            result["success"] = True
+
+    async def edit_queue_item(self, queue_id: str, action: str, queue_item_id: str):
+        """Sends a queue edit to Music Assistant, applying it to the cache right away."""
+        player_queues = self._client.player_queues
+        commands = {
+            "remove": player_queues.queue_command_delete,
+            "move_up": player_queues.queue_command_move_up,
+            "move_down": player_queues.queue_command_move_down,
+            "move_next": player_queues.queue_command_move_next,
+        }
+        queue = self.queues.get(queue_id)
+        undo = self.apply_queue_edit(queue_id, action, queue_item_id)
+        if undo is not None:
+            queue.pending_edits += 1
+            self.notify_queue_changed(queue_id)
+        try:
+            await commands[action](queue_id, queue_item_id)
+        except Exception:
+            if undo is not None:
+                LOGGER.debug(f"Rolling back {action} of {queue_item_id}.")
+                undo()
+                self.notify_queue_changed(queue_id)
+                self.refresh_scheduler.schedule(queue_id)
+            raise
+        finally:
+            if undo is not None:
+                queue.pending_edits -= 1
+
+    def apply_queue_edit(
+        self,
+        queue_id: str,
+        action: str,
+        queue_item_id: str,
+    ) -> Callable[[], None] | None:
+        """Applies a queue edit to the cached queue, returning the call to undo it."""
+        queue = self.queues.get(queue_id)
+        if queue is None or (position := queue.index_of(queue_item_id)) is None:
+            return None
+        locked = self.get_locked_index(queue_id)
+        if position <= locked:
+            return None
+        if action == "remove":
+            return queue.remove_item(queue_item_id)
+        if action == "move_next":
+            # Music Assistant moves the item right after the buffered item
+            target = locked + 1 if locked >= 0 else None
+        else:
+            target = position - 1 if action == "move_up" else position + 1
+        if target is None or target <= locked:
+            return None
+        return queue.move_item(queue_item_id, target)
+
+    def get_locked_index(self, queue_id: str) -> int:
+        """Returns the last position which can no longer be edited on the server."""
+        state = self._queue_states.get(queue_id) or self._client.player_queues.get(
+            queue_id,
+        )
+        index_in_buffer = getattr(state, "index_in_buffer", None)
+        return index_in_buffer if index_in_buffer is not None else -1
+
+    async def clear_queue_after_current(self, queue_id: str) -> dict:
+        """Removes all items after the current item of a queue, reporting progress."""
+        state = await self.get_queue_state(queue_id)
+        if state is None:
+            return {"queue_id": queue_id, "total": 0, "removed": 0, "failed": 0}
+        # Items up to the buffered index cannot be removed on the server
+        start = max(state.current_index or 0, state.index_in_buffer or 0) + 1
+        # Shared by the fetches and the removals, so large queues do not flood the server
+        semaphore = asyncio.Semaphore(QUEUE_CLEAR_CONCURRENCY)
+
+        async def fetch(offset: int):
+            async with semaphore:
+                return await self.get_queue(
+                    queue_id,
+                    limit=QUEUE_PAGE_SIZE,
+                    offset=offset,
+                )
+
+        fetches = [
+            fetch(offset) for offset in range(start, state.items or 0, QUEUE_PAGE_SIZE)
+        ]
+        pages = await asyncio.gather(*fetches)
+        queue_item_ids = [
+            item["queue_item_id"] if type(item) is dict else item.queue_item_id
+            for page in pages
+            for item in page
+        ]
+        LOGGER.debug(f"Removing {len(queue_item_ids)} items from queue {queue_id}.")
+        progress = {
+            "queue_id": queue_id,
+            "total": len(queue_item_ids),
+            "removed": 0,
+            "failed": 0,
+        }
+
+        async def remove(queue_item_id: str):
+            async with semaphore:
+                try:
+                    await self._client.player_queues.queue_command_delete(
+                        queue_id,
+                        queue_item_id,
+                    )
+                except Exception as e:  # noqa: BLE001
+                    LOGGER.debug(f"Unable to remove {queue_item_id}: {e}")
+                    progress["failed"] += 1
+                else:
+                    progress["removed"] += 1
+            done = progress["removed"] + progress["failed"]
+            if done % QUEUE_CLEAR_PROGRESS_INTERVAL == 0 and done < progress["total"]:
+                event_data = {"type": "queue_clear_progress", "data": dict(progress)}
+                self.queues.send_ha_event(event_data)
+
+        removals = [remove(queue_item_id) for queue_item_id in queue_item_ids]
+        await asyncio.gather(*removals)
+        self.queues.send_ha_event({"type": "queue_cleared", "data": progress})
+        return progress
+
+    def get_cache_info(self):
+        """Get the size of the queue caches."""
+        image_cache: ImageDiskCache | None = self._hass.data.get(DATA_IMAGE_CACHE)
+        return {
+            **self.queues.get_cache_info(),
+            "formatted_items": len(self._formatted_items),
+            "queue_states": len(self._queue_states),
+            "metadata": self.metadata.get_cache_info(),
+            "recommendations": self.recommendations.get_cache_info(),
+            "disk_images": len(image_cache) if image_cache else 0,
+            "disk_image_size": image_cache.size if image_cache else 0,
+            "image_requests": {
+                "hits": image_cache.hits if image_cache else 0,
+                "misses": image_cache.misses if image_cache else 0,
+                "coalesced": IMAGE_REQUESTS.coalesced,
+            },
+        }
+
     async def get_active_queue(self, queue_id: str):
         """Get the active queue for a single queue."""
         return await self._client.player_queues.get_active_queue(queue_id)
 
+    def update_queue_state(self, queue_id: str, queue_data: dict) -> QueueState:
+        """Updates the playback state of a queue from the dict form of the queue."""
+        if (state := self._queue_states.get(queue_id)) is None:
+            state = QueueState(queue_id)
+            self._queue_states[queue_id] = state
+        state.update(queue_data)
+        return state
+
+    async def get_queue_state(self, queue_id: str) -> QueueState | None:
+        """Get the playback state of a queue, fetching it when older than the bound."""
+        state = self._queue_states.get(queue_id)
+        if state is not None and state.age < QUEUE_STATE_MAX_AGE:
+            return state
+        LOGGER.debug(f"Fetching state of queue {queue_id}.")
+        active_queue = await self.get_active_queue(queue_id)
+        if active_queue is None:
+            return state
+        return self.update_queue_state(queue_id, active_queue.to_dict())
+
     async def get_queue_index(self, queue_id: str):
         """Get the active queue index for a single queue."""
-        active_queue = await self.get_active_queue(queue_id)
-        return active_queue.current_index
+        state = await self.get_queue_state(queue_id)
+        if state is None:
+            return 0
+        return state.current_index or 0
+
+
+class QueueRefreshScheduler:
+    """Coalesces queue refreshes so only one fetch per queue runs at a time."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        refresh: Callable[[str, dict | None], Awaitable],
+        delay: float,
+    ):
+        """Initialize class."""
+        self._hass = hass
+        self._refresh = refresh
+        self._delay = delay
+        self._pending: dict[str, dict | None] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    @callback
+    def schedule(self, queue_id: str, queue_data: dict | None = None):
+        """Schedules a refresh for a queue, merging it into any pending refresh."""
+        # A refresh without data must not drop the queue state of a pending event
+        if queue_data is not None or queue_id not in self._pending:
+            self._pending[queue_id] = queue_data
+        if queue_id in self._timers:
+            return
+        self._timers[queue_id] = self._hass.loop.call_later(
+            self._delay,
+            self._start,
+            queue_id,
+        )
+
+    @callback
+    def _start(self, queue_id: str):
+        """Starts the pending refresh, superseding the one in flight."""
+        self._timers.pop(queue_id, None)
+        queue_data = self._pending.pop(queue_id, None)
+        previous = self._tasks.get(queue_id)
+        if previous is not None and not previous.done():
+            LOGGER.debug(f"Cancelling superseded refresh for queue {queue_id}.")
+            previous.cancel()
+        self._tasks[queue_id] = self._hass.loop.create_task(
+            self._run(queue_id, queue_data, previous),
+        )
+
+    async def _run(
+        self,
+        queue_id: str,
+        queue_data: dict | None,
+        previous: asyncio.Task | None,
+    ):
+        """Waits for the superseded refresh to finish, then refreshes the queue."""
+        if previous is not None and not previous.done():
+            await asyncio.wait([previous])
+        try:
+            await self._refresh(queue_id, queue_data)
+        except Exception as e:  # noqa: BLE001
+            LOGGER.error(f"Unable to refresh queue {queue_id}: {e}")
+        finally:
+            if self._tasks.get(queue_id) is asyncio.current_task():
+                self._tasks.pop(queue_id)
+
+    @callback
+    def cancel_all(self):
+        """Cancels all pending and running refreshes."""
+        for timer in self._timers.values():
+            timer.cancel()
+        for task in self._tasks.values():
+            task.cancel()
+        self._timers.clear()
+        self._pending.clear()
+        self._tasks.clear()
 
 
 class Players:
@@ -294,7 +977,7 @@ class Players:
             return
         current_queue_id = self.players[player_id]
         if current_queue_id == queue_id:
-            pass
+            return
         self.players[player_id] = queue_id
         event_data = {
             "type": "player_updated",
@@ -310,6 +993,313 @@ class Players:
         self._hass.bus.async_fire(MASS_QUEUE_EVENT_DOMAIN, event_data)
 
 
+class CachedQueue:
+    """Sparse, page-indexed cache of the items in a single queue."""
+
+    def __init__(self, page_size: int = QUEUE_PAGE_SIZE):
+        """Initialize class."""
+        self.page_size = page_size
+        self.items: list[QueueItemRecord | None] = []
+        self.items_count: int | None = None
+        self.current_index = 0
+        self.generation = 0
+        # Edits applied locally which Music Assistant has not confirmed yet
+        self.pending_edits = 0
+        # Page fetches in flight, keyed by generation and page
+        self.page_requests = SingleFlight()
+        # Restored from storage and not yet revalidated against Music Assistant
+        self.stale = False
+        # Ranges of positions shown by live subscriptions, which are never evicted
+        self.windows: dict[Hashable, tuple[int, int]] = {}
+        self._positions: dict[str, int] | None = {}
+        self.size = 0
+        self.image_size = 0
+        self.last_used = time.monotonic()
+
+    def __len__(self):
+        """Returns the number of known positions in the queue."""
+        return len(self.items)
+
+    def set_state(
+        self,
+        items_count: int | None = None,
+        current_index: int | None = None,
+    ):
+        """Updates the item count and current index, resizing the cache as needed."""
+        if current_index is not None:
+            self.current_index = current_index
+        if items_count is None:
+            return
+        self.items_count = items_count
+        if items_count < len(self.items):
+            self._set_slice(items_count, len(self.items), [])
+        else:
+            self.items.extend([None] * (items_count - len(self.items)))
+
+    def _set_slice(self, start: int, end: int, queue_items: list):
+        """Replaces a range of positions, keeping the size accounting current."""
+        for item in self.items[start:end]:
+            if item is not None:
+                self.size -= item.size
+                self.image_size -= item.image_size
+        for item in queue_items:
+            if item is not None:
+                self.size += item.size
+                self.image_size += item.image_size
+        self._index_slice(start, end, queue_items)
+        self.items[start:end] = queue_items
+
+    def _index_slice(self, start: int, end: int, queue_items: list):
+        """Updates the position index for a range about to be replaced."""
+        if self._positions is None:
+            return
+        if end - start != len(queue_items) and end < len(self.items):
+            # Later positions shift, the index is rebuilt on next use
+            self._positions = None
+            return
+        for index, item in enumerate(self.items[start:end], start):
+            if item is not None and self._positions.get(item.queue_item_id) == index:
+                del self._positions[item.queue_item_id]
+        for index, item in enumerate(queue_items, start):
+            if item is not None:
+                self._positions[item.queue_item_id] = index
+
+    def page_bounds(self, page: int) -> tuple[int, int]:
+        """Returns the start and end positions of a page."""
+        start = page * self.page_size
+        end = start + self.page_size
+        if self.items_count is not None:
+            end = min(end, self.items_count)
+        return start, end
+
+    def is_page_loaded(self, page: int) -> bool:
+        """Returns whether every item of a page is cached."""
+        start, end = self.page_bounds(page)
+        chunk = self.items[start:end]
+        return len(chunk) == end - start and all(item is not None for item in chunk)
+
+    def missing_pages(self, offset: int, limit: int) -> list[int]:
+        """Returns the pages which need to be fetched to serve a range of items."""
+        end = offset + limit
+        if self.items_count is not None:
+            end = min(end, self.items_count)
+        if end <= offset:
+            return []
+        pages = range(offset // self.page_size, (end - 1) // self.page_size + 1)
+        return [page for page in pages if not self.is_page_loaded(page)]
+
+    def loaded_pages(self) -> list[int]:
+        """Returns all pages with at least one cached item."""
+        pages = range((len(self.items) + self.page_size - 1) // self.page_size)
+        loaded = []
+        for page in pages:
+            start, end = self.page_bounds(page)
+            if any(item is not None for item in self.items[start:end]):
+                loaded.append(page)
+        return loaded
+
+    def warm_range(self) -> tuple[int, int]:
+        """Returns the range of positions to keep cached around the current index."""
+        page = self.current_index // self.page_size
+        start = max(page - QUEUE_WARM_PAGES_BEFORE, 0) * self.page_size
+        end = (page + QUEUE_WARM_PAGES_AFTER + 1) * self.page_size
+        if self.items_count is not None:
+            end = min(end, self.items_count)
+        return start, end
+
+    def missing_warm_pages(self) -> list[int]:
+        """Returns the pages around the current index which are not cached."""
+        start, end = self.warm_range()
+        return self.missing_pages(start, end - start)
+
+    def get_items(
+        self,
+        offset: int,
+        limit: int,
+        fetched: dict[int, list[QueueItemRecord]] | None = None,
+    ) -> list[QueueItemRecord]:
+        """Returns the items within a range, taking `fetched` pages over cached ones."""
+        if not fetched:
+            return [
+                item for item in self.items[offset : offset + limit] if item is not None
+            ]
+        items = []
+        for index in range(offset, offset + limit):
+            page, position = divmod(index, self.page_size)
+            if page in fetched:
+                rows = fetched[page]
+                item = rows[position] if position < len(rows) else None
+            else:
+                item = self.items[index] if index < len(self.items) else None
+            if item is not None:
+                items.append(item)
+        return items
+
+    def positions(self) -> dict[str, int]:
+        """Returns the positions of the cached items by queue item ID."""
+        if self._positions is None:
+            self._positions = {
+                item.queue_item_id: index
+                for index, item in enumerate(self.items)
+                if item is not None
+            }
+        return self._positions
+
+    def index_of(self, queue_item_id: str) -> int | None:
+        """Returns the position of a cached item."""
+        return self.positions().get(queue_item_id)
+
+    def remove_item(self, queue_item_id: str) -> Callable[[], None] | None:
+        """Removes a cached item, returning the call to restore it."""
+        position = self.index_of(queue_item_id)
+        if position is None:
+            return None
+        record = self.items[position]
+        self.generation += 1
+        self._set_slice(position, position + 1, [])
+        if self.items_count is not None:
+            self.items_count -= 1
+
+        def undo():
+            if self.index_of(queue_item_id) is not None:
+                return
+            self.generation += 1
+            index = min(position, len(self.items))
+            self._set_slice(index, index, [record])
+            if self.items_count is not None:
+                self.items_count += 1
+
+        return undo
+
+    def move_item(self, queue_item_id: str, position: int) -> Callable[[], None] | None:
+        """Moves a cached item to another position, returning the call to move it back."""
+        previous = self.index_of(queue_item_id)
+        if previous is None or previous == position or not 0 <= position < len(self):
+            return None
+        self.generation += 1
+        self.items.insert(position, self.items.pop(previous))
+        self._positions = None
+
+        def undo():
+            if self.index_of(queue_item_id) == position:
+                self.move_item(queue_item_id, previous)
+
+        return undo
+
+    def to_snapshot(self) -> dict:
+        """Returns the cached items in a compact form for storage."""
+        runs = []
+        for index, item in enumerate(self.items):
+            if item is None:
+                continue
+            if runs and runs[-1][0] + len(runs[-1][1]) == index:
+                runs[-1][1].append(item.to_snapshot())
+            else:
+                runs.append([index, [item.to_snapshot()]])
+        return {
+            "items": self.items_count,
+            "current_index": self.current_index,
+            "runs": runs,
+        }
+
+    @classmethod
+    def from_snapshot(cls, data: dict) -> CachedQueue:
+        """Builds a stale queue cache from its stored form."""
+        queue = cls()
+        queue.set_state(data.get("items"), data.get("current_index"))
+        for offset, rows in data.get("runs", []):
+            queue.store(offset, [QueueItemRecord.from_snapshot(row) for row in rows])
+        queue.stale = True
+        return queue
+
+    def is_complete(self) -> bool:
+        """Returns whether every item of the queue is cached."""
+        return self.items_count is not None and None not in self.items
+
+    def known_items(self) -> dict[str, QueueItemRecord]:
+        """Returns all cached items by their queue item ID."""
+        return {item.queue_item_id: item for item in self.items if item is not None}
+
+    def stable_length(self, index_in_buffer: int | None) -> int:
+        """Returns the number of positions that cannot have changed on the server."""
+        if index_in_buffer is None:
+            return 0
+        return min(index_in_buffer + 1, len(self.items))
+
+    def is_anchor(self, index: int, queue_items: list, offset: int) -> bool:
+        """Returns whether the cached item at `index` matches the fetched items."""
+        if not offset <= index < offset + len(queue_items) or index >= len(self.items):
+            return False
+        cached = self.items[index]
+        queue_item = queue_items[index - offset]
+        queue_item_id = (
+            queue_item["queue_item_id"]
+            if type(queue_item) is dict
+            else queue_item.queue_item_id
+        )
+        return cached is not None and cached.queue_item_id == queue_item_id
+
+    def invalidate(self, start: int = 0):
+        """Drops all cached items from `start` onwards."""
+        self.generation += 1
+        self.clear(start)
+
+    def clear(self, start: int = 0):
+        """Drops all cached items from `start` onwards, keeping in-flight fetches."""
+        end = len(self.items)
+        self._set_slice(start, end, [None] * max(end - start, 0))
+
+    def store(self, offset: int, queue_items: list[QueueItemRecord]):
+        """Stores items in the cache starting at `offset`."""
+        end = offset + len(queue_items)
+        if end > len(self.items):
+            self.items.extend([None] * (end - len(self.items)))
+        self._set_slice(offset, end, queue_items)
+
+    def drop_page(self, page: int):
+        """Drops all cached items of a page."""
+        start, end = self.page_bounds(page)
+        self._set_slice(start, end, [None] * (end - start))
+
+    def page_image_size(self, page: int) -> int:
+        """Returns the size of the encoded images cached for a page."""
+        start, end = self.page_bounds(page)
+        return sum(
+            item.image_size for item in self.items[start:end] if item is not None
+        )
+
+    def set_window(self, key: Hashable, start: int, end: int):
+        """Keeps the pages of a subscribed range of positions cached."""
+        self.windows[key] = (start, end)
+
+    def remove_window(self, key: Hashable):
+        """Allows the pages of a subscribed range to be evicted again."""
+        self.windows.pop(key, None)
+
+    def pinned_pages(self) -> set[int]:
+        """Returns the pages which overlap a subscribed range or the current index."""
+        pinned = {self.current_index // self.page_size}
+        for start, end in self.windows.values():
+            pinned.update(range(start // self.page_size, -(-end // self.page_size)))
+        return pinned
+
+    def distant_pages(self) -> list[int]:
+        """Returns the evictable loaded pages, farthest from the current index first."""
+        current = self.current_index // self.page_size
+        pinned = self.pinned_pages()
+        loaded = [page for page in self.loaded_pages() if page not in pinned]
+        loaded.sort(key=lambda page: abs(page - current), reverse=True)
+        return loaded
+
+    def evict_distant_pages(self, max_pages: int):
+        """Drops the pages farthest from the current index until within budget."""
+        loaded = self.loaded_pages()
+        if len(loaded) <= max_pages:
+            return
+        for page in self.distant_pages()[: len(loaded) - max_pages]:
+            self.drop_page(page)
+
+
 class Queues:
     """Class to hold all queue caches."""
 
@@ -321,34 +1311,50 @@ class Queues:
         queues: dict | None = None,
     ):
         """Initialize class."""
-        self.queues = self.batch_add(queues) if queues else {}
+        self.queues: dict[str, CachedQueue] = queues if queues is not None else {}
         self._hass = hass
         self._config_entry = config_entry
         self._download_local = config_entry.options.get(CONF_DOWNLOAD_LOCAL)
+        self._local_image_size = config_entry.options.get(
+            CONF_LOCAL_IMAGE_SIZE,
+            IMAGE_PROXY_SIZE,
+        )
+        self._local_image_format = config_entry.options.get(
+            CONF_LOCAL_IMAGE_FORMAT,
+            DEFAULT_IMAGE_FORMAT,
+        )
+        self._size_limit = (
+            config_entry.options.get(CONF_CACHE_SIZE_LIMIT, DEFAULT_CACHE_SIZE_LIMIT)
+            * 1024
+            * 1024
+        )
         self._client = client
 
-    def get(self, queue_id):
-        """Returns cached queue records."""
-        return self.queues.get(queue_id, [])
+    @property
+    def size(self) -> int:
+        """Returns the estimated size of all cached queues in bytes."""
+        return sum(queue.size for queue in self.queues.values())
 
-    def add(self, queue_id: str, queue_items: int):
-        """Adds a single queue."""
-        self.process_queue_images(queue_items, queue_id)
-        event_data = {"type": "queue_added", "data": {"queue_id": queue_id}}
-        self.send_ha_event(event_data)
+    def set_client(self, client: MusicAssistantClient):
+        """Switches to a new client after reconnecting."""
+        self._client = client
 
-    def batch_add(self, queues):
-        """Adds multiple queues at once."""
-        for k, v in queues.items():
-            self.process_queue_images(v, k)
-        event_data = {"type": "queues_added", "data": {"queue_id": list(queues.keys())}}
-        self.send_ha_event(event_data)
+    def get(self, queue_id) -> CachedQueue | None:
+        """Returns cached queue records."""
+        return self.queues.get(queue_id)
 
-    def update(self, queue_id, queue_items):
-        """Updates queue items in record."""
-        self.queues[queue_id] = self.process_queue_images(queue_items, queue_id)
-        event_data = {"type": "queue_updated", "data": {"queue_id": queue_id}}
+    def get_or_add(self, queue_id: str) -> CachedQueue:
+        """Returns the cache for a queue, adding it if it does not exist yet."""
+        if (queue := self.queues.get(queue_id)) is not None:
+            queue.last_used = time.monotonic()
+            return queue
+        queue = CachedQueue()
+        if (state := self._client.player_queues.get(queue_id)) is not None:
+            queue.set_state(state.items, state.current_index)
+        self.queues[queue_id] = queue
+        event_data = {"type": "queue_added", "data": {"queue_id": queue_id}}
         self.send_ha_event(event_data)
+        return queue
 
     def remove(self, queue_id):
         """Removes queue from record."""
@@ -358,6 +1364,93 @@ class Queues:
         event_data = {"type": "queue_removed", "data": {"queue_id": queue_id}}
         self.send_ha_event(event_data)
 
+    def enforce_size_limit(self):
+        """Evicts cached items until the queue caches are within the size limit."""
+        if self.size <= self._size_limit:
+            return
+        now = time.monotonic()
+        by_age = sorted(self.queues.items(), key=lambda item: item[1].last_used)
+        # Idle queues are dropped first, they are refilled on their next read
+        for queue_id, queue in by_age:
+            if now - queue.last_used < QUEUE_IDLE_TIME:
+                break
+            if queue.size and not queue.windows:
+                LOGGER.debug(f"Evicting idle queue {queue_id} from cache.")
+                queue.clear()
+            if self.size <= self._size_limit:
+                return
+        # Then the pages holding the largest encoded images
+        image_pages = [
+            (queue.page_image_size(page), queue, page)
+            for queue in self.queues.values()
+            for page in queue.distant_pages()
+        ]
+        image_pages.sort(key=lambda item: item[0], reverse=True)
+        for image_size, queue, page in image_pages:
+            if not image_size:
+                break
+            queue.drop_page(page)
+            if self.size <= self._size_limit:
+                return
+        # Finally any page outside the current one, least recently used queues first
+        for _, queue in by_age:
+            for page in queue.distant_pages():
+                queue.drop_page(page)
+                if self.size <= self._size_limit:
+                    return
+
+    def get_cache_info(self) -> dict:
+        """Returns the size of the queue caches."""
+        now = time.monotonic()
+        return {
+            "size": self.size,
+            "size_limit": self._size_limit,
+            "image_size": sum(queue.image_size for queue in self.queues.values()),
+            "queues": {
+                queue_id: {
+                    "size": queue.size,
+                    "image_size": queue.image_size,
+                    "cached_items": len(queue.known_items()),
+                    "items": queue.items_count,
+                    "idle_time": round(now - queue.last_used),
+                    "stale": queue.stale,
+                }
+                for queue_id, queue in self.queues.items()
+            },
+        }
+
+    def to_snapshot(self) -> dict:
+        """Returns all cached queues in a compact form for storage."""
+        return {
+            "queues": {
+                queue_id: queue.to_snapshot()
+                for queue_id, queue in self.queues.items()
+                if queue.size
+            },
+        }
+
+    def restore(self, snapshot: dict) -> int:
+        """Adds the stored queues still known to Music Assistant, returning the count."""
+        restored = {}
+        for queue_id, data in snapshot["queues"].items():
+            state = self._client.player_queues.get(queue_id)
+            if queue_id in self.queues or state is None:
+                continue
+            queue = CachedQueue.from_snapshot(data)
+            queue.set_state(state.items, state.current_index)
+            restored[queue_id] = queue
+        # Only added once every queue was read, so a bad snapshot adds nothing
+        self.queues.update(restored)
+        self.enforce_size_limit()
+        return len(restored)
+
+    def items_changed(self, queue_id: str, items_count: int | None) -> bool:
+        """Returns whether the cached items may be out of date for the item count."""
+        queue = self.queues.get(queue_id)
+        if queue is None or items_count is None or queue.stale:
+            return True
+        return queue.items_count != items_count
+
     def send_ha_event(self, event_data):
         """Send event to Home Assistant."""
         LOGGER.debug(
@@ -365,46 +1458,63 @@ class Queues:
         )
         self._hass.bus.async_fire(MASS_QUEUE_EVENT_DOMAIN, event_data)
 
-    async def process_image_single_item(self, queue_item: dict):
-        """Processes the images from a single item."""
-        media_image = find_image(queue_item)
-        if media_image:
-            queue_item["media_image"] = media_image
+    async def process_image_single_item(
+        self,
+        queue_item: dict,
+        cached_item: QueueItemRecord | None = None,
+    ) -> QueueItemRecord:
+        """Builds the cached record of a single item, processing its images."""
+        record = QueueItemRecord.from_dict(queue_item)
+        if record.image:
+            return record
+        if cached_item and cached_item.local_image:
+            # Already downloaded while processing an earlier version of the queue
+            record.local_image = cached_item.local_image
+        elif self._download_local:
+            try:
+                LOGGER.debug("Expected to download locally.")
+                img_data = queue_item["media_item"]["metadata"]["images"][0]
+                LOGGER.debug(f"Downloading image {img_data}")
+                record.local_image = await download_single_image_from_image_data(
+                    img_data,
+                    self._client,
+                    self._hass,
+                    size=self._local_image_size,
+                    image_format=self._local_image_format,
+                )
+                LOGGER.debug("Downloaded and setting")
+            except Exception as e:  # noqa: BLE001
+                LOGGER.debug(
+                    f"Received error {e} when downloading image for queue item: {queue_item}",
+                )
         else:
-            queue_item["media_image"] = ""
-            if self._download_local:
-                try:
-                    LOGGER.debug("Expected to download locally.")
-                    img_data = queue_item["media_item"]["metadata"]["images"][0]
-                    url = generate_image_url_from_image_data(img_data, self._client)
-                    LOGGER.debug(f"Downloading URL {url}")
-                    result = await download_and_encode_image(url, self._hass)
-                    LOGGER.debug("Downloaded and setting")
-                    queue_item["local_image_encoded"] = result
-                except Exception as e:  # noqa: BLE001
-                    LOGGER.debug(
-                        f"Received error {e} when downloading image for queue item: {queue_item}",
-                    )
-            else:
-                LOGGER.debug("No media image found but not expected to download.")
-        return queue_item
+            LOGGER.debug("No media image found but not expected to download.")
+        return record
 
-    async def _process_queue_images(self, queue_items: list, queue_id: str):
-        """Helper to process all images in a given queue."""
+    async def process_items(
+        self,
+        queue_id: str,
+        queue_items: list,
+    ) -> list[QueueItemRecord]:
+        """Builds the records of fetched items, reusing cached records of unchanged items."""
+        queue = self.queues.get(queue_id)
+        known = queue.known_items() if queue is not None else {}
         items = [item if type(item) is dict else item.to_dict() for item in queue_items]
         try:
             result = await asyncio.gather(
-                *[self.process_image_single_item(item) for item in items],
+                *[
+                    self.process_image_single_item(
+                        item,
+                        known.get(item["queue_item_id"]),
+                    )
+                    for item in items
+                ],
             )
-        except:  # noqa: E722
+        except Exception:  # noqa: BLE001
             LOGGER.error(f"Unable to process queue items {items}!")
-            result = items
-        self.queues[queue_id] = result
-        return result
-
-    @callback
-    def process_queue_images(self, queue_items: list, queue_id: str):
-        """Processes all images in a given queue."""
-        loop = self._hass.loop
-        LOGGER.debug(f"Processing queue: {queue_items}")
-        loop.create_task(self._process_queue_images(queue_items, queue_id))
+            result = [QueueItemRecord.from_dict(item) for item in items]
+        # Unchanged items keep their cached record so derived data stays valid
+        return [
+            cached if (cached := known.get(record.queue_item_id)) == record else record
+            for record in result
+        ]
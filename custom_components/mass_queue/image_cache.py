@@ -0,0 +1,141 @@
+"""Disk cache for downloaded images."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from homeassistant.helpers.singleton import singleton
+
+from .const import DOMAIN, IMAGE_CACHE_SIZE_LIMIT, LOGGER
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+DATA_IMAGE_CACHE = f"{DOMAIN}_image_cache"
+
+
+class ImageDiskCache:
+    """Content-addressed cache of downloaded images stored in the config directory."""
+
+    def __init__(self, hass: HomeAssistant, size_limit: int = IMAGE_CACHE_SIZE_LIMIT):
+        """Initialize class."""
+        self._hass = hass
+        self._path = Path(hass.config.path(DOMAIN, "images"))
+        self._size_limit = size_limit * 1024 * 1024
+        # Maps keys to file sizes, least recently used first
+        self._index: OrderedDict[str, int] = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(*parts) -> str:
+        """Returns the cache key for the parts identifying an image."""
+        joined = "|".join(str(part) for part in parts)
+        return hashlib.sha256(joined.encode()).hexdigest()
+
+    def __contains__(self, key: str) -> bool:
+        """Returns whether an image is cached."""
+        return key in self._index
+
+    def __len__(self) -> int:
+        """Returns the number of cached images."""
+        return len(self._index)
+
+    async def async_load(self):
+        """Loads the index of images already cached on disk."""
+        entries = await self._hass.async_add_executor_job(self._scan)
+        for key, size in entries:
+            self._index[key] = size
+            self.size += size
+        LOGGER.debug(f"Loaded {len(self._index)} cached images ({self.size} bytes).")
+        await self._async_evict()
+
+    def _scan(self) -> list[tuple[str, int]]:
+        """Returns the cached files and their sizes, least recently used first."""
+        self._path.mkdir(parents=True, exist_ok=True)
+        entries = []
+        with os.scandir(self._path) as files:
+            for file in files:
+                if not file.is_file() or file.name.endswith(".tmp"):
+                    continue
+                stat = file.stat()
+                entries.append((stat.st_mtime, file.name, stat.st_size))
+        entries.sort()
+        return [(name, size) for _, name, size in entries]
+
+    async def async_get(self, key: str) -> bytes | None:
+        """Returns a cached image, if present."""
+        if key not in self._index:
+            self.misses += 1
+            return None
+        try:
+            data = await self._hass.async_add_executor_job(self._read, key)
+        except OSError as e:
+            LOGGER.debug(f"Unable to read cached image {key}: {e}")
+            self._forget(key)
+            self.misses += 1
+            return None
+        if key in self._index:
+            self._index.move_to_end(key)
+        self.hits += 1
+        return data
+
+    def _read(self, key: str) -> bytes:
+        """Reads a cached image and marks it as recently used."""
+        path = self._path / key
+        data = path.read_bytes()
+        os.utime(path)
+        return data
+
+    async def async_set(self, key: str, data: bytes):
+        """Stores an image in the cache."""
+        try:
+            await self._hass.async_add_executor_job(self._write, key, data)
+        except OSError as e:
+            LOGGER.debug(f"Unable to cache image {key}: {e}")
+            return
+        self._forget(key)
+        self._index[key] = len(data)
+        self.size += len(data)
+        await self._async_evict()
+
+    def _write(self, key: str, data: bytes):
+        """Writes an image to disk, replacing any previous version."""
+        path = self._path / key
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+
+    def _forget(self, key: str):
+        """Removes an image from the index."""
+        if (size := self._index.pop(key, None)) is not None:
+            self.size -= size
+
+    async def _async_evict(self):
+        """Removes the least recently used images until within the size limit."""
+        evicted = []
+        while self.size > self._size_limit and self._index:
+            key = next(iter(self._index))
+            self._forget(key)
+            evicted.append(key)
+        if evicted:
+            LOGGER.debug(f"Evicting {len(evicted)} cached images.")
+            await self._hass.async_add_executor_job(self._delete, evicted)
+
+    def _delete(self, keys: list[str]):
+        """Deletes images from disk."""
+        for key in keys:
+            (self._path / key).unlink(missing_ok=True)
+
+
+@singleton(DATA_IMAGE_CACHE)
+async def async_get_image_cache(hass: HomeAssistant) -> ImageDiskCache:
+    """Returns the image cache, loading its index on first use."""
+    cache = ImageDiskCache(hass)
+    await cache.async_load()
+    return cache
@@ -0,0 +1,152 @@
+"""Cache for album, artist, playlist and podcast details."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from .const import LOGGER, METADATA_CACHE_SIZE, METADATA_CACHE_TTL
+from .utils import SingleFlight, parse_uri
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from music_assistant_models.media_items import ProviderMapping
+
+
+def media_item_keys(media_item: dict) -> set[tuple[str, str]]:
+    """Returns the provider and item ID pairs a media item is known by."""
+    keys = set()
+    if uri := media_item.get("uri"):
+        keys.add(tuple(parse_uri(uri)))
+    if (item_id := media_item.get("item_id")) is not None:
+        keys.add((media_item.get("provider"), str(item_id)))
+    for mapping in media_item.get("provider_mappings") or []:
+        keys.add((mapping.get("provider_domain"), str(mapping.get("item_id"))))
+        keys.add((mapping.get("provider_instance"), str(mapping.get("item_id"))))
+    return keys
+
+
+class MetadataEntry:
+    """A cached media item and the provider mapping resolved from it."""
+
+    __slots__ = ("expires", "item", "keys", "mapping")
+
+    def __init__(self, item: Any, keys: set[tuple[str, str]], expires: float):
+        """Initialize class."""
+        self.item = item
+        self.keys = keys
+        self.expires = expires
+        self.mapping: ProviderMapping | None = None
+
+
+class MetadataCache:
+    """Caches media item details by URI until they expire or Music Assistant updates them."""
+
+    def __init__(
+        self,
+        size_limit: int = METADATA_CACHE_SIZE,
+        ttl: float = METADATA_CACHE_TTL,
+    ):
+        """Initialize class."""
+        self._size_limit = size_limit
+        self._ttl = ttl
+        # Maps URIs to entries, least recently used first
+        self._entries: OrderedDict[str, MetadataEntry] = OrderedDict()
+        # Maps the provider and item IDs of cached items to the URIs they are cached by
+        self._aliases: dict[tuple[str, str], set[str]] = {}
+        self._requests = SingleFlight()
+        self._invalidations = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Returns the number of cached items."""
+        return len(self._entries)
+
+    async def get(self, uri: str, fetch: Callable[[str], Awaitable[Any]]) -> Any:
+        """Returns the details for a URI, fetching them if not cached."""
+        return (await self._get_entry(uri, fetch)).item
+
+    async def get_provider_mapping(
+        self,
+        uri: str,
+        fetch: Callable[[str], Awaitable[Any]],
+    ) -> ProviderMapping | None:
+        """Returns the first provider mapping of the item for a URI."""
+        entry = await self._get_entry(uri, fetch)
+        if entry.mapping is None:
+            mappings = list(entry.item.provider_mappings)
+            entry.mapping = mappings[0] if mappings else None
+        return entry.mapping
+
+    async def _get_entry(
+        self,
+        uri: str,
+        fetch: Callable[[str], Awaitable[Any]],
+    ) -> MetadataEntry:
+        """Returns the cached entry for a URI, fetching it if missing or expired."""
+        entry = self._entries.get(uri)
+        if entry is not None and entry.expires > time.monotonic():
+            self._entries.move_to_end(uri)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return await self._requests.run(uri, self._fetch, uri, fetch)
+
+    async def _fetch(
+        self,
+        uri: str,
+        fetch: Callable[[str], Awaitable[Any]],
+    ) -> MetadataEntry:
+        """Fetches and caches the details for a URI."""
+        invalidations = self._invalidations
+        item = await fetch(uri)
+        keys = media_item_keys(item.to_dict())
+        keys.add(tuple(parse_uri(uri)))
+        entry = MetadataEntry(item, keys, time.monotonic() + self._ttl)
+        if self._invalidations != invalidations:
+            # Updated while fetching, so this version may already be out of date
+            return entry
+        self._forget(uri)
+        self._entries[uri] = entry
+        for key in keys:
+            self._aliases.setdefault(key, set()).add(uri)
+        while len(self._entries) > self._size_limit:
+            self._forget(next(iter(self._entries)))
+        return entry
+
+    def _forget(self, uri: str):
+        """Removes the entry for a URI."""
+        if (entry := self._entries.pop(uri, None)) is None:
+            return
+        for key in entry.keys:
+            uris = self._aliases.get(key)
+            if uris is None:
+                continue
+            uris.discard(uri)
+            if not uris:
+                del self._aliases[key]
+
+    def invalidate(self, media_item: dict):
+        """Drops every entry for a media item."""
+        self._invalidations += 1
+        uris = set()
+        for key in media_item_keys(media_item):
+            uris.update(self._aliases.get(key, ()))
+        if uris:
+            LOGGER.debug(f"Invalidating cached details for {uris}.")
+        for uri in uris:
+            self._forget(uri)
+
+    def on_media_item_event(self, event):
+        """Callback when a media item is updated or deleted."""
+        if isinstance(event.object_id, str) and "://" in event.object_id:
+            self.invalidate({"uri": event.object_id})
+        if isinstance(event.data, dict):
+            self.invalidate(event.data)
+
+    def get_cache_info(self) -> dict:
+        """Returns the size and hit rate of the cache."""
+        return {"items": len(self._entries), "hits": self.hits, "misses": self.misses}
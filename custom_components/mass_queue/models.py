@@ -0,0 +1,182 @@
+"""Compact models for cached data."""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from .const import (
+    ATTR_FAVORITE,
+    ATTR_LOCAL_IMAGE_ENCODED,
+    ATTR_MEDIA_ALBUM_NAME,
+    ATTR_MEDIA_ARTIST,
+    ATTR_MEDIA_CONTENT_ID,
+    ATTR_MEDIA_IMAGE,
+    ATTR_MEDIA_TITLE,
+    ATTR_QUEUE_ITEM_ID,
+)
+from .schemas import QUEUE_ITEM_SCHEMA
+from .utils import find_image, validate_response
+
+
+class QueueItemRecord:
+    """Compact representation of a cached queue item."""
+
+    __slots__ = (
+        "album",
+        "artists",
+        "duration",
+        "favorite",
+        "image",
+        "local_image",
+        "queue_item_id",
+        "title",
+        "uri",
+    )
+
+    def __init__(
+        self,
+        queue_item_id: str,
+        title: str,
+        album: str,
+        artists: str,
+        uri: str,
+        image: str,
+        favorite: bool,
+        duration: int | None,
+        local_image: str | None = None,
+    ):
+        """Initialize class."""
+        self.queue_item_id = queue_item_id
+        self.title = title
+        self.album = album
+        self.artists = artists
+        self.uri = uri
+        self.image = image
+        self.favorite = favorite
+        self.duration = duration
+        self.local_image = local_image
+
+    @classmethod
+    def from_dict(cls, queue_item: dict) -> QueueItemRecord:
+        """Builds a record from the dict form of a queue item."""
+        media = queue_item.get("media_item") or {}
+        album = media.get("album") or {}
+        artists = media.get("artists") or []
+        return cls(
+            queue_item_id=queue_item["queue_item_id"],
+            title=media.get("name") or queue_item.get("name") or "",
+            album=album.get("name", ""),
+            artists=", ".join(artist["name"] for artist in artists),
+            uri=media.get("uri") or "",
+            image=find_image(queue_item) or "",
+            favorite=media.get("favorite", False),
+            duration=queue_item.get("duration"),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Returns whether both records hold the same item data."""
+        if not isinstance(other, QueueItemRecord):
+            return NotImplemented
+        return all(
+            getattr(self, slot) == getattr(other, slot) for slot in self.__slots__
+        )
+
+    __hash__ = None
+
+    def to_snapshot(self) -> list:
+        """Returns the record as a list for storage, without the encoded image."""
+        return [
+            self.queue_item_id,
+            self.title,
+            self.album,
+            self.artists,
+            self.uri,
+            self.image,
+            self.favorite,
+            self.duration,
+        ]
+
+    @classmethod
+    def from_snapshot(cls, data: list) -> QueueItemRecord:
+        """Builds a record from its stored form."""
+        return cls(*data)
+
+    def to_response(self) -> dict:
+        """Formats the record for a service response."""
+        response = {
+            ATTR_QUEUE_ITEM_ID: self.queue_item_id,
+            ATTR_MEDIA_TITLE: self.title,
+            ATTR_MEDIA_ALBUM_NAME: self.album,
+            ATTR_MEDIA_ARTIST: self.artists,
+            ATTR_MEDIA_CONTENT_ID: self.uri,
+            ATTR_MEDIA_IMAGE: self.image,
+            ATTR_FAVORITE: self.favorite,
+        }
+        if self.local_image:
+            response[ATTR_LOCAL_IMAGE_ENCODED] = self.local_image
+        return validate_response(QUEUE_ITEM_SCHEMA, response)
+
+    @property
+    def image_size(self) -> int:
+        """Returns the size of the encoded local image in bytes."""
+        return len(self.local_image or "")
+
+    @property
+    def size(self) -> int:
+        """Returns the approximate memory used by the record in bytes."""
+        return sys.getsizeof(self) + sum(
+            sys.getsizeof(getattr(self, slot)) for slot in self.__slots__
+        )
+
+
+class QueueState:
+    """Playback state of a queue, kept current from Music Assistant events."""
+
+    __slots__ = (
+        "current_index",
+        "current_item",
+        "elapsed_time",
+        "elapsed_time_last_updated",
+        "index_in_buffer",
+        "items",
+        "next_item",
+        "queue_id",
+        "repeat_mode",
+        "shuffle_enabled",
+        "state",
+        "updated",
+    )
+
+    def __init__(self, queue_id: str):
+        """Initialize class."""
+        self.queue_id = queue_id
+        self.current_index: int | None = None
+        self.current_item: dict | None = None
+        self.next_item: dict | None = None
+        self.index_in_buffer: int | None = None
+        self.items = 0
+        self.shuffle_enabled = False
+        self.repeat_mode: str | None = None
+        self.state: str | None = None
+        self.elapsed_time = 0.0
+        self.elapsed_time_last_updated = 0.0
+        self.updated = 0.0
+
+    def update(self, queue_data: dict):
+        """Updates the state from the dict form of a player queue."""
+        for slot in self.__slots__:
+            if slot in queue_data and slot not in ("queue_id", "updated"):
+                setattr(self, slot, queue_data[slot])
+        self.updated = time.monotonic()
+
+    def update_elapsed_time(self, elapsed_time: float):
+        """Updates the elapsed time of the current item."""
+        self.elapsed_time = elapsed_time
+        self.elapsed_time_last_updated = time.time()
+        self.updated = time.monotonic()
+
+    @property
+    def age(self) -> float:
+        """Returns the seconds since the state was last updated."""
+        return time.monotonic() - self.updated
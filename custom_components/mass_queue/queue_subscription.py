@@ -0,0 +1,148 @@
+"""Push updates of a queue window to websocket subscribers."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+
+from .const import ATTR_QUEUE_ITEM_ID, LOGGER
+
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+    from .controller import MassQueueController
+
+
+def diff_queue_window(
+    old_rows: list[dict],
+    new_rows: list[dict],
+    offset: int,
+) -> list[dict]:
+    """Returns the changes turning one window of queue items into another, in order."""
+    new_ids = {row[ATTR_QUEUE_ITEM_ID] for row in new_rows}
+    old_by_id = {row[ATTR_QUEUE_ITEM_ID]: row for row in old_rows}
+    changes = [
+        {"op": "remove", ATTR_QUEUE_ITEM_ID: queue_item_id}
+        for queue_item_id in old_by_id
+        if queue_item_id not in new_ids
+    ]
+    current = [
+        row[ATTR_QUEUE_ITEM_ID]
+        for row in old_rows
+        if row[ATTR_QUEUE_ITEM_ID] in new_ids
+    ]
+    for index, row in enumerate(new_rows):
+        queue_item_id = row[ATTR_QUEUE_ITEM_ID]
+        old_row = old_by_id.get(queue_item_id)
+        if old_row is None:
+            current.insert(index, queue_item_id)
+            changes.append({"op": "insert", "position": offset + index, "item": row})
+            continue
+        if current[index] != queue_item_id:
+            current.remove(queue_item_id)
+            current.insert(index, queue_item_id)
+            changes.append(
+                {
+                    "op": "move",
+                    ATTR_QUEUE_ITEM_ID: queue_item_id,
+                    "position": offset + index,
+                },
+            )
+        # Unchanged items keep their formatted row, so most rows are skipped by identity
+        if row is not old_row and row != old_row:
+            changes.append({"op": "update", "item": row})
+    return changes
+
+
+class QueueSubscription:
+    """Sends a window around the current item of a queue, then the changes to it."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        controller: MassQueueController,
+        queue_id: str,
+        limit_before: int,
+        limit_after: int,
+        send: Callable[[dict], None],
+    ):
+        """Initialize class."""
+        self._hass = hass
+        self._controller = controller
+        self._queue_id = queue_id
+        self._limit_before = limit_before
+        self._limit_after = limit_after
+        self._send = send
+        self._rows: list[dict] | None = None
+        self._current_index: int | None = None
+        self._task: asyncio.Task | None = None
+        self._dirty = False
+        self._remove_listener: Callable[[], None] | None = None
+
+    async def async_start(self):
+        """Sends the initial window and starts listening for changes."""
+        self._remove_listener = self._controller.async_add_queue_listener(
+            self._queue_id,
+            self._schedule,
+        )
+        await self._update()
+
+    @callback
+    def async_stop(self):
+        """Stops listening for changes."""
+        if self._remove_listener is not None:
+            self._remove_listener()
+            self._remove_listener = None
+        if self._task is not None:
+            self._task.cancel()
+        if (queue := self._controller.queues.get(self._queue_id)) is not None:
+            queue.remove_window(self)
+
+    @callback
+    def _schedule(self):
+        """Updates the window, once more if it changes again while updating."""
+        if self._task is not None and not self._task.done():
+            self._dirty = True
+            return
+        self._task = self._hass.loop.create_task(self._run())
+
+    async def _run(self):
+        """Updates the window until no further changes were reported."""
+        self._dirty = True
+        while self._dirty:
+            self._dirty = False
+            try:
+                await self._update()
+            except Exception as e:  # noqa: BLE001
+                LOGGER.error(f"Unable to update subscription to {self._queue_id}: {e}")
+
+    async def _update(self):
+        """Sends the window, or the changes since it was last sent."""
+        queue = self._controller.queues.get_or_add(self._queue_id)
+        current_index = queue.current_index
+        offset = max(current_index - self._limit_before, 0)
+        limit = current_index - offset + self._limit_after + 1
+        queue.set_window(self, offset, offset + limit)
+        records = await self._controller.player_queue(self._queue_id, limit, offset)
+        rows = self._controller.format_queue_items(records)
+        if self._rows is None:
+            self._send(
+                {
+                    "type": "snapshot",
+                    "offset": offset,
+                    "current_index": current_index,
+                    "items": rows,
+                },
+            )
+        else:
+            changes = diff_queue_window(self._rows, rows, offset)
+            if current_index != self._current_index:
+                changes.append({"op": "current_index", "current_index": current_index})
+            if changes:
+                self._send({"type": "changes", "offset": offset, "changes": changes})
+        self._rows = rows
+        self._current_index = current_index
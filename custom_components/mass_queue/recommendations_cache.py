@@ -0,0 +1,87 @@
+"""Cache for formatted recommendations."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from .const import LOGGER, RECOMMENDATIONS_TTL
+from .utils import process_recommendations
+
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Awaitable, Callable
+
+    from homeassistant.core import HomeAssistant
+
+
+class RecommendationsCache:
+    """Formatted recommendations, served while stale and refreshed in the background."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        fetch: Callable[[], Awaitable[list]],
+        ttl: float = RECOMMENDATIONS_TTL,
+    ):
+        """Initialize class."""
+        self._hass = hass
+        self._fetch = fetch
+        self._ttl = ttl
+        self._sections: list[dict] | None = None
+        # Sections for each requested set of providers, in the order of `_sections`
+        self._filtered: dict[tuple[str, ...], list[dict]] = {}
+        self._updated = 0.0
+        # Failed refreshes are only retried once the cached sections go stale again
+        self._attempted = 0.0
+        self._task: asyncio.Task | None = None
+
+    async def get(self, providers: list | None = None) -> list[dict]:
+        """Returns the recommendations of the providers starting with `providers`."""
+        if self._sections is None:
+            await self._refresh()
+        elif time.monotonic() - self._attempted > self._ttl:
+            self._refresh()
+        key = tuple(sorted(providers)) if providers else ()
+        if (sections := self._filtered.get(key)) is None:
+            sections = [
+                section
+                for section in self._sections
+                if any(section["provider"].startswith(provider) for provider in key)
+            ]
+            self._filtered[key] = sections
+        return sections
+
+    def _refresh(self) -> asyncio.Task:
+        """Starts refreshing the recommendations, unless already refreshing."""
+        if self._task is None or self._task.done():
+            self._task = self._hass.loop.create_task(self._run())
+        return self._task
+
+    async def _run(self):
+        """Fetches and formats the recommendations of all providers."""
+        LOGGER.debug("Refreshing recommendations.")
+        self._attempted = time.monotonic()
+        try:
+            recs = await self._fetch()
+        except Exception as e:
+            if self._sections is None:
+                raise
+            LOGGER.error(f"Unable to refresh recommendations, keeping cached: {e}")
+            return
+        sections = process_recommendations(recs)
+        self._sections = sections
+        self._filtered = {(): sections}
+        self._updated = time.monotonic()
+
+    def cancel(self):
+        """Cancels a refresh in progress."""
+        if self._task is not None:
+            self._task.cancel()
+
+    def get_cache_info(self) -> dict:
+        """Returns the number of cached sections and their age."""
+        return {
+            "sections": len(self._sections) if self._sections is not None else 0,
+            "age": round(time.monotonic() - self._updated) if self._updated else None,
+        }
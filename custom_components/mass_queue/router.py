@@ -0,0 +1,96 @@
+"""Routing of player entities to the integration handling them."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.core import Event, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.singleton import singleton
+
+from .const import DOMAIN, LOGGER
+from .utils import get_mass_queue_entry, get_player_id
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .actions import MassQueueActions
+
+DATA_ENTITY_ROUTER = f"{DOMAIN}_entity_router"
+
+
+class EntityRoute:
+    """The actions and Music Assistant player of a single entity."""
+
+    __slots__ = ("actions", "entity_id", "player_id")
+
+    def __init__(self, actions: MassQueueActions, entity_id: str, player_id: str):
+        """Initialize class."""
+        self.actions = actions
+        self.entity_id = entity_id
+        self.player_id = player_id
+
+    @property
+    def queue_id(self) -> str | None:
+        """Returns the active queue of the player."""
+        return self.actions.get_player_queue_id(self.player_id, self.entity_id)
+
+
+class EntityRouter:
+    """Maps player entities to their routes without searching the registries each call."""
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize class."""
+        self._hass = hass
+        self._routes: dict[str, EntityRoute] = {}
+
+    def get(self, entity_id: str) -> EntityRoute:
+        """Returns the route for an entity, resolving it on first use."""
+        if (route := self._routes.get(entity_id)) is not None:
+            return route
+        LOGGER.debug(f"Resolving route for {entity_id}.")
+        entry = get_mass_queue_entry(self._hass, entity_id)
+        route = EntityRoute(
+            entry.runtime_data.actions,
+            entity_id,
+            get_player_id(self._hass, entity_id),
+        )
+        self._routes[entity_id] = route
+        return route
+
+    @callback
+    def async_on_registry_updated(self, event: Event) -> None:
+        """Drops the routes of renamed, moved or removed entities."""
+        self._routes.pop(event.data["entity_id"], None)
+        if (old_entity_id := event.data.get("old_entity_id")) is not None:
+            self._routes.pop(old_entity_id, None)
+
+    def remove_actions(self, actions: MassQueueActions):
+        """Drops the routes handled by unloaded actions."""
+        self._routes = {
+            entity_id: route
+            for entity_id, route in self._routes.items()
+            if route.actions is not actions
+        }
+
+
+@singleton(DATA_ENTITY_ROUTER)
+@callback
+def get_entity_router(hass: HomeAssistant) -> EntityRouter:
+    """Returns the entity router, listening for registry updates on first use."""
+    router = EntityRouter(hass)
+    hass.bus.async_listen(
+        er.EVENT_ENTITY_REGISTRY_UPDATED,
+        router.async_on_registry_updated,
+    )
+    return router
+
+
+def get_entity_route(hass: HomeAssistant, entity_id: str) -> EntityRoute:
+    """Gets the route for the selected entity."""
+    return get_entity_router(hass).get(entity_id)
+
+
+def get_entity_actions_controller(hass: HomeAssistant, entity_id: str):
+    """Gets the actions for the selected entity."""
+    return get_entity_route(hass, entity_id).actions
@@ -6,6 +6,8 @@ import voluptuous as vol
 from homeassistant.helpers import config_validation as cv
 
 from .const import (
+    ATTR_ACTION,
+    ATTR_ALL_PAGES,
     ATTR_COMMAND,
     ATTR_CONFIG_ENTRY_ID,
     ATTR_DATA,
@@ -21,6 +23,7 @@ from .const import (
     ATTR_MEDIA_IMAGE,
     ATTR_MEDIA_TITLE,
     ATTR_OFFSET,
+    ATTR_OPERATIONS,
     ATTR_PAGE,
     ATTR_PLAYER_ENTITY,
     ATTR_PLAYLIST_ID,
@@ -31,6 +34,7 @@ from .const import (
     ATTR_QUEUE_ITEMS,
     ATTR_URI,
     ATTR_VOLUME_LEVEL,
+    QUEUE_EDIT_ACTIONS,
 )
 
 CLEAR_QUEUE_FROM_HERE_SERVICE_SCHEMA = vol.Schema(
@@ -96,6 +100,22 @@ PLAY_QUEUE_ITEM_SERVICE_SCHEMA = vol.Schema(
         vol.Required(ATTR_QUEUE_ITEM_ID): str,
     },
 )
+BATCH_EDIT_QUEUE_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_PLAYER_ENTITY): str,
+        vol.Required(ATTR_OPERATIONS): vol.All(
+            cv.ensure_list,
+            [
+                vol.Schema(
+                    {
+                        vol.Required(ATTR_ACTION): vol.In(QUEUE_EDIT_ACTIONS),
+                        vol.Required(ATTR_QUEUE_ITEM_ID): str,
+                    },
+                ),
+            ],
+        ),
+    },
+)
 REMOVE_QUEUE_ITEM_SERVICE_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_PLAYER_ENTITY): str,
@@ -134,6 +154,19 @@ GET_TRACKS_SERVICE_SCHEMA = vol.Schema(
         vol.Required(ATTR_CONFIG_ENTRY_ID): str,
         vol.Required(ATTR_URI): str,
         vol.Optional(ATTR_PAGE): int,
+        vol.Optional(ATTR_OFFSET, default=0): vol.All(int, vol.Range(min=0)),
+        vol.Optional(ATTR_LIMIT): vol.All(int, vol.Range(min=1)),
+    },
+)
+
+GET_PLAYLIST_TRACKS_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): str,
+        vol.Required(ATTR_URI): str,
+        vol.Optional(ATTR_PAGE): int,
+        vol.Optional(ATTR_ALL_PAGES, default=False): bool,
+        vol.Optional(ATTR_OFFSET, default=0): vol.All(int, vol.Range(min=0)),
+        vol.Optional(ATTR_LIMIT): vol.All(int, vol.Range(min=1)),
     },
 )
 
@@ -9,15 +9,18 @@ from homeassistant.core import (
 )
 
 from .const import (
+    ATTR_ALL_PAGES,
     ATTR_CONFIG_ENTRY_ID,
+    ATTR_LIMIT,
+    ATTR_OFFSET,
     ATTR_PAGE,
     ATTR_PLAYER_ENTITY,
     ATTR_PLAYLIST_ID,
     ATTR_POSITIONS_TO_REMOVE,
-    ATTR_QUEUE_ITEM_ID,
     ATTR_URI,
     DOMAIN,
     LOGGER,
+    SERVICE_BATCH_EDIT_QUEUE,
     SERVICE_CLEAR_QUEUE_FROM_HERE,
     SERVICE_GET_ALBUM,
     SERVICE_GET_ALBUM_TRACKS,
@@ -40,10 +43,13 @@ from .const import (
     SERVICE_SET_GROUP_VOLUME,
     SERVICE_UNFAVORITE_CURRENT_ITEM,
 )
+from .router import get_entity_actions_controller
 from .schemas import (
+    BATCH_EDIT_QUEUE_SERVICE_SCHEMA,
     CLEAR_QUEUE_FROM_HERE_SERVICE_SCHEMA,
     GET_DATA_SERVICE_SCHEMA,
     GET_GROUP_VOLUME_SERVICE_SCHEMA,
+    GET_PLAYLIST_TRACKS_SERVICE_SCHEMA,
     GET_PODCAST_EPISODES_SERVICE_SCHEMA,
     GET_RECOMMENDATIONS_SERVICE_SCHEMA,
     GET_TRACKS_SERVICE_SCHEMA,
@@ -58,7 +64,6 @@ from .schemas import (
     SET_GROUP_VOLUME_SERVICE_SCHEMA,
     UNFAVORITE_CURRENT_ITEM_SERVICE_SCHEMA,
 )
-from .utils import get_entity_actions_controller, process_recommendations
 
 
 @callback
@@ -71,6 +76,13 @@ def register_actions(hass) -> None:
         schema=QUEUE_ITEMS_SERVICE_SCHEMA,
         supports_response=SupportsResponse.ONLY,
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BATCH_EDIT_QUEUE,
+        batch_edit_queue,
+        schema=BATCH_EDIT_QUEUE_SERVICE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
     hass.services.async_register(
         DOMAIN,
         SERVICE_MOVE_QUEUE_ITEM_DOWN,
@@ -146,13 +158,13 @@ def register_actions(hass) -> None:
         SERVICE_CLEAR_QUEUE_FROM_HERE,
         clear_queue_from_here,
         schema=CLEAR_QUEUE_FROM_HERE_SERVICE_SCHEMA,
-        supports_response=SupportsResponse.NONE,
+        supports_response=SupportsResponse.OPTIONAL,
     )
     hass.services.async_register(
         DOMAIN,
         SERVICE_GET_PLAYLIST_TRACKS,
         get_playlist_tracks,
-        schema=GET_TRACKS_SERVICE_SCHEMA,
+        schema=GET_PLAYLIST_TRACKS_SERVICE_SCHEMA,
         supports_response=SupportsResponse.ONLY,
     )
     hass.services.async_register(
@@ -229,6 +241,14 @@ async def move_queue_item_down(call: ServiceCall):
     return await actions.move_queue_item_down(call)
 
 
+async def batch_edit_queue(call: ServiceCall):
+    """Service wrapper to edit multiple queue items."""
+    entity_id = call.data[ATTR_PLAYER_ENTITY]
+    hass = call.hass
+    actions = get_entity_actions_controller(hass, entity_id)
+    return await actions.batch_edit_queue(call)
+
+
 async def move_queue_item_next(call: ServiceCall):
     """Service wrapper to move queue item next."""
     entity_id = call.data[ATTR_PLAYER_ENTITY]
@@ -284,7 +304,7 @@ async def get_recommendations(call: ServiceCall):
     hass = call.hass
     actions = get_entity_actions_controller(hass, entity_id)
     result = await actions.get_recommendations(call)
-    return {"response": process_recommendations(result)}
+    return {"response": result}
 
 
 async def get_group_volume(call: ServiceCall):
@@ -316,22 +336,9 @@ async def clear_queue_from_here(call: ServiceCall):
     entity_id = call.data[ATTR_PLAYER_ENTITY]
     hass = call.hass
     actions = get_entity_actions_controller(hass, entity_id)
-    current_idx = await actions.get_queue_index(entity_id)
-    LOGGER.debug(f"Current Index: {current_idx}")
     queue_id = actions.get_queue_id(entity_id)
     LOGGER.debug(f"Queue ID: {queue_id}")
-    queue = actions._controller.queues.get(queue_id)
-    LOGGER.debug(f"Queue length: {len(queue)}")
-    client = actions._client
-    if len(queue) == current_idx:
-        return
-    items = queue[current_idx + 1 :]
-    LOGGER.debug(f"Filtered length: {len(items)}")
-    LOGGER.debug(f"First item to remove {items[0]}")
-    LOGGER.debug(f"Last item to remove {items[-1]}")
-    for item in items:
-        queue_item_id = item[ATTR_QUEUE_ITEM_ID]
-        await client.player_queues.queue_command_delete(queue_id, queue_item_id)
+    return await actions.controller.clear_queue_after_current(queue_id)
 
 
 async def get_album_tracks(call: ServiceCall):
@@ -339,11 +346,13 @@ async def get_album_tracks(call: ServiceCall):
     config_entry = call.data[ATTR_CONFIG_ENTRY_ID]
     uri = call.data[ATTR_URI]
     page = call.data.get(ATTR_PAGE)
+    offset = call.data[ATTR_OFFSET]
+    limit = call.data.get(ATTR_LIMIT)
     hass = call.hass
     entry = hass.config_entries.async_get_entry(config_entry)
     actions = entry.runtime_data.actions
     return {
-        "tracks": await actions.get_album_tracks(uri, page),
+        "tracks": await actions.get_album_tracks(uri, page, offset, limit),
     }
 
 
@@ -351,11 +360,13 @@ async def get_artist_tracks(call: ServiceCall):
     """Gets all tracks for an artist."""
     config_entry = call.data[ATTR_CONFIG_ENTRY_ID]
     uri = call.data[ATTR_URI]
+    offset = call.data[ATTR_OFFSET]
+    limit = call.data.get(ATTR_LIMIT)
     hass = call.hass
     entry = hass.config_entries.async_get_entry(config_entry)
     actions = entry.runtime_data.actions
     return {
-        "tracks": await actions.get_artist_tracks(uri),
+        "tracks": await actions.get_artist_tracks(uri, offset=offset, limit=limit),
     }
 
 
@@ -364,11 +375,20 @@ async def get_playlist_tracks(call: ServiceCall):
     config_entry = call.data[ATTR_CONFIG_ENTRY_ID]
     uri = call.data[ATTR_URI]
     page = call.data.get(ATTR_PAGE)
+    offset = call.data[ATTR_OFFSET]
+    limit = call.data.get(ATTR_LIMIT)
+    all_pages = call.data[ATTR_ALL_PAGES]
     hass = call.hass
     entry = hass.config_entries.async_get_entry(config_entry)
     actions = entry.runtime_data.actions
     return {
-        "tracks": await actions.get_playlist_tracks(uri, page),
+        "tracks": await actions.get_playlist_tracks(
+            uri,
+            page,
+            offset,
+            limit,
+            all_pages,
+        ),
     }
 
 
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import inspect
+import io
 import urllib.parse
 from typing import TYPE_CHECKING
 
 from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_URL
 from homeassistant.core import callback
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import aiohttp_client
@@ -14,12 +18,31 @@ from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
     from homeassistant.core import HomeAssistant
     from music_assistant_client import MusicAssistantClient
 
     from . import MassQueueEntryData
 
-from .const import ATTR_QUEUE_ID, LOGGER
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+from .const import (
+    ATTR_QUEUE_ID,
+    DEFAULT_IMAGE_FORMAT,
+    IMAGE_DOWNLOAD_CONCURRENCY,
+    IMAGE_DOWNLOAD_TIMEOUT,
+    IMAGE_PROXY_SIZE,
+    IMAGE_SAVE_OPTIONS,
+    LOGGER,
+    TRACK_PAGE_CONCURRENCY,
+    TRACK_PAGE_MAX,
+    VALIDATE_RESPONSES,
+)
+from .image_cache import ImageDiskCache, async_get_image_cache
 
 
 @callback
@@ -45,12 +68,6 @@ def get_mass_queue_entry(hass, entity_id):
     return find_mass_queue_entry_from_unique_id(hass, unique_id)
 
 
-def get_entity_actions_controller(hass, entity_id):
-    """Gets the actions for the selected entity."""
-    mass_queue_entry = get_mass_queue_entry(hass, entity_id)
-    return mass_queue_entry.runtime_data.actions
-
-
 def get_mass_client(hass, entity_id):
     """Gets the actions for the selected entity."""
     mass_queue_entry = get_mass_queue_entry(hass, entity_id)
@@ -85,6 +102,25 @@ def _get_mass_queue_entries(hass):
     return [entry for entry in entries if entry.domain == "mass_queue"]
 
 
+def is_music_assistant_url(hass: HomeAssistant, url: str) -> bool:
+    """Returns whether a URL points to a configured Music Assistant server."""
+    location = urllib.parse.urlsplit(url)
+    if location.hostname is None:
+        return False
+    for entry in _get_mass_queue_entries(hass):
+        server = urllib.parse.urlsplit(entry.data.get(CONF_URL, ""))
+        if (server.hostname, server.port) == (location.hostname, location.port):
+            return True
+    return False
+
+
+def validate_response(schema, response: dict) -> dict:
+    """Validates an internally built response row when `VALIDATE_RESPONSES` is set."""
+    if VALIDATE_RESPONSES:
+        return schema(response)
+    return response
+
+
 def format_event_data_queue_item(queue_item):
     """Format event data results for usage by controller."""
     if queue_item is None:
@@ -109,6 +145,18 @@ def format_queue_updated_event_data(event: dict):
     return event_data
 
 
+def get_player_event_fields(event_data: dict, fields: list[str]) -> tuple:
+    """Returns the values of the watched fields of a player, ignoring elapsed time."""
+    values = []
+    for field in fields:
+        value = event_data.get(field)
+        if type(value) is dict:
+            # Media updates carry the elapsed time, which changes with every update
+            value = {k: v for k, v in value.items() if not k.startswith("elapsed_time")}
+        values.append(value)
+    return tuple(values)
+
+
 def get_queue_id_from_player_data(player_data):
     """Force as dict if not already."""
     data = player_data.to_dict() if type(player_data) is not dict else player_data
@@ -217,7 +265,6 @@ def _get_recommendation_item_image(item: dict):
 
 def process_recommendation_section_item(item: dict):
     """Process and reformat a single recommendation item."""
-    LOGGER.debug(f"Got section item: {item}")
     return {
         "item_id": item["item_id"],
         "name": item["name"],
@@ -235,7 +282,6 @@ def process_recommendation_section_items(items: list):
 
 def process_recommendation_section(section: dict):
     """Process and reformat a single recommendation section."""
-    LOGGER.debug(f"Got section: {section}")
     section = section.to_dict()
     return {
         "item_id": section["item_id"],
@@ -259,40 +305,254 @@ def process_recommendations(recs: list):
     return result
 
 
-def generate_image_url_from_image_data(image_data: dict, client):
+def generate_image_url_from_image_data(
+    image_data: dict,
+    client,
+    size: int = IMAGE_PROXY_SIZE,
+    image_format: str = DEFAULT_IMAGE_FORMAT,
+):
     """Generates an image URL from `image_data`."""
     img_path = image_data["path"]
     provider = image_data["provider"]
     base_url = "" if img_path.startswith("http") else client.server_url
     img = urllib.parse.quote_plus(urllib.parse.quote_plus(img_path))
-    return f"{base_url}/imageproxy?provider={provider}&size=256&format=png&path={img}"
+    return f"{base_url}/imageproxy?provider={provider}&size={size}&format={image_format}&path={img}"
+
+
+def image_content_type(data: bytes) -> str:
+    """Returns the content type of an image from its leading bytes."""
+    if data.startswith(b"\x89PNG"):
+        return "image/png"
+    if data.startswith(b"\xff\xd8"):
+        return "image/jpeg"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    if data.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    return "application/octet-stream"
+
+
+def encode_image(data: bytes) -> str:
+    """Returns the base64 encoded string for an image."""
+    content_type = image_content_type(data)
+    if content_type == "application/octet-stream":
+        content_type = "image"
+    return f"data:{content_type};base64,{base64.b64encode(data).decode('utf-8')}"
+
+
+def resize_image(data: bytes, size: int, image_format: str) -> bytes:
+    """Shrinks an image to fit within `size` pixels and converts it to `image_format`."""
+    with Image.open(io.BytesIO(data)) as img:
+        img.thumbnail((size, size))
+        converted = img
+        if image_format == "jpeg" and img.mode not in ("RGB", "L"):
+            converted = img.convert("RGB")
+        result = io.BytesIO()
+        converted.save(
+            result,
+            format=image_format.upper(),
+            **IMAGE_SAVE_OPTIONS.get(image_format, {}),
+        )
+    return result.getvalue()
+
+
+class SingleFlight:
+    """Shares one call between concurrent requests for the same key."""
+
+    def __init__(self):
+        """Initialize class."""
+        self._in_flight: dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
+
+    async def run(self, key: Hashable, func: Callable[..., Awaitable], *args):
+        """Returns the result of `func`, joining a call already running for `key`."""
+        if (future := self._in_flight.get(key)) is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+        future = asyncio.ensure_future(func(*args))
+        self._in_flight[key] = future
+        future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Shielded so a cancelled caller does not cancel the call for the others
+        return await asyncio.shield(future)
+
+
+# Downloads, which are reported in the cache info, and resizes and encodes of them
+IMAGE_REQUESTS = SingleFlight()
+IMAGE_CONVERSIONS = SingleFlight()
+
+
+async def fetch_image(
+    url: str,
+    cache_key: str,
+    hass: HomeAssistant,
+) -> bytes:
+    """Returns an image, sharing one download between concurrent requests."""
+    return await IMAGE_REQUESTS.run(cache_key, _fetch_image, url, cache_key, hass)
+
+
+async def _fetch_image(
+    url: str,
+    cache_key: str,
+    hass: HomeAssistant,
+) -> bytes:
+    """Returns an image from the disk cache, downloading it if not cached."""
+    cache = await async_get_image_cache(hass)
+    if (data := await cache.async_get(cache_key)) is not None:
+        return data
+    session = aiohttp_client.async_get_clientsession(hass)
+    # Bounded here, as the download is shared by every request for the image
+    async with asyncio.timeout(IMAGE_DOWNLOAD_TIMEOUT), session.get(url) as req:
+        # Error pages must not be cached or served as the image
+        req.raise_for_status()
+        data = await req.content.read()
+    await cache.async_set(cache_key, data)
+    return data
+
+
+def image_data_cache_key(
+    image_data: dict,
+    size: int = IMAGE_PROXY_SIZE,
+    image_format: str = DEFAULT_IMAGE_FORMAT,
+) -> str:
+    """Returns the disk cache key for an image from Music Assistant."""
+    return ImageDiskCache.key(
+        image_data["provider"],
+        image_data["path"],
+        size,
+        image_format,
+    )
+
+
+async def fetch_image_from_image_data(
+    image_data: dict,
+    client: MusicAssistantClient,
+    hass: HomeAssistant,
+    size: int = IMAGE_PROXY_SIZE,
+    image_format: str = DEFAULT_IMAGE_FORMAT,
+) -> bytes:
+    """Returns an image from Music Assistant in the given size and format."""
+    source_size = max(size, IMAGE_PROXY_SIZE)
+    if Image is None or (size == source_size and image_format == DEFAULT_IMAGE_FORMAT):
+        # Let Music Assistant resize it when it cannot be derived locally
+        url = generate_image_url_from_image_data(image_data, client, size, image_format)
+        cache_key = image_data_cache_key(image_data, size, image_format)
+        return await fetch_image(url, cache_key, hass)
+    cache_key = image_data_cache_key(image_data, size, image_format)
+    return await IMAGE_CONVERSIONS.run(
+        cache_key,
+        _fetch_resized_image,
+        image_data,
+        client,
+        hass,
+        size,
+        image_format,
+    )
+
+
+async def _fetch_resized_image(
+    image_data: dict,
+    client: MusicAssistantClient,
+    hass: HomeAssistant,
+    size: int,
+    image_format: str,
+) -> bytes:
+    """Returns a resized image from the disk cache, deriving it from the source if not cached."""
+    cache = await async_get_image_cache(hass)
+    cache_key = image_data_cache_key(image_data, size, image_format)
+    if (data := await cache.async_get(cache_key)) is not None:
+        return data
+    # Every smaller size is derived from the same downloaded source image
+    source = await fetch_image_from_image_data(
+        image_data,
+        client,
+        hass,
+        max(size, IMAGE_PROXY_SIZE),
+    )
+    data = await hass.async_add_executor_job(resize_image, source, size, image_format)
+    await cache.async_set(cache_key, data)
+    return data
+
+
+async def encode_fetched_image(
+    cache_key: str,
+    fetch: Callable[..., Awaitable[bytes]],
+    *args,
+) -> str:
+    """Returns an encoded image, sharing one encode between concurrent requests."""
+    return await IMAGE_CONVERSIONS.run(
+        f"{cache_key}:encoded",
+        _encode_fetched_image,
+        fetch,
+        *args,
+    )
+
+
+async def _encode_fetched_image(fetch: Callable[..., Awaitable[bytes]], *args) -> str:
+    """Returns the base64 encoded string for a fetched image."""
+    return encode_image(await fetch(*args))
 
 
 async def download_single_image_from_image_data(
     image_data: dict,
-    entity_id,
-    hass,
-    session,
+    client: MusicAssistantClient,
+    hass: HomeAssistant,
+    size: int = IMAGE_PROXY_SIZE,
+    image_format: str = DEFAULT_IMAGE_FORMAT,
 ):
     """Downloads a single image from Music Assistant and returns the base64 encoded string."""
-    entry = get_mass_entry(hass, entity_id)
-    client = entry.runtime_data.mass
-    url = generate_image_url_from_image_data(image_data, client)
     try:
-        req = await session.get(url)
-        read = await req.content.read()
-        return f"data:image;base64,{base64.b64encode(read).decode('utf-8')}"
-    except:  # noqa: E722
+        return await encode_fetched_image(
+            image_data_cache_key(image_data, size, image_format),
+            fetch_image_from_image_data,
+            image_data,
+            client,
+            hass,
+            size,
+            image_format,
+        )
+    except Exception:  # noqa: BLE001
         LOGGER.error(f"Unable to get image with data {image_data}")
         return None
 
 
+async def download_images_from_image_data(
+    images: list[dict],
+    client: MusicAssistantClient,
+    hass: HomeAssistant,
+    size: int = IMAGE_PROXY_SIZE,
+    image_format: str = DEFAULT_IMAGE_FORMAT,
+    concurrency: int = IMAGE_DOWNLOAD_CONCURRENCY,
+):
+    """Downloads images concurrently, yielding each index and result as it completes."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def download(index: int, image_data: dict):
+        async with semaphore:
+            encoded = await download_single_image_from_image_data(
+                image_data,
+                client,
+                hass,
+                size=size,
+                image_format=image_format,
+            )
+        return index, encoded
+
+    tasks = [
+        asyncio.create_task(download(index, image_data))
+        for index, image_data in enumerate(images)
+    ]
+    try:
+        for task in asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 async def download_and_encode_image(url: str, hass: HomeAssistant):
     """Downloads and encodes a single image from the given URL."""
-    session = aiohttp_client.async_get_clientsession(hass)
-    req = await session.get(url)
-    read = await req.content.read()
-    return f"data:image;base64,{base64.b64encode(read).decode('utf-8')}"
+    cache_key = ImageDiskCache.key(url)
+    return await encode_fetched_image(cache_key, fetch_image, url, cache_key, hass)
 
 
 async def get_user_info(hass: HomeAssistant, entity_id: str, username: str):
@@ -304,17 +564,26 @@ async def get_user_info(hass: HomeAssistant, entity_id: str, username: str):
     return [user.to_dict() for user in users if user.username == username][0]
 
 
-def get_entity_info(hass: HomeAssistant, entity_id: str):
-    """Gets the server and client info for a given player."""
-    client = get_mass_client(hass, entity_id)
-    state = hass.states.get(entity_id)
+def _get_entity_device(hass: HomeAssistant, entity_id: str):
+    """Returns the device of an entity."""
     device_registry = dr.async_get(hass)
     entity_registry = er.async_get(hass)
     dev_id = entity_registry.async_get(entity_id).device_id
-    dev = device_registry.async_get(dev_id)
-    identifiers = dev.identifiers
+    return device_registry.async_get(dev_id)
+
 
-    player_id = [_id[1] for _id in identifiers if _id[0] == "music_assistant"][0]
+def get_player_id(hass: HomeAssistant, entity_id: str) -> str:
+    """Returns the Music Assistant player ID of an entity."""
+    identifiers = _get_entity_device(hass, entity_id).identifiers
+    return [_id[1] for _id in identifiers if _id[0] == "music_assistant"][0]
+
+
+def get_entity_info(hass: HomeAssistant, entity_id: str):
+    """Gets the server and client info for a given player."""
+    client = get_mass_client(hass, entity_id)
+    state = hass.states.get(entity_id)
+    dev = _get_entity_device(hass, entity_id)
+    player_id = get_player_id(hass, entity_id)
     player = client.players.get(player_id)
 
     mass_entry_id = _get_mass_entity_config_entry_id(hass, entity_id)
@@ -367,6 +636,58 @@ def get_entity_info(hass: HomeAssistant, entity_id: str):
     }
 
 
+def supports_paging(fetch: Callable) -> bool:
+    """Returns whether a client call accepts a `page` argument."""
+    try:
+        return "page" in inspect.signature(fetch).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+async def fetch_paged_items(
+    fetch_page: Callable[[int], Awaitable[list]],
+    offset: int = 0,
+    limit: int | None = None,
+    concurrency: int = TRACK_PAGE_CONCURRENCY,
+) -> list:
+    """Fetches pages concurrently and returns `limit` items from `offset` onwards."""
+    first = await fetch_page(0)
+    page_size = len(first)
+    end = None if limit is None else offset + limit
+    if not page_size or (end is not None and end <= page_size):
+        return first[offset:end]
+    # Every page but the last is full, so pages before the offset can be skipped
+    page = max(offset // page_size, 1)
+    start = 0 if page == 1 else page * page_size
+    items = list(first) if page == 1 else []
+    previous = first
+    # The window grows from a single page so short lists do not fetch empty pages
+    window = 1
+    while end is None or start + len(items) < end:
+        if page >= TRACK_PAGE_MAX:
+            LOGGER.warning(f"Stopped fetching items after {TRACK_PAGE_MAX} pages.")
+            break
+        count = min(window, TRACK_PAGE_MAX - page)
+        window = min(window * 2, concurrency)
+        if end is not None:
+            remaining = end - start - len(items)
+            count = min(count, -(-remaining // page_size))
+        results = await asyncio.gather(
+            *[fetch_page(number) for number in range(page, page + count)],
+        )
+        page += count
+        for result in results:
+            # A server which ignores the page returns the same items every time
+            if result == previous:
+                LOGGER.warning("Server returned the same page twice, stopping.")
+                return items[offset - start : None if end is None else end - start]
+            items.extend(result)
+            if len(result) < page_size:
+                return items[offset - start : None if end is None else end - start]
+            previous = result
+    return items[offset - start : None if end is None else end - start]
+
+
 def parse_uri(uri):
     """Parse a URI and split to provider and item ID."""
     provider = uri.split("://")[0]
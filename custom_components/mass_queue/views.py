@@ -0,0 +1,132 @@
+"""HTTP views for integration."""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import secrets
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from aiohttp import hdrs, web
+from homeassistant.components.http import (
+    KEY_AUTHENTICATED,
+    KEY_HASS,
+    HomeAssistantView,
+)
+from homeassistant.core import callback
+from homeassistant.helpers.singleton import singleton
+
+from .const import (
+    DOMAIN,
+    IMAGE_URL_LIFETIME,
+    IMAGE_URL_MAX_AGE,
+    IMAGE_URL_MAX_SOURCES,
+    LOGGER,
+)
+from .image_cache import async_get_image_cache
+from .utils import image_content_type
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from homeassistant.core import HomeAssistant
+
+DATA_IMAGE_URLS = f"{DOMAIN}_image_urls"
+
+
+class ImageUrls:
+    """Creates and verifies signed URLs for images served by `MassQueueImageView`."""
+
+    def __init__(self):
+        """Initialize class."""
+        self._secret = secrets.token_bytes(32)
+        # Maps cache keys to the call returning the image
+        self._sources: OrderedDict[str, Callable[[], Awaitable[bytes]]] = OrderedDict()
+
+    def _signature(self, key: str, expires: int) -> str:
+        """Returns the signature for a cache key and expiry time."""
+        message = f"{key}:{expires}".encode()
+        return hmac.new(self._secret, message, hashlib.sha256).hexdigest()[:32]
+
+    def register(self, key: str, source: Callable[[], Awaitable[bytes]]) -> str:
+        """Registers the call returning the image for a cache key, returning its path."""
+        self._sources[key] = source
+        self._sources.move_to_end(key)
+        while len(self._sources) > IMAGE_URL_MAX_SOURCES:
+            self._sources.popitem(last=False)
+        return f"/api/{DOMAIN}/image/{key}"
+
+    def url(self, key: str, source: Callable[[], Awaitable[bytes]]) -> str:
+        """Returns the signed URL serving the image for a cache key."""
+        path = self.register(key, source)
+        # Rounded up so the URL stays the same for a while, valid for at least a lifetime
+        expires = (int(time.time()) // IMAGE_URL_LIFETIME + 2) * IMAGE_URL_LIFETIME
+        signature = self._signature(key, expires)
+        return f"{path}?exp={expires}&sig={signature}"
+
+    def verify(self, key: str, expires: str | None, signature: str | None) -> bool:
+        """Returns whether the signature is valid and not expired for a cache key."""
+        if expires is None or signature is None or not expires.isdigit():
+            return False
+        if int(expires) < time.time():
+            return False
+        return hmac.compare_digest(self._signature(key, int(expires)), signature)
+
+    def source(self, key: str) -> Callable[[], Awaitable[bytes]] | None:
+        """Returns the call returning an image."""
+        return self._sources.get(key)
+
+
+@singleton(DATA_IMAGE_URLS)
+@callback
+def get_image_urls(hass: HomeAssistant) -> ImageUrls:  # noqa: ARG001
+    """Returns the signed image URLs."""
+    return ImageUrls()
+
+
+class MassQueueImageView(HomeAssistantView):
+    """Serves cached or downloaded images."""
+
+    url = f"/api/{DOMAIN}/image/{{key}}"
+    name = f"api:{DOMAIN}:image"
+    # Requests come from <img> tags, which cannot send a token. Images from Music
+    # Assistant are signed by `ImageUrls`, others need a path signed by Home Assistant
+    requires_auth = False
+
+    async def get(self, request: web.Request, key: str) -> web.Response:
+        """Returns the image for a cache key."""
+        hass: HomeAssistant = request.app[KEY_HASS]
+        urls = get_image_urls(hass)
+        if not request.get(KEY_AUTHENTICATED) and not urls.verify(
+            key,
+            request.query.get("exp"),
+            request.query.get("sig"),
+        ):
+            return web.Response(status=HTTPStatus.FORBIDDEN)
+        # Keys are derived from the image source, so the same key is the same image
+        headers = {
+            hdrs.ETAG: f'"{key}"',
+            hdrs.CACHE_CONTROL: f"private, max-age={IMAGE_URL_MAX_AGE}",
+        }
+        if request.headers.get(hdrs.IF_NONE_MATCH) == headers[hdrs.ETAG]:
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+        if (source := urls.source(key)) is not None:
+            try:
+                data = await source()
+            except Exception:  # noqa: BLE001
+                LOGGER.error(f"Unable to get image {key}")
+                return web.Response(status=HTTPStatus.BAD_GATEWAY)
+        else:
+            # No longer registered, so it can only be served if still cached
+            cache = await async_get_image_cache(hass)
+            data = await cache.async_get(key)
+        if data is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        return web.Response(
+            body=data,
+            content_type=image_content_type(data),
+            headers=headers,
+        )
@@ -2,22 +2,44 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
+from functools import partial
 from typing import TYPE_CHECKING
 
 import voluptuous as vol
 from homeassistant.components import websocket_api
-from homeassistant.helpers import aiohttp_client
+from homeassistant.components.http.auth import async_sign_path
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
-from .const import LOGGER
+from .const import (
+    DEFAULT_IMAGE_FORMAT,
+    DEFAULT_QUEUE_LIMIT_AFTER,
+    DEFAULT_QUEUE_LIMIT_BEFORE,
+    IMAGE_FORMATS,
+    IMAGE_PROXY_SIZE,
+    IMAGE_SIZE_MAX,
+    IMAGE_SIZE_MIN,
+    IMAGE_URL_LIFETIME,
+    LOGGER,
+    QUEUE_SUBSCRIPTION_LIMIT,
+)
+from .image_cache import ImageDiskCache
+from .queue_subscription import QueueSubscription
+from .router import get_entity_actions_controller
 from .utils import (
     download_and_encode_image,
-    download_single_image_from_image_data,
+    download_images_from_image_data,
+    fetch_image,
+    fetch_image_from_image_data,
     get_entity_info,
+    get_mass_entry,
     get_user_info,
+    image_data_cache_key,
+    is_music_assistant_url,
 )
+from .views import get_image_urls
 
 
 @websocket_api.websocket_command(
@@ -43,6 +65,7 @@ def api_get_entity_info(
     {
         vol.Required("type"): "mass_queue/download_and_encode_image",
         vol.Required("url"): str,
+        vol.Optional("as_url", default=False): bool,
     },
 )
 @websocket_api.async_response
@@ -54,7 +77,22 @@ async def api_download_and_encode_image(
     """Download images and return them as b64 encoded."""
     LOGGER.debug(f"Got message: {msg}")
     url = msg["url"]
-    result = await download_and_encode_image(url, hass)
+    if msg["as_url"]:
+        key = ImageDiskCache.key(url)
+        urls = get_image_urls(hass)
+        source = partial(fetch_image, url, key, hass)
+        if is_music_assistant_url(hass, url):
+            result = urls.url(key, source)
+        else:
+            # Only served to this user, so the view cannot proxy arbitrary URLs
+            result = async_sign_path(
+                hass,
+                urls.register(key, source),
+                timedelta(seconds=IMAGE_URL_LIFETIME),
+                refresh_token_id=connection.refresh_token_id,
+            )
+    else:
+        result = await download_and_encode_image(url, hass)
     connection.send_result(msg["id"], result)
 
 
@@ -63,6 +101,13 @@ async def api_download_and_encode_image(
         vol.Required("type"): "mass_queue/encode_images",
         vol.Required("entity_id"): str,
         vol.Required("images"): list,
+        vol.Optional("stream", default=False): bool,
+        vol.Optional("as_url", default=False): bool,
+        vol.Optional("size", default=IMAGE_PROXY_SIZE): vol.All(
+            int,
+            vol.Range(min=IMAGE_SIZE_MIN, max=IMAGE_SIZE_MAX),
+        ),
+        vol.Optional("format", default=DEFAULT_IMAGE_FORMAT): vol.In(IMAGE_FORMATS),
     },
 )
 @websocket_api.async_response
@@ -73,20 +118,49 @@ async def api_download_images(
 ) -> None:
     """Download images and return them as b64 encoded."""
     LOGGER.debug(f"Received message: {msg}")
-    session = aiohttp_client.async_get_clientsession(hass)
     images = msg["images"]
-    result = []
-    entity_id = msg["entity_id"]
-    for image in images:
-        img = await download_single_image_from_image_data(
-            image,
-            entity_id,
-            hass,
-            session,
-        )
-        image["encoded"] = img
-        result.append(image)
-    connection.send_result(msg["id"], result)
+    client = get_mass_entry(hass, msg["entity_id"]).runtime_data.mass
+    size = msg["size"]
+    image_format = msg["format"]
+    if msg["as_url"]:
+        # Images are downloaded by the view when the browser requests them
+        urls = get_image_urls(hass)
+        for image in images:
+            image["url"] = urls.url(
+                image_data_cache_key(image, size, image_format),
+                partial(
+                    fetch_image_from_image_data,
+                    image,
+                    client,
+                    hass,
+                    size,
+                    image_format,
+                ),
+            )
+        connection.send_result(msg["id"], images)
+        return
+    downloads = download_images_from_image_data(
+        images,
+        client,
+        hass,
+        size,
+        image_format,
+    )
+    if msg["stream"]:
+        # Acknowledge first, then send each image as soon as it is downloaded
+        connection.send_result(msg["id"])
+        async for index, img in downloads:
+            images[index]["encoded"] = img
+            connection.send_message(
+                websocket_api.event_message(
+                    msg["id"],
+                    {"index": index, "image": images[index]},
+                ),
+            )
+        return
+    async for index, img in downloads:
+        images[index]["encoded"] = img
+    connection.send_result(msg["id"], images)
 
 
 @websocket_api.websocket_command(
@@ -124,3 +198,69 @@ async def api_get_user_info(
     result = await get_user_info(hass, entity_id, username)
     LOGGER.debug(f"Sending result {result}")
     connection.send_result(msg["id"], result)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "mass_queue/subscribe_queue",
+        vol.Required("entity_id"): str,
+        vol.Optional("limit_before", default=DEFAULT_QUEUE_LIMIT_BEFORE): vol.All(
+            int,
+            vol.Range(min=0, max=QUEUE_SUBSCRIPTION_LIMIT),
+        ),
+        vol.Optional("limit_after", default=DEFAULT_QUEUE_LIMIT_AFTER): vol.All(
+            int,
+            vol.Range(min=0, max=QUEUE_SUBSCRIPTION_LIMIT),
+        ),
+    },
+)
+@websocket_api.async_response
+async def api_subscribe_queue(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Sends the items around the current item of a player's queue, then their changes."""
+    LOGGER.debug(f"Got message: {msg}")
+    entity_id = msg["entity_id"]
+    actions = get_entity_actions_controller(hass, entity_id)
+    queue_id = actions.get_queue_id(entity_id)
+    if queue_id is None:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_FOUND,
+            f"No queue found for {entity_id}",
+        )
+        return
+    subscription = QueueSubscription(
+        hass,
+        actions.controller,
+        queue_id,
+        msg["limit_before"],
+        msg["limit_after"],
+        lambda data: connection.send_message(
+            websocket_api.event_message(msg["id"], data),
+        ),
+    )
+    connection.subscriptions[msg["id"]] = subscription.async_stop
+    connection.send_result(msg["id"])
+    await subscription.async_start()
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "mass_queue/get_cache_info",
+        vol.Required("entity_id"): str,
+    },
+)
+def api_get_cache_info(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Returns the size of the caches for the integration of a given player."""
+    LOGGER.debug(f"Got message: {msg}")
+    actions = get_entity_actions_controller(hass, msg["entity_id"])
+    result = actions.get_cache_info()
+    LOGGER.debug(f"Sending result {result}")
+    connection.send_result(msg["id"], result)
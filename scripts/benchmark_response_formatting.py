@@ -0,0 +1,87 @@
+"""Benchmark the per-item cost of formatting queue items and tracks.
+
+Run from the repository root in an environment with Home Assistant installed:
+
+    python scripts/benchmark_response_formatting.py
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "custom_components"))
+
+from mass_queue import utils
+from mass_queue.actions import MassQueueActions
+from mass_queue.models import QueueItemRecord
+
+ITEMS = 2000
+RUNS = 5
+
+TRACK = {
+    "name": "Track",
+    "uri": "library://track/1",
+    "favorite": False,
+    "duration": 215,
+    "image": None,
+    "metadata": {
+        "images": [
+            {"path": "https://example.com/image.png", "remotely_accessible": True},
+        ],
+    },
+    "album": {"name": "Album"},
+    "artists": [{"name": "Artist A"}, {"name": "Artist B"}],
+    "position": 1,
+}
+
+
+def format_queue_items():
+    """Format a batch of queue item records."""
+    records = [
+        QueueItemRecord(
+            queue_item_id=str(i),
+            title="Track",
+            album="Album",
+            artists="Artist A, Artist B",
+            uri="library://track/1",
+            image="https://example.com/image.png",
+            favorite=False,
+            duration=215,
+        )
+        for i in range(ITEMS)
+    ]
+    return lambda: [record.to_response() for record in records]
+
+
+def format_playlist_tracks():
+    """Format a batch of playlist tracks."""
+    actions = MassQueueActions.__new__(MassQueueActions)
+    tracks = [dict(TRACK, position=i) for i in range(ITEMS)]
+    return lambda: [actions.format_playlist_track(track) for track in tracks]
+
+
+def per_item_cost(setup) -> float:
+    """Returns the best per-item cost in microseconds."""
+    best = min(timeit.repeat(setup(), number=1, repeat=RUNS))
+    return best / ITEMS * 1_000_000
+
+
+def main():
+    """Print the per-item cost with and without schema validation."""
+    for name, setup in (
+        ("queue items", format_queue_items),
+        ("playlist tracks", format_playlist_tracks),
+    ):
+        utils.VALIDATE_RESPONSES = True
+        validated = per_item_cost(setup)
+        utils.VALIDATE_RESPONSES = False
+        fast = per_item_cost(setup)
+        print(  # noqa: T201
+            f"{name}: {validated:.2f} us/item validated, {fast:.2f} us/item fast path",
+        )
+
+
+if __name__ == "__main__":
+    main()
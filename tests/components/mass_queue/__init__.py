@@ -1 +1,95 @@
 """Tests for mass_queue component."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+QUEUE_ID = "test_queue"
+
+
+def make_queue_item(queue_item_id: str, name: str | None = None) -> dict:
+    """Return a queue item as sent by Music Assistant."""
+    name = name or f"Track {queue_item_id}"
+    return {
+        "queue_item_id": queue_item_id,
+        "name": name,
+        "duration": 180,
+        "media_item": {
+            "name": name,
+            "uri": f"library://track/{queue_item_id}",
+            "favorite": False,
+            "artists": [{"name": "Artist"}],
+            "album": {"name": "Album"},
+            "metadata": {"images": []},
+        },
+    }
+
+
+class FakePlayerQueues:
+    """Serve a single queue like the player queues of the Music Assistant client."""
+
+    def __init__(self, count: int, current_index: int = 0) -> None:
+        """Initialize the fake queue."""
+        self.items = [make_queue_item(f"id{index}") for index in range(count)]
+        self.current_index = current_index
+        self.index_in_buffer = current_index
+        self.calls: list[tuple[int, int]] = []
+        # Most fetches in flight at once
+        self.peak = 0
+        self._running = 0
+        # Fetches wait for this event when it is set, to interleave other calls
+        self.gate: asyncio.Event | None = None
+        self.queue_command_delete = AsyncMock()
+        self.queue_command_move_up = AsyncMock()
+        self.queue_command_move_down = AsyncMock()
+        self.queue_command_move_next = AsyncMock()
+
+    def state(self) -> SimpleNamespace:
+        """Return the local state of the queue."""
+        return SimpleNamespace(
+            queue_id=QUEUE_ID,
+            items=len(self.items),
+            current_index=self.current_index,
+            index_in_buffer=self.index_in_buffer,
+            state="playing",
+            elapsed_time_last_updated=0,
+            shuffle_enabled=False,
+            current_item=None,
+            next_item=None,
+            to_dict=self.event_data,
+        )
+
+    def event_data(self) -> dict:
+        """Return the data of a QUEUE_UPDATED event for the queue."""
+        return {
+            "queue_id": QUEUE_ID,
+            "items": len(self.items),
+            "current_index": self.current_index,
+            "index_in_buffer": self.index_in_buffer,
+        }
+
+    def get(self, queue_id: str) -> SimpleNamespace | None:
+        """Return the local state of a queue."""
+        return self.state() if queue_id == QUEUE_ID else None
+
+    async def get_queue_items(self, queue_id: str, limit: int, offset: int) -> list:
+        """Return a range of queue items."""
+        if queue_id != QUEUE_ID:
+            return []
+        self.calls.append((offset, limit))
+        self._running += 1
+        self.peak = max(self.peak, self._running)
+        try:
+            if self.gate is not None:
+                await self.gate.wait()
+            else:
+                await asyncio.sleep(0)
+        finally:
+            self._running -= 1
+        return [dict(item) for item in self.items[offset : offset + limit]]
+
+
+async def settle() -> None:
+    """Let background fetches started by the controller finish."""
+    for _ in range(50):
+        await asyncio.sleep(0)
@@ -0,0 +1,38 @@
+"""Fixtures for mass_queue tests."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.components.mass_queue.const import CONF_QUEUE_REFRESH_DELAY, DOMAIN
+from homeassistant.components.mass_queue.controller import MassQueueController
+from homeassistant.core import HomeAssistant
+
+from tests.common import MockConfigEntry
+
+from . import FakePlayerQueues
+
+
+@pytest.fixture
+def mass_client() -> MagicMock:
+    """Return a Music Assistant client serving a queue of 1000 items."""
+    client = MagicMock()
+    client.player_queues = FakePlayerQueues(1000)
+    return client
+
+
+@pytest.fixture
+def config_entry() -> MockConfigEntry:
+    """Return a config entry refreshing queues without delay."""
+    return MockConfigEntry(domain=DOMAIN, options={CONF_QUEUE_REFRESH_DELAY: 0})
+
+
+@pytest.fixture
+def controller(
+    hass: HomeAssistant,
+    mass_client: MagicMock,
+    config_entry: MockConfigEntry,
+):
+    """Return a controller for the fake client."""
+    controller = MassQueueController(hass, mass_client, config_entry)
+    yield controller
+    controller.shutdown()
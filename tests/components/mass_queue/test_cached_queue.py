@@ -0,0 +1,158 @@
+"""Test the sparse queue cache."""
+
+from homeassistant.components.mass_queue.controller import CachedQueue
+from homeassistant.components.mass_queue.models import QueueItemRecord
+
+from . import make_queue_item
+
+
+def make_records(start: int, end: int) -> list[QueueItemRecord]:
+    """Return the records of a range of queue items."""
+    return [
+        QueueItemRecord.from_dict(make_queue_item(f"id{index}"))
+        for index in range(start, end)
+    ]
+
+
+def make_queue(count: int, page_size: int = 10) -> CachedQueue:
+    """Return an empty cache for a queue of `count` items."""
+    queue = CachedQueue(page_size=page_size)
+    queue.set_state(items_count=count)
+    return queue
+
+
+def ids(records: list[QueueItemRecord]) -> list[str]:
+    """Return the queue item ids of records."""
+    return [record.queue_item_id for record in records]
+
+
+def test_missing_and_loaded_pages() -> None:
+    """Test only the pages without cached items are reported missing."""
+    queue = make_queue(45)
+    assert queue.missing_pages(5, 20) == [0, 1, 2]
+
+    queue.store(10, make_records(10, 20))
+    assert queue.is_page_loaded(1)
+    assert queue.missing_pages(5, 20) == [0, 2]
+    assert queue.loaded_pages() == [1]
+
+    # The last page is shorter than the others
+    queue.store(40, make_records(40, 45))
+    assert queue.is_page_loaded(4)
+    assert queue.missing_pages(40, 100) == []
+
+
+def test_partially_cached_page_is_missing() -> None:
+    """Test a page with a gap is fetched again."""
+    queue = make_queue(30)
+    queue.store(10, make_records(10, 15))
+    assert not queue.is_page_loaded(1)
+    assert queue.missing_pages(10, 5) == [1]
+    assert queue.loaded_pages() == [1]
+
+
+def test_get_items_skips_gaps() -> None:
+    """Test reading a range returns only the cached items."""
+    queue = make_queue(30)
+    queue.store(0, make_records(0, 10))
+    queue.store(20, make_records(20, 30))
+    assert ids(queue.get_items(5, 20)) == [
+        f"id{index}" for index in (*range(5, 10), *range(20, 25))
+    ]
+
+
+def test_get_items_prefers_fetched_pages() -> None:
+    """Test fetched pages answer a read even when they were not cached."""
+    queue = make_queue(30)
+    queue.store(0, make_records(0, 10))
+    fetched = {1: make_records(10, 20)}
+    assert ids(queue.get_items(5, 10, fetched)) == [
+        f"id{index}" for index in range(5, 15)
+    ]
+    # The fetched page was not stored
+    assert not queue.is_page_loaded(1)
+
+
+def test_shrinking_queue_drops_items() -> None:
+    """Test a lower item count drops the items past the end."""
+    queue = make_queue(30)
+    queue.store(0, make_records(0, 30))
+    size = queue.size
+    queue.set_state(items_count=15)
+    assert len(queue) == 15
+    assert queue.index_of("id20") is None
+    assert queue.size < size
+
+
+def test_evict_distant_pages() -> None:
+    """Test the pages farthest from the current index are evicted first."""
+    queue = make_queue(60)
+    queue.store(0, make_records(0, 60))
+    queue.set_state(current_index=25)
+    queue.evict_distant_pages(3)
+    assert queue.loaded_pages() == [1, 2, 3]
+    assert queue.index_of("id0") is None
+    assert queue.index_of("id25") == 25
+
+
+def test_snapshot_round_trip() -> None:
+    """Test a restored queue keeps its items and gaps and is marked stale."""
+    queue = make_queue(30)
+    queue.store(0, make_records(0, 5))
+    queue.store(20, make_records(20, 30))
+    queue.set_state(current_index=22)
+    restored = CachedQueue.from_snapshot(queue.to_snapshot())
+    assert restored.stale
+    assert restored.items_count == 30
+    assert restored.current_index == 22
+    assert ids(restored.get_items(0, 30)) == ids(queue.get_items(0, 30))
+    assert restored.items[10] is None
+
+
+def test_remove_item_and_undo() -> None:
+    """Test removing an item shifts the items after it until undone."""
+    queue = make_queue(30)
+    queue.store(0, make_records(0, 30))
+    generation = queue.generation
+
+    undo = queue.remove_item("id5")
+    assert queue.generation > generation
+    assert queue.items_count == 29
+    assert queue.index_of("id5") is None
+    assert queue.index_of("id6") == 5
+
+    undo()
+    assert queue.items_count == 30
+    assert ids(queue.get_items(0, 30)) == [f"id{index}" for index in range(30)]
+
+
+def test_move_item_and_undo() -> None:
+    """Test moving an item updates the positions until undone."""
+    queue = make_queue(30)
+    queue.store(0, make_records(0, 30))
+
+    undo = queue.move_item("id5", 2)
+    assert ids(queue.get_items(0, 7)) == [
+        "id0",
+        "id1",
+        "id5",
+        "id2",
+        "id3",
+        "id4",
+        "id6",
+    ]
+    assert queue.index_of("id5") == 2
+    assert queue.index_of("id2") == 3
+
+    undo()
+    assert ids(queue.get_items(0, 30)) == [f"id{index}" for index in range(30)]
+
+
+def test_edits_of_unknown_items_are_ignored() -> None:
+    """Test items which are not cached can not be edited."""
+    queue = make_queue(30)
+    queue.store(0, make_records(0, 10))
+    assert queue.remove_item("id20") is None
+    assert queue.move_item("id20", 0) is None
+    assert queue.move_item("id5", 30) is None
+    assert queue.items_count == 30
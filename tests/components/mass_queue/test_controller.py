@@ -0,0 +1,692 @@
+"""Test the queue controller."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.components.mass_queue.const import (
+    CONF_PLAYER_EVENT_FIELDS,
+    CONF_PLAYER_EVENT_INTERVAL,
+    DOMAIN,
+    QUEUE_CLEAR_CONCURRENCY,
+    QUEUE_STORAGE_KEY,
+    QUEUE_STORAGE_VERSION,
+)
+from homeassistant.components.mass_queue.controller import (
+    MassQueueController,
+    QueueRefreshScheduler,
+)
+from homeassistant.core import HomeAssistant
+
+from tests.common import MockConfigEntry
+
+from . import QUEUE_ID, FakePlayerQueues, make_queue_item, settle
+
+
+def queue_updated_event(data: dict) -> SimpleNamespace:
+    """Return a QUEUE_UPDATED event."""
+    return SimpleNamespace(event="queue_updated", object_id=QUEUE_ID, data=data)
+
+
+async def test_update_keeps_items_before_buffer(
+    controller: MassQueueController,
+    mass_client: MagicMock,
+) -> None:
+    """Test a refresh only refetches the items after the buffered index."""
+    player_queues = mass_client.player_queues
+    player_queues.current_index = player_queues.index_in_buffer = 150
+    await controller.update_queue_items(QUEUE_ID, player_queues.event_data())
+    queue = controller.queues.get(QUEUE_ID)
+    assert queue.loaded_pages() == [0, 1, 2, 3]
+    first = queue.items[0]
+
+    player_queues.calls.clear()
+    player_queues.items[200:210] = [
+        make_queue_item(f"new{index}") for index in range(10)
+    ]
+    await controller.update_queue_items(QUEUE_ID, player_queues.event_data())
+
+    # Fetched from the buffered item, which anchors the items before it
+    assert player_queues.calls == [(150, 250)]
+    assert queue.items[0] is first
+    assert queue.items[200].queue_item_id == "new0"
+
+
+async def test_update_resets_on_anchor_mismatch(
+    controller: MassQueueController,
+    mass_client: MagicMock,
+) -> None:
+    """Test a replaced queue drops the cached items before the buffered index."""
+    player_queues = mass_client.player_queues
+    player_queues.current_index = player_queues.index_in_buffer = 150
+    await controller.update_queue_items(QUEUE_ID, player_queues.event_data())
+    queue = controller.queues.get(QUEUE_ID)
+
+    player_queues.items = [make_queue_item(f"new{index}") for index in range(1000)]
+    await controller.update_queue_items(QUEUE_ID, player_queues.event_data())
+
+    assert queue.items[0] is None
+    assert queue.items[150].queue_item_id == "new150"
+    assert queue.index_of("id0") is None
+
+
+async def test_warm_pages_fetched_once(
+    controller: MassQueueController,
+    mass_client: MagicMock,
+) -> None:
+    """Test repeated queue updates share the fetch of the missing warm pages."""
+    player_queues = mass_client.player_queues
+    await controller.update_queue_items(QUEUE_ID, player_queues.event_data())
+    player_queues.calls.clear()
+
+    player_queues.current_index = 800
+    for _ in range(5):
+        controller.on_queue_update_event(
+            queue_updated_event(player_queues.event_data()),
+        )
+    await settle()
+
+    assert sorted(player_queues.calls) == [(700, 100), (800, 100), (900, 100)]
+
+
+async def test_read_racing_refresh_returns_fetched_items(
+    controller: MassQueueController,
+    mass_client: MagicMock,
+) -> None:
+    """Test a read still returns its items when the queue changes while fetching."""
+    player_queues = mass_client.player_queues
+    queue = controller.queues.get_or_add(QUEUE_ID)
+    player_queues.gate = asyncio.Event()
+
+    read = asyncio.ensure_future(controller.player_queue(QUEUE_ID, 20, 900))
+    await settle()
+    queue.invalidate()
+    player_queues.gate.set()
+    items = await read
+
+    assert [item.queue_item_id for item in items] == [
+        f"id{index}" for index in range(900, 920)
+    ]
+    # The pages were fetched for an older version of the queue, so not cached
+    assert not queue.is_page_loaded(9)
+
+
+async def test_read_during_pending_edit_returns_items(
+    controller: MassQueueController,
+    mass_client: MagicMock,
+) -> None:
+    """Test a read is answered while an edit awaits the server."""
+    queue = controller.queues.get_or_add(QUEUE_ID)
+    queue.pending_edits += 1
+
+    items = await controller.player_queue(QUEUE_ID, 20, 900)
+
+    assert [item.queue_item_id for item in items] == [
+        f"id{index}" for index in range(900, 920)
+    ]
+    # The server may not have applied the edit yet, so the pages are not cached
+    assert not queue.is_page_loaded(9)
+    assert mass_client.player_queues.calls == [(900, 100)]
+
+
+async def test_edit_applied_before_server_confirms(
+    controller: MassQueueController,
+    mass_client: MagicMock,
+) -> None:
+    """Test an edit changes the cached queue before the command returns."""
+    player_queues = mass_client.player_queues
+    await controller.update_queue_items(QUEUE_ID, player_queues.event_data())
+    queue = controller.queues.get(QUEUE_ID)
+    gate = asyncio.Event()
+
+    async def delete(*_args) -> None:
+        await gate.wait()
+
+    player_queues.queue_command_delete = AsyncMock(side_effect=delete)
+
+    edit = asyncio.ensure_future(
+        controller.edit_queue_item(QUEUE_ID, "remove", "id5"),
+    )
+    await settle()
+    assert queue.index_of("id5") is None
+    assert queue.pending_edits == 1
+
+    gate.set()
+    await edit
+    player_queues.queue_command_delete.assert_awaited_once_with(QUEUE_ID, "id5")
+    assert queue.pending_edits == 0
+
+
+async def test_failed_edit_is_rolled_back(
+    controller: MassQueueController,
+    mass_client: MagicMock,
+) -> None:
+    """Test a rejected edit restores the cached queue."""
+    player_queues = mass_client.player_queues
+    await controller.update_queue_items(QUEUE_ID, player_queues.event_data())
+    queue = controller.queues.get(QUEUE_ID)
+    player_queues.queue_command_move_up = AsyncMock(side_effect=RuntimeError)
+
+    with pytest.raises(RuntimeError):
+        await controller.edit_queue_item(QUEUE_ID, "move_up", "id5")
+
+    assert queue.index_of("id5") == 5
+    assert queue.index_of("id4") == 4
+    assert queue.pending_edits == 0
+
+
+def queue_edits(*edits: tuple[str, str]) -> list[dict]:
+    """Return queue edit operations."""
+    return [{"action": action, "queue_item_id": item_id} for action, item_id in edits]
+
+
+@pytest.mark.parametrize(
+    ("count", "edits", "errors"),
+    [
+        (
+            50,
+            [("remove", "id2"), ("move_up", "id3"), ("remove", "id4")],
+            ["Item is already playing or buffered"] * 2 + [None],
+        ),
+        (
+            50,
+            [("remove", "id10"), ("move_up", "id10"), ("remove", "id10")],
+            [None] + ["Item was removed earlier in this batch"] * 2,
+        ),
+        (
+            50,
+            [("move_down", "unknown"), ("move_next", "id10")],
+            ["Item is not in the queue", None],
+        ),
+        # Items outside the cached pages may still be in the queue
+        (1000, [("move_down", "unknown")], [None]),
+    ],
+)
+async def test_validate_queue_edits(
+    controller: MassQueueController,
+    mass_client: MagicMock,
+    count: int,
+    edits: list[tuple[str, str]],
+    errors: list[str | None],
+) -> None:
+    """Test edits of buffered, removed or unknown items are rejected."""
+    mass_client.player_queues = player_queues = FakePlayerQueues(count)
+    player_queues.index_in_buffer = 3
+    await controller.update_queue_items(QUEUE_ID, player_queues.event_data())
+    operations = queue_edits(*edits)
+    results = [{"error": None} for _ in operations]
+
+    valid = controller.validate_queue_edits(QUEUE_ID, operations, results)
+
+    assert [result["error"] for result in results] == errors
+    assert valid == [index for index, error in enumerate(errors) if error is None]
+
+
+async def test_edit_queue_keeps_move_order(
+    controller: MassQueueController,
+    mass_client: MagicMock,
+) -> None:
+    """Test moves wait for the edits before them and removes run together."""
+    player_queues = mass_client.player_queues
+    await controller.update_queue_items(QUEUE_ID, player_queues.event_data())
+    sent = []
+    running = 0
+    peak = 0
+
+    async def command(queue_id: str, queue_item_id: str) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        sent.append(queue_item_id)
+        running -= 1
+
+    player_queues.queue_command_delete = AsyncMock(side_effect=command)
+    player_queues.queue_command_move_up = AsyncMock(side_effect=command)
+    operations = queue_edits(
+        ("remove", "id10"),
+        ("remove", "id11"),
+        ("move_up", "id20"),
+        ("remove", "id12"),
+        ("move_up", "id21"),
+    )
+
+    results = await controller.edit_queue(QUEUE_ID, operations)
+
+    assert all(result["success"] for result in results)
+    assert set(sent[:2]) == {"id10", "id11"}
+    assert sent[2:] == ["id20", "id12", "id21"]
+    assert peak == 2
+
+
+async def test_edit_queue_reports_failures(
+    controller: MassQueueController,
+    mass_client: MagicMock,
+) -> None:
+    """Test a failed edit is reported without stopping the batch."""
+    player_queues = mass_client.player_queues
+    await controller.update_queue_items(QUEUE_ID, player_queues.event_data())
+    player_queues.queue_command_delete = AsyncMock(
+        side_effect=[RuntimeError("rejected"), None],
+    )
+
+    results = await controller.edit_queue(
+        QUEUE_ID,
+        queue_edits(("remove", "id10"), ("remove", "id0"), ("remove", "id11")),
+    )
+
+    assert [(result["success"], result["error"]) for result in results] == [
+        (False, "rejected"),
+        (False, "Item is already playing or buffered"),
+        (True, None),
+    ]
+    assert player_queues.queue_command_delete.await_count == 2
+
+
+async def test_clear_queue_bounds_concurrency(
+    controller: MassQueueController,
+    mass_client: MagicMock,
+) -> None:
+    """Test clearing a long queue fetches and removes a few items at a time."""
+    mass_client.player_queues = player_queues = FakePlayerQueues(10000)
+    controller.update_queue_state(QUEUE_ID, player_queues.event_data())
+
+    progress = await controller.clear_queue_after_current(QUEUE_ID)
+
+    assert progress == {
+        "queue_id": QUEUE_ID,
+        "total": 9999,
+        "removed": 9999,
+        "failed": 0,
+    }
+    assert len(player_queues.calls) == 100
+    assert player_queues.peak == QUEUE_CLEAR_CONCURRENCY
+
+
+class RecordingRefresh:
+    """Record the refreshes started by a scheduler."""
+
+    def __init__(self) -> None:
+        """Initialize the recorder."""
+        self.calls: list[tuple[str, dict | None]] = []
+        self.cancelled: list[tuple[str, dict | None]] = []
+        # Refreshes wait for this event when it is set
+        self.gate: asyncio.Event | None = None
+
+    async def __call__(self, queue_id: str, queue_data: dict | None) -> None:
+        """Refresh a queue."""
+        self.calls.append((queue_id, queue_data))
+        try:
+            if self.gate is not None:
+                await self.gate.wait()
+        except asyncio.CancelledError:
+            self.cancelled.append((queue_id, queue_data))
+            raise
+
+
+async def test_scheduler_coalesces_refreshes(hass: HomeAssistant) -> None:
+    """Test refreshes scheduled before the delay ends run once with the latest data."""
+    refresh = RecordingRefresh()
+    scheduler = QueueRefreshScheduler(hass, refresh, 0)
+    scheduler.schedule(QUEUE_ID, {"items": 1})
+    scheduler.schedule(QUEUE_ID, {"items": 2})
+    scheduler.schedule("other", None)
+    await settle()
+    assert refresh.calls == [(QUEUE_ID, {"items": 2}), ("other", None)]
+
+
+async def test_scheduler_keeps_pending_data(hass: HomeAssistant) -> None:
+    """Test a refresh without data keeps the data of the pending refresh."""
+    refresh = RecordingRefresh()
+    scheduler = QueueRefreshScheduler(hass, refresh, 0)
+    scheduler.schedule(QUEUE_ID, {"items": 1})
+    scheduler.schedule(QUEUE_ID)
+    await settle()
+    assert refresh.calls == [(QUEUE_ID, {"items": 1})]
+
+
+async def test_scheduler_supersedes_running_refresh(hass: HomeAssistant) -> None:
+    """Test a new refresh cancels the running one and starts once it has stopped."""
+    refresh = RecordingRefresh()
+    refresh.gate = asyncio.Event()
+    scheduler = QueueRefreshScheduler(hass, refresh, 0)
+    scheduler.schedule(QUEUE_ID, {"items": 1})
+    await settle()
+    scheduler.schedule(QUEUE_ID, {"items": 2})
+    await settle()
+    assert refresh.cancelled == [(QUEUE_ID, {"items": 1})]
+    assert refresh.calls == [(QUEUE_ID, {"items": 1}), (QUEUE_ID, {"items": 2})]
+
+    refresh.gate.set()
+    await settle()
+    assert len(refresh.cancelled) == 1
+
+
+async def test_scheduler_survives_failed_refresh(hass: HomeAssistant) -> None:
+    """Test a failed refresh does not stop later refreshes."""
+    refresh = AsyncMock(side_effect=[RuntimeError, None])
+    scheduler = QueueRefreshScheduler(hass, refresh, 0)
+    scheduler.schedule(QUEUE_ID)
+    await settle()
+    scheduler.schedule(QUEUE_ID)
+    await settle()
+    assert refresh.await_count == 2
+
+
+async def test_scheduler_cancel_all(hass: HomeAssistant) -> None:
+    """Test cancelling stops the running refreshes and drops the pending ones."""
+    refresh = RecordingRefresh()
+    refresh.gate = asyncio.Event()
+    scheduler = QueueRefreshScheduler(hass, refresh, 0)
+    scheduler.schedule(QUEUE_ID)
+    await settle()
+    delayed = QueueRefreshScheduler(hass, refresh, 60)
+    delayed.schedule("other")
+
+    scheduler.cancel_all()
+    delayed.cancel_all()
+    await settle()
+
+    assert refresh.calls == [(QUEUE_ID, None)]
+    assert refresh.cancelled == [(QUEUE_ID, None)]
+
+
+async def test_item_updates_refresh_once(
+    controller: MassQueueController,
+    mass_client: MagicMock,
+) -> None:
+    """Test a burst of item updates refreshes the queue once."""
+    player_queues = mass_client.player_queues
+    for _ in range(5):
+        controller.on_queue_items_update_event(
+            SimpleNamespace(
+                event="queue_items_updated",
+                object_id=QUEUE_ID,
+                data=player_queues.event_data(),
+            ),
+        )
+    await settle()
+    assert len(player_queues.calls) == 1
+    assert controller.queues.get(QUEUE_ID).loaded_pages() == [0, 1, 2]
+
+
+def store_snapshot(hass_storage: dict, entry: MockConfigEntry, data: dict) -> str:
+    """Store a queue cache snapshot for a config entry, returning its key."""
+    key = f"{QUEUE_STORAGE_KEY}.{entry.entry_id}"
+    hass_storage[key] = {
+        "version": QUEUE_STORAGE_VERSION,
+        "minor_version": 1,
+        "key": key,
+        "data": data,
+    }
+    return key
+
+
+async def test_snapshot_restored_as_stale(
+    hass: HomeAssistant,
+    hass_storage: dict,
+    config_entry: MockConfigEntry,
+    controller: MassQueueController,
+    mass_client: MagicMock,
+) -> None:
+    """Test a restored queue answers reads at once and is then revalidated."""
+    player_queues = mass_client.player_queues
+    await controller.update_queue_items(QUEUE_ID, player_queues.event_data())
+    await controller.async_save_snapshot()
+
+    restored = MassQueueController(hass, mass_client, config_entry)
+    await restored.async_restore_snapshot()
+    queue = restored.queues.get(QUEUE_ID)
+    assert queue.stale
+    assert queue.loaded_pages() == [0, 1, 2]
+
+    player_queues.calls.clear()
+    items = await restored.player_queue(QUEUE_ID, 10, 0)
+    assert [item.queue_item_id for item in items] == [f"id{i}" for i in range(10)]
+    assert player_queues.calls == []
+
+    await settle()
+    assert not queue.stale
+    assert player_queues.calls == [(0, 300)]
+    restored.shutdown()
+
+
+async def test_snapshot_follows_server_state(
+    hass_storage: dict,
+    config_entry: MockConfigEntry,
+    controller: MassQueueController,
+    mass_client: MagicMock,
+) -> None:
+    """Test only queues still on the server are restored, with their current size."""
+    player_queues = mass_client.player_queues
+    rows = [
+        [f"id{index}", "Track", "", "", "", None, False, 180] for index in range(200)
+    ]
+    stored = {"items": 1000, "current_index": 0, "runs": [[0, rows]]}
+    store_snapshot(
+        hass_storage,
+        config_entry,
+        {"queues": {QUEUE_ID: stored, "removed_queue": stored}},
+    )
+    player_queues.items = player_queues.items[:150]
+
+    await controller.async_restore_snapshot()
+
+    assert controller.queues.get("removed_queue") is None
+    queue = controller.queues.get(QUEUE_ID)
+    assert queue.items_count == 150
+    assert queue.index_of("id149") == 149
+    assert queue.index_of("id150") is None
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"cached_queues": {}},
+        {"queues": {QUEUE_ID: {"items": 1000, "runs": [[0, [["id0"]]]]}}},
+        {"queues": {QUEUE_ID: {"items": 1000, "runs": [0]}}},
+    ],
+)
+async def test_bad_snapshot_discarded(
+    hass_storage: dict,
+    config_entry: MockConfigEntry,
+    controller: MassQueueController,
+    data: dict,
+) -> None:
+    """Test a snapshot which cannot be restored is removed and nothing is restored."""
+    key = store_snapshot(hass_storage, config_entry, data)
+
+    await controller.async_restore_snapshot()
+
+    assert controller.queues.get(QUEUE_ID) is None
+    assert key not in hass_storage
+
+
+def make_client(player_queues: FakePlayerQueues) -> MagicMock:
+    """Return a Music Assistant client serving the queues."""
+    client = MagicMock()
+    client.player_queues = player_queues
+    return client
+
+
+async def test_reconnect_keeps_unchanged_queues(
+    controller: MassQueueController,
+    mass_client: MagicMock,
+) -> None:
+    """Test queues which did not change while disconnected are not refetched."""
+    player_queues = mass_client.player_queues
+    await controller.update_queue_items(QUEUE_ID, player_queues.event_data())
+    queue = controller.queues.get(QUEUE_ID)
+
+    client = make_client(FakePlayerQueues(1000))
+    controller.reconnect(client)
+    await settle()
+
+    assert client.player_queues.calls == []
+    assert controller.queues.get(QUEUE_ID) is queue
+    assert queue.loaded_pages() == [0, 1, 2]
+    assert client.subscribe.called
+    # Missing pages are fetched from the new client
+    await controller.player_queue(QUEUE_ID, 10, 500)
+    assert client.player_queues.calls == [(500, 100)]
+
+
+async def test_reconnect_refreshes_changed_queues(
+    controller: MassQueueController,
+    mass_client: MagicMock,
+) -> None:
+    """Test queues which changed while disconnected are refreshed."""
+    player_queues = mass_client.player_queues
+    await controller.update_queue_items(QUEUE_ID, player_queues.event_data())
+    controller.update_queue_state(QUEUE_ID, player_queues.event_data())
+
+    client = make_client(FakePlayerQueues(1200, current_index=5))
+    controller.reconnect(client)
+    await settle()
+
+    assert len(client.player_queues.calls) == 1
+    assert controller.queues.get(QUEUE_ID).items_count == 1200
+    assert await controller.get_queue_index(QUEUE_ID) == 5
+
+
+async def test_reconnect_drops_removed_queues(
+    controller: MassQueueController,
+    mass_client: MagicMock,
+) -> None:
+    """Test queues no longer on the server are dropped."""
+    player_queues = mass_client.player_queues
+    await controller.update_queue_items(QUEUE_ID, player_queues.event_data())
+    controller.update_queue_state(QUEUE_ID, player_queues.event_data())
+
+    client = make_client(FakePlayerQueues(0))
+    client.player_queues.get = MagicMock(return_value=None)
+    controller.reconnect(client)
+    await settle()
+
+    assert controller.queues.get(QUEUE_ID) is None
+    assert controller.get_cache_info()["queue_states"] == 0
+
+
+PLAYER_ID = "test_player"
+
+
+def player_updated_event(**fields) -> SimpleNamespace:
+    """Return a PLAYER_UPDATED event."""
+    data = {
+        "player_id": PLAYER_ID,
+        "playback_state": "playing",
+        "volume_level": 20,
+        "elapsed_time": 0,
+        "current_media": {"queue_id": QUEUE_ID, "elapsed_time": 0},
+        **fields,
+    }
+    return SimpleNamespace(event="player_updated", object_id=PLAYER_ID, data=data)
+
+
+def player_event_controller(
+    hass: HomeAssistant,
+    mass_client: MagicMock,
+    options: dict,
+) -> tuple[MassQueueController, list[dict]]:
+    """Return a controller for the options and the player events it forwards."""
+    mass_client.players.get.return_value = {"current_media": {"queue_id": QUEUE_ID}}
+    controller = MassQueueController(
+        hass,
+        mass_client,
+        MockConfigEntry(domain=DOMAIN, options=options),
+    )
+    sent = []
+    controller.send_ha_event = sent.append
+    return controller, sent
+
+
+async def test_player_events_filtered(
+    hass: HomeAssistant,
+    mass_client: MagicMock,
+) -> None:
+    """Test only changes of the watched fields are forwarded."""
+    controller, sent = player_event_controller(hass, mass_client, {})
+    controller.on_player_event(player_updated_event())
+    controller.on_player_event(
+        player_updated_event(
+            elapsed_time=5,
+            current_media={"queue_id": QUEUE_ID, "elapsed_time": 5},
+        ),
+    )
+    controller.on_player_event(player_updated_event(volume_level=30))
+
+    assert [event["data"]["volume_level"] for event in sent] == [20, 30]
+    assert sent[0] == {
+        "type": "player_updated",
+        "object_id": PLAYER_ID,
+        "data": player_updated_event().data,
+    }
+    controller.shutdown()
+
+
+async def test_player_event_fields_option(
+    hass: HomeAssistant,
+    mass_client: MagicMock,
+) -> None:
+    """Test the watched fields can be configured."""
+    controller, sent = player_event_controller(
+        hass,
+        mass_client,
+        {CONF_PLAYER_EVENT_FIELDS: ["playback_state"]},
+    )
+    controller.on_player_event(player_updated_event())
+    controller.on_player_event(player_updated_event(volume_level=30))
+    controller.on_player_event(player_updated_event(playback_state="paused"))
+
+    assert [event["data"]["playback_state"] for event in sent] == [
+        "playing",
+        "paused",
+    ]
+    controller.shutdown()
+
+
+async def test_player_events_throttled(
+    hass: HomeAssistant,
+    mass_client: MagicMock,
+) -> None:
+    """Test unchanged updates are forwarded once per interval, latest first."""
+    controller, sent = player_event_controller(
+        hass,
+        mass_client,
+        {CONF_PLAYER_EVENT_INTERVAL: 0.05},
+    )
+    controller.on_player_event(player_updated_event())
+    for elapsed_time in range(1, 4):
+        controller.on_player_event(player_updated_event(elapsed_time=elapsed_time))
+    assert len(sent) == 1
+
+    await asyncio.sleep(0.1)
+    assert [event["data"]["elapsed_time"] for event in sent] == [0, 3]
+
+    # A change is forwarded at once, replacing the pending update
+    controller.on_player_event(player_updated_event(volume_level=30))
+    controller.on_player_event(player_updated_event(volume_level=30, elapsed_time=4))
+    controller.on_player_event(player_updated_event(volume_level=40))
+    await asyncio.sleep(0.1)
+    assert [event["data"]["volume_level"] for event in sent] == [20, 20, 30, 40]
+    assert [event["data"]["elapsed_time"] for event in sent] == [0, 3, 0, 0]
+    controller.shutdown()
+
+
+async def test_pending_player_event_cancelled_on_shutdown(
+    hass: HomeAssistant,
+    mass_client: MagicMock,
+) -> None:
+    """Test a throttled update is dropped when the controller shuts down."""
+    controller, sent = player_event_controller(
+        hass,
+        mass_client,
+        {CONF_PLAYER_EVENT_INTERVAL: 0.05},
+    )
+    controller.on_player_event(player_updated_event())
+    controller.on_player_event(player_updated_event(elapsed_time=1))
+    controller.shutdown()
+
+    await asyncio.sleep(0.1)
+    assert len(sent) == 1
@@ -0,0 +1,98 @@
+"""Test the mass_queue image disk cache."""
+
+import os
+from pathlib import Path
+
+from homeassistant.components.mass_queue.const import DOMAIN
+from homeassistant.components.mass_queue.image_cache import ImageDiskCache
+from homeassistant.core import HomeAssistant
+
+IMAGE_SIZE = 400 * 1024
+
+
+def image(value: int) -> bytes:
+    """Return image data of a fixed size."""
+    return bytes([value]) * IMAGE_SIZE
+
+
+async def test_hit_and_miss(hass: HomeAssistant) -> None:
+    """Test cached images are returned and counted."""
+    cache = ImageDiskCache(hass, size_limit=1)
+    await cache.async_load()
+    key = ImageDiskCache.key("http://mass.local/image.jpg", 256)
+
+    assert await cache.async_get(key) is None
+    await cache.async_set(key, image(1))
+    assert key in cache
+    assert await cache.async_get(key) == image(1)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.size == IMAGE_SIZE
+
+
+def test_keys_differ_per_size() -> None:
+    """Test resized versions of an image are cached separately."""
+    url = "http://mass.local/image.jpg"
+    assert ImageDiskCache.key(url, 256) != ImageDiskCache.key(url, 512)
+    assert ImageDiskCache.key(url, 256) == ImageDiskCache.key(url, 256)
+
+
+async def test_evicts_least_recently_used(hass: HomeAssistant) -> None:
+    """Test the least recently used images are evicted over the size limit."""
+    cache = ImageDiskCache(hass, size_limit=1)
+    await cache.async_load()
+    path = Path(hass.config.path(DOMAIN, "images"))
+
+    await cache.async_set("a", image(1))
+    await cache.async_set("b", image(2))
+    await cache.async_get("a")
+    await cache.async_set("c", image(3))
+
+    assert "b" not in cache
+    assert not (path / "b").exists()
+    assert "a" in cache
+    assert "c" in cache
+    assert cache.size == 2 * IMAGE_SIZE
+
+
+async def test_replacing_an_image(hass: HomeAssistant) -> None:
+    """Test storing a key again replaces the image without double counting."""
+    cache = ImageDiskCache(hass, size_limit=1)
+    await cache.async_load()
+
+    await cache.async_set("a", image(1))
+    await cache.async_set("a", b"small")
+
+    assert len(cache) == 1
+    assert cache.size == len(b"small")
+    assert await cache.async_get("a") == b"small"
+
+
+async def test_load_existing_images(hass: HomeAssistant) -> None:
+    """Test images on disk are indexed and evicted oldest first on load."""
+    path = Path(hass.config.path(DOMAIN, "images"))
+    path.mkdir(parents=True)
+    for mtime, key in enumerate(("old", "middle", "new")):
+        (path / key).write_bytes(image(mtime))
+        os.utime(path / key, (mtime, mtime))
+    (path / "partial.tmp").write_bytes(b"partial")
+
+    cache = ImageDiskCache(hass, size_limit=1)
+    await cache.async_load()
+
+    assert len(cache) == 2
+    assert "old" not in cache
+    assert not (path / "old").exists()
+    assert await cache.async_get("new") == image(2)
+
+
+async def test_missing_file_is_a_miss(hass: HomeAssistant) -> None:
+    """Test an image deleted from disk is dropped from the index."""
+    cache = ImageDiskCache(hass, size_limit=1)
+    await cache.async_load()
+    await cache.async_set("a", image(1))
+    (Path(hass.config.path(DOMAIN, "images")) / "a").unlink()
+
+    assert await cache.async_get("a") is None
+    assert "a" not in cache
+    assert cache.size == 0
+    assert cache.misses == 1
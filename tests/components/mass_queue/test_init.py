@@ -0,0 +1,109 @@
+"""Tests for reconnecting to the Music Assistant server."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+import pytest
+from homeassistant.components.mass_queue import _async_reconnect
+from homeassistant.components.mass_queue.const import DOMAIN
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_URL
+from homeassistant.core import HomeAssistant
+from music_assistant_client.exceptions import CannotConnect
+from music_assistant_models.errors import InvalidToken
+
+from tests.common import MockConfigEntry
+
+MODULE = "homeassistant.components.mass_queue"
+
+
+def make_client(error: Exception | None = None) -> MagicMock:
+    """Return a client failing to connect with the error or listening forever."""
+    client = MagicMock()
+    client.connect = AsyncMock(side_effect=error)
+    client.disconnect = AsyncMock()
+
+    async def start_listening(init_ready: asyncio.Event) -> None:
+        init_ready.set()
+        await asyncio.Event().wait()
+
+    client.start_listening = start_listening
+    return client
+
+
+@pytest.fixture
+def entry() -> MockConfigEntry:
+    """Return a loaded config entry."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_URL: "http://mass.local:8095"},
+        state=ConfigEntryState.LOADED,
+    )
+    entry.runtime_data = MagicMock()
+    return entry
+
+
+@pytest.fixture
+def sleep():
+    """Patch the reconnect delay."""
+    with (
+        patch(f"{MODULE}.async_get_clientsession"),
+        patch(f"{MODULE}.asyncio.sleep", new_callable=AsyncMock) as sleep,
+    ):
+        yield sleep
+
+
+async def test_reconnect_backs_off(
+    hass: HomeAssistant,
+    entry: MockConfigEntry,
+    sleep: AsyncMock,
+) -> None:
+    """Test failed attempts double the delay until a client connects."""
+    clients = [
+        make_client(CannotConnect("down")),
+        make_client(CannotConnect("down")),
+        make_client(),
+    ]
+    with patch(f"{MODULE}.MusicAssistantClient", side_effect=clients):
+        await _async_reconnect(hass, entry)
+
+    assert sleep.await_args_list == [call(1), call(2), call(4)]
+    assert entry.runtime_data.mass is clients[2]
+    entry.runtime_data.actions.reconnect.assert_called_once_with(clients[2])
+    listen_task = entry.runtime_data.listen_task
+    assert not listen_task.done()
+    listen_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await listen_task
+
+
+@pytest.mark.usefixtures("sleep")
+async def test_reconnect_auth_failed(
+    hass: HomeAssistant,
+    entry: MockConfigEntry,
+) -> None:
+    """Test an authentication error starts a reauth instead of retrying."""
+    client = make_client(InvalidToken("expired"))
+    with (
+        patch(f"{MODULE}.MusicAssistantClient", return_value=client) as factory,
+        patch.object(entry, "async_start_reauth") as start_reauth,
+    ):
+        await _async_reconnect(hass, entry)
+
+    assert factory.call_count == 1
+    start_reauth.assert_called_once_with(hass)
+    entry.runtime_data.actions.reconnect.assert_not_called()
+
+
+async def test_reconnect_entry_not_loaded(
+    hass: HomeAssistant,
+    entry: MockConfigEntry,
+    sleep: AsyncMock,
+) -> None:
+    """Test no attempt is made once the entry is unloaded."""
+    entry.state = ConfigEntryState.NOT_LOADED
+    with patch(f"{MODULE}.MusicAssistantClient") as factory:
+        await _async_reconnect(hass, entry)
+
+    sleep.assert_not_awaited()
+    factory.assert_not_called()
@@ -0,0 +1,135 @@
+"""Test the mass_queue metadata cache."""
+
+import asyncio
+from types import SimpleNamespace
+
+from homeassistant.components.mass_queue.metadata_cache import MetadataCache
+
+
+class FakeLibrary:
+    """Serve albums like the music controller of the Music Assistant client."""
+
+    def __init__(self) -> None:
+        """Initialize the fake library."""
+        self.calls: list[str] = []
+        self.version = 0
+
+    async def fetch(self, uri: str) -> SimpleNamespace:
+        """Return the album for a URI."""
+        self.calls.append(uri)
+        self.version += 1
+        item_id = uri.split("/")[-1]
+        mapping = {
+            "provider_domain": "spotify",
+            "provider_instance": "spotify--abc",
+            "item_id": f"sp{item_id}",
+        }
+        data = {
+            "uri": uri,
+            "item_id": item_id,
+            "provider": "library",
+            "provider_mappings": [mapping],
+        }
+        return SimpleNamespace(
+            version=self.version,
+            provider_mappings=[SimpleNamespace(**mapping)],
+            to_dict=lambda: data,
+        )
+
+
+async def test_cached_until_expired() -> None:
+    """Test details are fetched once until they expire."""
+    library = FakeLibrary()
+    cache = MetadataCache(ttl=3600)
+    first = await cache.get("library://album/1", library.fetch)
+    assert await cache.get("library://album/1", library.fetch) is first
+    assert library.calls == ["library://album/1"]
+    assert cache.get_cache_info() == {"items": 1, "hits": 1, "misses": 1}
+
+    expiring = MetadataCache(ttl=0)
+    await expiring.get("library://album/1", library.fetch)
+    await expiring.get("library://album/1", library.fetch)
+    assert len(library.calls) == 3
+
+
+async def test_concurrent_misses_share_a_fetch() -> None:
+    """Test concurrent requests for a URI share one fetch."""
+    library = FakeLibrary()
+    cache = MetadataCache()
+    items = await asyncio.gather(
+        *[cache.get("library://album/1", library.fetch) for _ in range(3)],
+    )
+    assert len({id(item) for item in items}) == 1
+    assert library.calls == ["library://album/1"]
+
+
+async def test_size_limit_evicts_least_recently_used() -> None:
+    """Test the least recently used details are evicted over the size limit."""
+    library = FakeLibrary()
+    cache = MetadataCache(size_limit=2)
+    await cache.get("library://album/1", library.fetch)
+    await cache.get("library://album/2", library.fetch)
+    await cache.get("library://album/1", library.fetch)
+    await cache.get("library://album/3", library.fetch)
+    assert len(cache) == 2
+
+    library.calls.clear()
+    await cache.get("library://album/1", library.fetch)
+    await cache.get("library://album/3", library.fetch)
+    assert library.calls == []
+    await cache.get("library://album/2", library.fetch)
+    assert library.calls == ["library://album/2"]
+
+
+async def test_provider_mapping() -> None:
+    """Test the first provider mapping of the item is returned."""
+    library = FakeLibrary()
+    cache = MetadataCache()
+    mapping = await cache.get_provider_mapping("library://album/1", library.fetch)
+    assert mapping.item_id == "sp1"
+
+
+async def test_media_item_event_invalidates() -> None:
+    """Test update events drop the item by URI or by any of its provider IDs."""
+    library = FakeLibrary()
+    cache = MetadataCache()
+    await cache.get("library://album/1", library.fetch)
+    await cache.get("library://album/2", library.fetch)
+
+    cache.on_media_item_event(
+        SimpleNamespace(object_id="library://album/1", data=None),
+    )
+    assert len(cache) == 1
+    # Updates of a provider item reach the library item it is mapped to
+    cache.on_media_item_event(
+        SimpleNamespace(
+            object_id=None,
+            data={"uri": "spotify://album/sp2", "item_id": "sp2", "provider": "x"},
+        ),
+    )
+    assert len(cache) == 0
+
+    await cache.get("library://album/1", library.fetch)
+    assert library.calls.count("library://album/1") == 2
+
+
+async def test_update_during_fetch_not_cached() -> None:
+    """Test details fetched while the item was updated are not kept."""
+    library = FakeLibrary()
+    cache = MetadataCache()
+    started = asyncio.Event()
+    gate = asyncio.Event()
+
+    async def fetch(uri: str) -> SimpleNamespace:
+        started.set()
+        await gate.wait()
+        return await library.fetch(uri)
+
+    request = asyncio.ensure_future(cache.get("library://album/1", fetch))
+    await started.wait()
+    cache.invalidate({"uri": "library://album/1"})
+    gate.set()
+
+    assert (await request).version == 1
+    assert len(cache) == 0
+    assert (await cache.get("library://album/1", library.fetch)).version == 2
@@ -0,0 +1,146 @@
+"""Test the queue subscriptions."""
+
+import random
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.components.mass_queue.const import (
+    ATTR_QUEUE_ITEM_ID,
+    QUEUE_MAX_CACHED_PAGES,
+)
+from homeassistant.components.mass_queue.controller import MassQueueController
+from homeassistant.components.mass_queue.queue_subscription import (
+    QueueSubscription,
+    diff_queue_window,
+)
+from homeassistant.core import HomeAssistant
+
+from . import QUEUE_ID, FakePlayerQueues, settle
+
+OFFSET = 100
+
+
+def make_rows(*queue_item_ids: str) -> list[dict]:
+    """Return the formatted rows of queue items."""
+    return [
+        {ATTR_QUEUE_ITEM_ID: queue_item_id, "name": queue_item_id}
+        for queue_item_id in queue_item_ids
+    ]
+
+
+def apply_changes(rows: list[dict], changes: list[dict], offset: int) -> list[dict]:
+    """Apply the changes to a window of rows like a frontend would."""
+    rows = list(rows)
+
+    def position_of(queue_item_id: str) -> int:
+        return next(
+            index
+            for index, row in enumerate(rows)
+            if row[ATTR_QUEUE_ITEM_ID] == queue_item_id
+        )
+
+    for change in changes:
+        if change["op"] == "remove":
+            del rows[position_of(change[ATTR_QUEUE_ITEM_ID])]
+        elif change["op"] == "insert":
+            rows.insert(change["position"] - offset, change["item"])
+        elif change["op"] == "move":
+            row = rows.pop(position_of(change[ATTR_QUEUE_ITEM_ID]))
+            rows.insert(change["position"] - offset, row)
+        else:
+            rows[position_of(change["item"][ATTR_QUEUE_ITEM_ID])] = change["item"]
+    return rows
+
+
+def test_unchanged_window_has_no_changes() -> None:
+    """Test the same rows produce no changes."""
+    rows = make_rows("a", "b", "c")
+    assert diff_queue_window(rows, rows, OFFSET) == []
+    assert diff_queue_window(rows, make_rows("a", "b", "c"), OFFSET) == []
+
+
+@pytest.mark.parametrize(
+    ("old", "new", "ops"),
+    [
+        (("a", "b", "c"), ("a", "c"), ["remove"]),
+        (("a", "b", "c"), ("a", "x", "b", "c"), ["insert"]),
+        (("a", "b", "c", "d"), ("a", "d", "b", "c"), ["move"]),
+        (("a", "b", "c", "d"), ("b", "c", "d", "e"), ["remove", "insert"]),
+        ((), ("a", "b"), ["insert", "insert"]),
+        (("a", "b"), (), ["remove", "remove"]),
+    ],
+)
+def test_diff_queue_window(
+    old: tuple[str, ...],
+    new: tuple[str, ...],
+    ops: list[str],
+) -> None:
+    """Test the changes turn the old window into the new one."""
+    old_rows = make_rows(*old)
+    new_rows = make_rows(*new)
+    changes = diff_queue_window(old_rows, new_rows, OFFSET)
+    assert [change["op"] for change in changes] == ops
+    assert apply_changes(old_rows, changes, OFFSET) == new_rows
+
+
+def test_changed_row_is_updated() -> None:
+    """Test a row with new details is sent as an update."""
+    old_rows = make_rows("a", "b")
+    new_rows = make_rows("a", "b")
+    new_rows[1]["name"] = "renamed"
+    assert diff_queue_window(old_rows, new_rows, OFFSET) == [
+        {"op": "update", "item": new_rows[1]},
+    ]
+
+
+def test_diff_queue_window_random() -> None:
+    """Test random edits of a window are reproduced by the changes."""
+    rng = random.Random(0)
+    for _ in range(500):
+        old_ids = [f"id{index}" for index in range(rng.randrange(0, 12))]
+        new_ids = [queue_item_id for queue_item_id in old_ids if rng.random() > 0.2]
+        if rng.random() > 0.5:
+            rng.shuffle(new_ids)
+        for index in range(rng.randrange(0, 4)):
+            new_ids.insert(rng.randrange(0, len(new_ids) + 1), f"new{index}")
+        old_rows = make_rows(*old_ids)
+        new_rows = make_rows(*new_ids)
+        for row in new_rows:
+            if rng.random() < 0.1:
+                row["name"] = "renamed"
+        changes = diff_queue_window(old_rows, new_rows, OFFSET)
+        assert apply_changes(old_rows, changes, OFFSET) == new_rows, (old_ids, new_ids)
+
+
+async def test_subscription_larger_than_cache(
+    hass: HomeAssistant,
+    controller: MassQueueController,
+    mass_client: MagicMock,
+) -> None:
+    """Test a window spanning more pages than are cached is fetched only once."""
+    mass_client.player_queues = player_queues = FakePlayerQueues(3000)
+    messages = []
+    subscription = QueueSubscription(
+        hass,
+        controller,
+        QUEUE_ID,
+        0,
+        1500,
+        messages.append,
+    )
+    await subscription.async_start()
+    await settle()
+    queue = controller.queues.get(QUEUE_ID)
+    calls = len(player_queues.calls)
+    assert len(messages[0]["items"]) == 1501
+    # The pages of the window are kept, beyond the usual number of cached pages
+    assert queue.loaded_pages() == list(range(16))
+
+    controller.notify_queue_listeners(QUEUE_ID)
+    await settle()
+    assert len(player_queues.calls) == calls
+    assert len(messages) == 1
+
+    subscription.async_stop()
+    queue.evict_distant_pages(QUEUE_MAX_CACHED_PAGES)
+    assert len(queue.loaded_pages()) == QUEUE_MAX_CACHED_PAGES
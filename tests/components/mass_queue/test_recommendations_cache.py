@@ -0,0 +1,129 @@
+"""Test the mass_queue recommendations cache."""
+
+import asyncio
+
+import pytest
+from homeassistant.components.mass_queue import recommendations_cache
+from homeassistant.components.mass_queue.recommendations_cache import (
+    RecommendationsCache,
+)
+from homeassistant.core import HomeAssistant
+
+from . import settle
+
+
+class FakeRecommendations:
+    """Serve recommendation sections, one new version per fetch."""
+
+    def __init__(self) -> None:
+        """Initialize the fake recommendations."""
+        self.calls = 0
+        self.error: Exception | None = None
+        self.gate: asyncio.Event | None = None
+
+    async def fetch(self) -> list[dict]:
+        """Return the sections of every provider."""
+        self.calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return [
+            {"provider": "spotify--abc", "version": self.calls},
+            {"provider": "tidal--def", "version": self.calls},
+        ]
+
+
+@pytest.fixture(autouse=True)
+def keep_sections(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Skip formatting, so the fetched sections are served as they are."""
+    monkeypatch.setattr(recommendations_cache, "process_recommendations", list)
+
+
+async def test_fresh_sections_served_from_cache(hass: HomeAssistant) -> None:
+    """Test sections are fetched once while fresh."""
+    recs = FakeRecommendations()
+    cache = RecommendationsCache(hass, recs.fetch, ttl=3600)
+    first = await cache.get()
+    assert await cache.get() is first
+    assert recs.calls == 1
+    assert cache.get_cache_info() == {"sections": 2, "age": 0}
+
+
+async def test_stale_sections_served_while_refreshing(hass: HomeAssistant) -> None:
+    """Test stale sections are returned at once and refreshed in the background."""
+    recs = FakeRecommendations()
+    cache = RecommendationsCache(hass, recs.fetch, ttl=0)
+    await cache.get()
+    recs.gate = asyncio.Event()
+
+    stale = await asyncio.gather(cache.get(), cache.get())
+    assert [section["version"] for section in stale[0]] == [1, 1]
+    assert stale[1] is stale[0]
+    await settle()
+    assert recs.calls == 2
+
+    recs.gate.set()
+    await settle()
+    recs.gate = None
+    assert [section["version"] for section in await cache.get()] == [2, 2]
+    await settle()
+
+
+async def test_failed_refresh_keeps_sections(hass: HomeAssistant) -> None:
+    """Test a failed refresh keeps serving the cached sections."""
+    recs = FakeRecommendations()
+    cache = RecommendationsCache(hass, recs.fetch, ttl=0)
+    first = await cache.get()
+    recs.error = RuntimeError("unavailable")
+
+    assert await cache.get() is first
+    await settle()
+    assert recs.calls == 2
+    assert await cache.get() is first
+    await settle()
+    assert recs.calls == 3
+
+
+async def test_failed_first_fetch_raises(hass: HomeAssistant) -> None:
+    """Test a failed fetch is raised when nothing is cached."""
+    recs = FakeRecommendations()
+    recs.error = RuntimeError("unavailable")
+    cache = RecommendationsCache(hass, recs.fetch)
+
+    with pytest.raises(RuntimeError):
+        await cache.get()
+
+    recs.error = None
+    assert len(await cache.get()) == 2
+
+
+async def test_sections_filtered_by_provider(hass: HomeAssistant) -> None:
+    """Test sections are filtered by provider prefix and the filter is cached."""
+    recs = FakeRecommendations()
+    cache = RecommendationsCache(hass, recs.fetch, ttl=3600)
+
+    spotify = await cache.get(["spotify"])
+    assert [section["provider"] for section in spotify] == ["spotify--abc"]
+    assert await cache.get(["spotify"]) is spotify
+    assert len(await cache.get(["tidal", "spotify"])) == 2
+    assert await cache.get(["qobuz"]) == []
+    assert recs.calls == 1
+
+
+async def test_cancel_refresh(hass: HomeAssistant) -> None:
+    """Test a refresh in progress is cancelled on unload."""
+    recs = FakeRecommendations()
+    cache = RecommendationsCache(hass, recs.fetch, ttl=0)
+    await cache.get()
+    recs.gate = asyncio.Event()
+    await cache.get()
+    await settle()
+
+    cache.cancel()
+    await settle()
+    recs.gate.set()
+    await settle()
+    assert cache.get_cache_info()["sections"] == 2
+    assert [section["version"] for section in await cache.get()] == [1, 1]
+    await settle()
@@ -0,0 +1,298 @@
+"""Test the mass_queue utilities."""
+
+import asyncio
+import random
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.components.mass_queue import utils
+from homeassistant.components.mass_queue.const import DOMAIN, TRACK_PAGE_MAX
+from homeassistant.components.mass_queue.utils import (
+    SingleFlight,
+    encode_fetched_image,
+    fetch_image,
+    fetch_paged_items,
+    is_music_assistant_url,
+    supports_paging,
+    validate_response,
+)
+from homeassistant.const import CONF_URL
+from homeassistant.core import HomeAssistant
+
+from tests.common import MockConfigEntry
+
+
+class FakePages:
+    """Serve a list of items in fixed size pages."""
+
+    def __init__(self, count: int, page_size: int = 10) -> None:
+        """Initialize the fake pages."""
+        self.items = list(range(count))
+        self.page_size = page_size
+        self.calls: list[int] = []
+
+    async def fetch_page(self, page: int) -> list[int]:
+        """Return a page of items."""
+        self.calls.append(page)
+        start = page * self.page_size
+        return self.items[start : start + self.page_size]
+
+
+@pytest.mark.parametrize(
+    ("count", "offset", "limit"),
+    [
+        (95, 0, None),
+        (100, 0, None),
+        (95, 35, 20),
+        (95, 2, 5),
+        (95, 90, 20),
+        (25, 40, 10),
+        (0, 0, None),
+    ],
+)
+async def test_fetch_paged_items_slice(
+    count: int,
+    offset: int,
+    limit: int | None,
+) -> None:
+    """Test the requested slice is returned, fetching each page once."""
+    pages = FakePages(count)
+    end = None if limit is None else offset + limit
+    assert (
+        await fetch_paged_items(pages.fetch_page, offset, limit)
+        == list(
+            range(count),
+        )[offset:end]
+    )
+    assert len(pages.calls) == len(set(pages.calls))
+
+
+async def test_fetch_paged_items_within_first_page() -> None:
+    """Test a slice inside the first page fetches a single page."""
+    pages = FakePages(95)
+    assert await fetch_paged_items(pages.fetch_page, 2, 5) == [2, 3, 4, 5, 6]
+    assert pages.calls == [0]
+
+
+async def test_fetch_paged_items_skips_pages_before_offset() -> None:
+    """Test only the first page and the pages of the slice are fetched."""
+    pages = FakePages(95)
+    assert await fetch_paged_items(pages.fetch_page, 35, 20) == list(range(35, 55))
+    assert pages.calls == [0, 3, 4, 5]
+
+
+async def test_fetch_paged_items_stops_on_short_page() -> None:
+    """Test no batch is fetched after the one with the last page."""
+    pages = FakePages(35)
+    assert await fetch_paged_items(pages.fetch_page, concurrency=4) == list(range(35))
+    # Pages 2 and 3 share a batch, page 3 is short
+    assert pages.calls == [0, 1, 2, 3]
+
+
+async def test_fetch_paged_items_limits_concurrency() -> None:
+    """Test at most `concurrency` pages are fetched at once."""
+    pages = FakePages(1000)
+    running = peak = 0
+
+    async def fetch_page(page: int) -> list[int]:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return await pages.fetch_page(page)
+
+    items = await fetch_paged_items(fetch_page, limit=500, concurrency=8)
+    assert items == list(range(500))
+    assert sorted(pages.calls) == list(range(50))
+    assert peak == 8
+
+
+async def test_fetch_paged_items_matches_slicing() -> None:
+    """Test random slices match slicing the full list."""
+    rng = random.Random(0)
+    for _ in range(200):
+        count = rng.randrange(0, 120)
+        page_size = rng.randrange(1, 15)
+        offset = rng.randrange(0, count + 10)
+        limit = rng.choice([None, rng.randrange(1, 60)])
+        concurrency = rng.randrange(1, 6)
+        pages = FakePages(count, page_size)
+        end = None if limit is None else offset + limit
+        items = await fetch_paged_items(pages.fetch_page, offset, limit, concurrency)
+        assert items == pages.items[offset:end], (count, page_size, offset, limit)
+        assert len(pages.calls) == len(set(pages.calls))
+
+
+@pytest.mark.parametrize("limit", [None, 50])
+async def test_fetch_paged_items_page_ignored(limit: int | None) -> None:
+    """Test fetching stops when the server returns the same page again."""
+    calls = []
+
+    async def fetch_page(page: int) -> list[int]:
+        calls.append(page)
+        return list(range(10))
+
+    assert await fetch_paged_items(fetch_page, 0, limit) == list(range(10))
+    assert calls == [0, 1]
+
+
+async def test_fetch_paged_items_page_cap() -> None:
+    """Test fetching stops after the maximum number of pages."""
+    calls = []
+
+    async def fetch_page(page: int) -> list[int]:
+        calls.append(page)
+        return list(range(page * 10, page * 10 + 10))
+
+    items = await fetch_paged_items(fetch_page)
+    assert items == list(range(TRACK_PAGE_MAX * 10))
+    assert sorted(calls) == list(range(TRACK_PAGE_MAX))
+
+
+def test_supports_paging() -> None:
+    """Test client calls are checked for a page argument."""
+
+    async def paged(item_id: str, provider: str, page: int = 0) -> list:
+        return []
+
+    async def unpaged(item_id: str, provider: str, force_refresh: bool = False) -> list:
+        return []
+
+    assert supports_paging(paged)
+    assert not supports_paging(unpaged)
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("http://192.168.1.10:8095/imageproxy?path=cover.jpg", True),
+        ("http://192.168.1.10:8095/", True),
+        ("http://192.168.1.10:8123/api/states", False),
+        ("http://192.168.1.11:8095/imageproxy", False),
+        ("http://169.254.169.254/latest/meta-data", False),
+        ("/imageproxy?path=cover.jpg", False),
+    ],
+)
+def test_is_music_assistant_url(
+    hass: HomeAssistant,
+    url: str,
+    expected: bool,
+) -> None:
+    """Test only URLs on the configured server are Music Assistant URLs."""
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_URL: "http://192.168.1.10:8095"})
+    entry.add_to_hass(hass)
+    assert is_music_assistant_url(hass, url) is expected
+
+
+def test_validate_response_opt_in(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test responses are only validated when explicitly enabled."""
+    schema = MagicMock(return_value={"validated": True})
+    response = {"name": "Track"}
+    assert validate_response(schema, response) is response
+    schema.assert_not_called()
+
+    monkeypatch.setattr(utils, "VALIDATE_RESPONSES", True)
+    assert validate_response(schema, response) == {"validated": True}
+    schema.assert_called_once_with(response)
+
+
+class SlowCall:
+    """Count calls which finish when released."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        """Initialize the call."""
+        self.calls = 0
+        self.error = error
+        self.release = asyncio.Event()
+
+    async def __call__(self, value: str) -> str:
+        """Return the value once released."""
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return value
+
+
+async def test_single_flight_shares_calls() -> None:
+    """Test concurrent requests for a key share one call."""
+    flight = SingleFlight()
+    func = SlowCall()
+    tasks = [asyncio.create_task(flight.run("a", func, "result")) for _ in range(3)]
+    other = asyncio.create_task(flight.run("b", func, "other"))
+    await asyncio.sleep(0)
+    func.release.set()
+
+    assert await asyncio.gather(*tasks) == ["result"] * 3
+    assert await other == "other"
+    assert func.calls == 2
+    assert flight.coalesced == 2
+
+    # Finished calls are not shared with later requests
+    assert await flight.run("a", func, "again") == "again"
+    assert func.calls == 3
+
+
+async def test_single_flight_shares_errors() -> None:
+    """Test an error is raised to every request and not kept."""
+    flight = SingleFlight()
+    func = SlowCall(ValueError("failed"))
+    tasks = [asyncio.create_task(flight.run("a", func, "result")) for _ in range(2)]
+    await asyncio.sleep(0)
+    func.release.set()
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert [type(result) for result in results] == [ValueError, ValueError]
+    func.error = None
+    assert await flight.run("a", func, "result") == "result"
+    assert func.calls == 2
+
+
+async def test_single_flight_cancelled_request() -> None:
+    """Test cancelling one request does not cancel the shared call."""
+    flight = SingleFlight()
+    func = SlowCall()
+    first = asyncio.create_task(flight.run("a", func, "result"))
+    second = asyncio.create_task(flight.run("a", func, "result"))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    func.release.set()
+
+    assert await second == "result"
+    assert first.cancelled()
+    assert func.calls == 1
+
+
+async def test_image_requests_count_downloads_only(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test only joined downloads are counted as coalesced image requests."""
+    monkeypatch.setattr(utils, "IMAGE_REQUESTS", SingleFlight())
+    monkeypatch.setattr(utils, "IMAGE_CONVERSIONS", SingleFlight())
+    download = SlowCall()
+    monkeypatch.setattr(
+        utils,
+        "_fetch_image",
+        lambda url, cache_key, hass: download(b"image"),  # noqa: ARG005
+    )
+    url = "http://mass.local/image.jpg"
+
+    downloads = [asyncio.create_task(fetch_image(url, "key", hass)) for _ in range(2)]
+    encodes = [
+        asyncio.create_task(encode_fetched_image("key", fetch_image, url, "key", hass))
+        for _ in range(2)
+    ]
+    # Let the encode reach the download
+    for _ in range(3):
+        await asyncio.sleep(0)
+    download.release.set()
+
+    assert await asyncio.gather(*downloads) == [b"image"] * 2
+    assert len(set(await asyncio.gather(*encodes))) == 1
+    assert download.calls == 1
+    # A request and the shared encode joined the download, an encode the encode
+    assert utils.IMAGE_REQUESTS.coalesced == 2
+    assert utils.IMAGE_CONVERSIONS.coalesced == 1
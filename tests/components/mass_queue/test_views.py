@@ -0,0 +1,71 @@
+"""Test the mass_queue HTTP views."""
+
+from unittest.mock import AsyncMock, patch
+from urllib.parse import parse_qs, urlsplit
+
+from homeassistant.components.mass_queue.const import (
+    IMAGE_URL_LIFETIME,
+    IMAGE_URL_MAX_SOURCES,
+)
+from homeassistant.components.mass_queue.views import ImageUrls
+
+NOW = 1_700_000_000
+
+
+def signed_query(url: str) -> tuple[str, str]:
+    """Return the expiry and signature of a signed URL."""
+    query = parse_qs(urlsplit(url).query)
+    return query["exp"][0], query["sig"][0]
+
+
+def test_signed_url_is_verified() -> None:
+    """Test a signed URL is valid for its key only."""
+    urls = ImageUrls()
+    source = AsyncMock()
+    with patch("time.time", return_value=NOW):
+        url = urls.url("key", source)
+        expires, signature = signed_query(url)
+
+        assert urlsplit(url).path == "/api/mass_queue/image/key"
+        assert urls.verify("key", expires, signature)
+        assert not urls.verify("other", expires, signature)
+        assert not urls.verify("key", expires, "0" * len(signature))
+        assert not urls.verify("key", str(int(expires) + 1), signature)
+        assert not urls.verify("key", None, signature)
+        assert not urls.verify("key", expires, None)
+        assert not urls.verify("key", "soon", signature)
+    assert urls.source("key") is source
+
+
+def test_signed_url_expires() -> None:
+    """Test a signed URL stays the same for a while and expires after a lifetime."""
+    urls = ImageUrls()
+    with patch("time.time", return_value=NOW):
+        url = urls.url("key", AsyncMock())
+        expires, signature = signed_query(url)
+    assert int(expires) - NOW >= IMAGE_URL_LIFETIME
+
+    with patch("time.time", return_value=NOW + 60):
+        assert urls.url("key", AsyncMock()) == url
+    with patch("time.time", return_value=int(expires) - 1):
+        assert urls.verify("key", expires, signature)
+    with patch("time.time", return_value=int(expires) + 1):
+        assert not urls.verify("key", expires, signature)
+
+
+def test_signatures_differ_per_instance() -> None:
+    """Test URLs signed before a restart are no longer valid."""
+    with patch("time.time", return_value=NOW):
+        expires, signature = signed_query(ImageUrls().url("key", AsyncMock()))
+        assert not ImageUrls().verify("key", expires, signature)
+
+
+def test_registered_sources_are_bounded() -> None:
+    """Test only the most recently registered sources are kept."""
+    urls = ImageUrls()
+    source = AsyncMock()
+    assert urls.register("first", source) == "/api/mass_queue/image/first"
+    for index in range(IMAGE_URL_MAX_SOURCES):
+        urls.register(f"key{index}", source)
+    assert urls.source("first") is None
+    assert urls.source("key0") is not None